@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare JSON serialization backends per output format.
+
+Rows are generated once, then every (backend, format) pair is timed
+serializing them: "rows" feeds rows with date objects through default=str,
+"stringified" converts date columns first, as bulk uploads do.
+
+    python3 benchmarks/bench_serializer.py --rows 50000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lambda_function"))
+
+from generator import serializer
+from generator.faker_generator import compile_fields, generate_block_columns, BLOCK_SIZE
+from generator.formatters import iter_format
+
+FIELDS = [
+    "customer_id[ID,8,int]",
+    "status[active,inactive,pending]",
+    "random_int(min=1,max=1000)",
+    "date_of_birth(minimum_age=18,maximum_age=90)",
+    "date_time_this_year",
+    "pyfloat(left_digits=3,right_digits=2)",
+]
+
+
+def generate_columns(rows):
+    columns = [[] for _ in FIELDS]
+    for index in range(-(-rows // BLOCK_SIZE)):
+        block = generate_block_columns(FIELDS, 1, index, min(BLOCK_SIZE, rows - index * BLOCK_SIZE))
+        for column, values in zip(columns, block):
+            column.extend(values)
+    return columns
+
+
+def timed(function, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    plan = compile_fields(FIELDS)
+    columns = generate_columns(args.rows)
+    value_types = [field.value_type for field in plan.compiled]
+    rows = plan.assemble_rows(columns)
+    stringified = plan.assemble_rows(serializer.stringify_columns(columns, value_types))
+
+    backends = [name for name in serializer.BACKENDS if name == "json" or serializer.HAS_ORJSON]
+    print(f"{args.rows} rows, best of {args.repeat}")
+    print(f"{'format':<14}{'input':<13}" + "".join(f"{name:>12}" for name in backends))
+    cases = [
+        ("json", "rows", rows),
+        ("json", "stringified", stringified),
+        ("compact_json", "rows", rows),
+        ("compact_json", "stringified", stringified),
+    ]
+    for output_format, label, data in cases:
+        timings = []
+        for name in backends:
+            serializer.set_backend(name)
+            timings.append(timed(lambda: sum(map(len, iter_format(data, output_format)[1])), args.repeat))
+        print(f"{output_format:<14}{label:<13}" + "".join(f"{seconds * 1000:>10.1f}ms" for seconds in timings))
+
+    # /data responses: 200 data points at a time
+    sample = rows[:200 // len(FIELDS)]
+    timings = []
+    for name in backends:
+        serializer.set_backend(name)
+        timings.append(timed(lambda: [serializer.dumps(sample) for _ in range(1000)], args.repeat) / 1000)
+    print(f"{'/data body':<27}" + "".join(f"{seconds * 1e6:>10.1f}us" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
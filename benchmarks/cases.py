@@ -0,0 +1,190 @@
+"""
+Benchmark cases. Each case is a setup function taking a row count and
+returning a zero-argument callable; the callable does the measured work and
+returns the number of rows it processed (for cold starts, the number of
+interpreters started). Setup (generating input rows,
+starting the S3 mock) is not timed, but its memory counts towards peak RSS,
+as does moto's in-memory copy of uploaded objects.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lambda_function"))
+
+from generator import serializer, sql_export
+from generator.arrow_formats import COLUMNAR_FORMATS, HAS_PYARROW, iter_columnar_format
+from generator.faker_generator import generate_row, generate_chunk, generate_range, compile_fields
+from generator.formatters import iter_format, iter_format_batches
+from generator.parallel import iter_parallel_batches
+
+FAKER_HEAVY = [
+    "name",
+    "email",
+    "company",
+    "address",
+    "phone_number",
+    "date_of_birth(minimum_age=18,maximum_age=90)",
+]
+
+CUSTOM_HEAVY = [
+    "customer_id[ID,8,int]",
+    "order_id[ORD,10,int]",
+    "sku[SKU,6,mixed]",
+    "status[active,inactive,pending]",
+    "department[sales,marketing,engineering,hr]",
+    "machine_type[sewing,printer,cutting]",
+]
+
+# 50 columns mixing cheap custom fields with a few Faker fields
+WIDE = [
+    f"code_{i}[C,6,int]" if i % 5 else f"choice_{i}[a,b,c,d]"
+    for i in range(45)
+] + ["name", "email", "random_int(min=1,max=1000)", "date_of_birth", "ean13"]
+
+SCHEMAS = {
+    "faker_heavy": FAKER_HEAVY,
+    "custom_heavy": CUSTOM_HEAVY,
+    "wide": WIDE,
+}
+
+FORMATS = ["json", "compact_json", "csv", "sql"]
+
+# Output formats of the /bulk writers, which take RowBatches or columns
+BULK_FORMATS = ["json", "compact_json", "csv", "sql", "copy"] + (list(COLUMNAR_FORMATS) if HAS_PYARROW else [])
+
+BULK_FIELDS = CUSTOM_HEAVY + ["random_int", "date_of_birth"]
+
+# Rows per case in full and --quick runs
+SIZES = {
+    "generate_row": (2000, 200),
+    "generate_chunk": (20000, 1000),
+    "format": (50000, 2000),
+    "bulk_format": (50000, 2000),
+    # Fresh interpreters importing the handler and serving one /data request
+    "cold_start": (10, 3),
+}
+
+# The upload path is measured at several sizes to show per-part overheads
+UPLOAD_SIZES = ((10000, 100000, 500000), (1000, 5000))
+
+
+def _generate_row_case(fields):
+    def setup(size):
+        def run():
+            for _ in range(size):
+                generate_row(fields)
+            return size
+        return run
+    return setup
+
+
+def _generate_chunk_case(fields):
+    def setup(size):
+        def run():
+            return len(generate_chunk(fields, size))
+        return run
+    return setup
+
+
+def _format_case(output_format):
+    def setup(size):
+        rows = generate_range(CUSTOM_HEAVY + ["random_int", "date_of_birth"], 1, 0, size)
+
+        def run():
+            _, chunks = iter_format(rows, output_format)
+            for _ in chunks:
+                pass
+            return size
+        return run
+    return setup
+
+
+def _bulk_format_case(output_format):
+    """The writer /bulk picks for output_format, fed pre-generated batches"""
+    def setup(size):
+        plan = compile_fields(BULK_FIELDS)
+        value_types = [field.value_type for field in plan.compiled]
+        batches = list(iter_parallel_batches(BULK_FIELDS, size, 1, workers=1))
+        if output_format in COLUMNAR_FORMATS:
+            # pyarrow is imported on first use; keep that out of the timing
+            for _ in iter_columnar_format([batches[0].columns], plan, output_format)[1]:
+                pass
+
+        def run():
+            if output_format in COLUMNAR_FORMATS:
+                _, chunks = iter_columnar_format((batch.columns for batch in batches), plan, output_format)
+            elif output_format in sql_export.SQL_FORMATS:
+                _, chunks = sql_export.iter_sql_format((batch.columns for batch in batches), plan, output_format)
+            else:
+                # As in write_dataset, JSON gets its date columns converted first
+                converted = batches
+                if output_format in ("json", "compact_json"):
+                    converted = (batch.with_columns(serializer.stringify_columns(batch.columns, value_types))
+                                 for batch in batches)
+                _, chunks = iter_format_batches(converted, output_format)
+            for _ in chunks:
+                pass
+            return size
+        return run
+    return setup
+
+
+def _upload_case(compression):
+    def setup(size):
+        from moto import mock_aws
+        import boto3
+        from generator.s3_uploader import upload_dataset, reset_s3_client
+
+        os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+        os.environ["BUCKET_NAME"] = "bench-bucket"
+        mock = mock_aws()
+        mock.start()
+        reset_s3_client()
+        boto3.client("s3").create_bucket(
+            Bucket="bench-bucket",
+            CreateBucketConfiguration={"LocationConstraint": os.environ["AWS_DEFAULT_REGION"]},
+        )
+        rows = generate_range(CUSTOM_HEAVY, 1, 0, size)
+
+        def run():
+            _, chunks = iter_format(rows, "compact_json")
+            upload_dataset(chunks, "bench", "json", compression)
+            return size
+        return run
+    return setup
+
+
+def _cold_start_case():
+    def setup(size):
+        command = [sys.executable, "-c", (
+            "import lambda_function; lambda_function.lambda_handler({'httpMethod': 'GET', 'path': '/data', "
+            "'queryStringParameters': {'fields': 'name,email', 'rows': '5'}}, None)"
+        )]
+
+        def run():
+            for _ in range(size):
+                subprocess.run(command, cwd=Path(__file__).parent.parent / "lambda_function", check=True)
+            return size
+        return run
+    return setup
+
+
+def all_cases(quick=False):
+    """{name: (setup, rows)} in run order"""
+    pick = 1 if quick else 0
+    cases = {}
+    for schema, fields in SCHEMAS.items():
+        cases[f"generate_row/{schema}"] = (_generate_row_case(fields), SIZES["generate_row"][pick])
+    for schema, fields in SCHEMAS.items():
+        cases[f"generate_chunk/{schema}"] = (_generate_chunk_case(fields), SIZES["generate_chunk"][pick])
+    for output_format in FORMATS:
+        cases[f"format/{output_format}"] = (_format_case(output_format), SIZES["format"][pick])
+    for output_format in BULK_FORMATS:
+        cases[f"bulk_format/{output_format}"] = (_bulk_format_case(output_format), SIZES["bulk_format"][pick])
+    cases["cold_start/import"] = (_cold_start_case(), SIZES["cold_start"][pick])
+    for compression in (None, "gzip"):
+        for size in UPLOAD_SIZES[pick]:
+            cases[f"upload/{compression or 'plain'}/{size}"] = (_upload_case(compression), size)
+    return cases
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Profile the cold start of the handler module with python -X importtime.
+
+Imports lambda_function in a fresh interpreter and summarises the import
+time per top-level package, plus the wall time of the
+import (which includes the warm-up of WARM_FIELDS) and of a first /data
+request, and whether boto3 and pyarrow were loaded.
+
+    python3 benchmarks/importtime.py --top 15 --output benchmarks/importtime.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+LAMBDA_DIR = Path(__file__).parent.parent / "lambda_function"
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import lambda_function
+imported = time.perf_counter()
+lambda_function.lambda_handler({'httpMethod': 'GET', 'path': '/data',
+    'queryStringParameters': {'fields': 'name,email,status[a,b]', 'rows': '5'}}, None)
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': round((imported - started) * 1000, 1),
+    'first_data_ms': round((finished - imported) * 1000, 1),
+    'boto3_loaded': 'boto3' in sys.modules,
+    'pyarrow_loaded': 'pyarrow' in sys.modules,
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Microseconds of import time per top-level package, summing the self time of its modules"""
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        top = name.strip().split(".")[0]
+        packages[top] = packages.get(top, 0) + int(own)
+    return packages
+
+
+def profile():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=LAMBDA_DIR, check=True, capture_output=True, text=True
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["packages_ms"] = {
+        name: round(us / 1000, 1)
+        for name, us in sorted(parse_importtime(result.stderr).items(), key=lambda item: -item[1])
+    }
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--top", type=int, default=10, help="packages to print")
+    parser.add_argument("--output", help="write the profile as JSON here")
+    args = parser.parse_args()
+
+    timings = profile()
+    print(f"import lambda_function: {timings['import_ms']} ms (first /data request {timings['first_data_ms']} ms)")
+    print(f"boto3 loaded: {timings['boto3_loaded']}, pyarrow loaded: {timings['pyarrow_loaded']}")
+    for name, ms in list(timings["packages_ms"].items())[:args.top]:
+        print(f"  {name:<24}{ms:>8.1f} ms")
+    if args.output:
+        Path(args.output).write_text(json.dumps(timings, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark suite and write results as JSON.
+
+Every case runs in its own process so its peak RSS is not inflated by the
+cases before it. Results record rows/sec and peak RSS per case; with
+--baseline, cases slower or larger than the baseline by more than
+--threshold are reported as regressions and the exit status is 1. Unless
+--filter is given, the cold-start import profile of importtime.py (best of
+--repeat) is recorded too and its import and first-request times are
+compared the same way.
+
+    python3 benchmarks/run.py --output benchmarks/results.json
+    python3 benchmarks/run.py --quick --filter format/
+    python3 benchmarks/run.py --baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cases import all_cases
+from importtime import profile
+
+# Figures of the import profile compared against the baseline
+IMPORT_METRICS = ("import_ms", "first_data_ms")
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name, quick=False, repeat=1):
+    """Run one case in this process, best of repeat runs, and return its measurements"""
+    setup, size = all_cases(quick)[name]
+    run = setup(size)
+    seconds = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = run()
+        elapsed = time.perf_counter() - started
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / seconds, 1) if seconds else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_isolated(name, quick, repeat):
+    command = [sys.executable, __file__, "--case", name, "--repeat", str(repeat)]
+    output = subprocess.run(
+        command + (["--quick"] if quick else []),
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def profile_imports(repeat):
+    """Fastest import and first /data request over repeat fresh interpreters"""
+    runs = [profile() for _ in range(repeat)]
+    return {metric: min(run[metric] for run in runs) for metric in IMPORT_METRICS}
+
+
+def compare_imports(current, previous, threshold):
+    """compare() for the import profile"""
+    return [
+        ("importtime", metric, previous[metric], current[metric])
+        for metric in IMPORT_METRICS
+        if previous.get(metric) and current[metric] > previous[metric] * (1 + threshold)
+    ]
+
+
+def compare(results, baseline, threshold):
+    """Return (name, metric, baseline, current) for every regression beyond threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if previous["rows_per_sec"] and current["rows_per_sec"] < previous["rows_per_sec"] * (1 - threshold):
+            regressions.append((name, "rows_per_sec", previous["rows_per_sec"], current["rows_per_sec"]))
+        if current["peak_rss_mb"] > previous["peak_rss_mb"] * (1 + threshold):
+            regressions.append((name, "peak_rss_mb", previous["peak_rss_mb"], current["peak_rss_mb"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="tolerated relative slowdown (default 0.2)")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="small sizes, for smoke runs")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is kept (default 3)")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: run a single case and print its result
+        print(json.dumps(run_case(args.case, args.quick, args.repeat)))
+        return 0
+
+    results = {}
+    for name in all_cases(args.quick):
+        if args.filter not in name:
+            continue
+        results[name] = run_isolated(name, args.quick, args.repeat)
+        result = results[name]
+        print(f"{name:<28}{result['rows']:>9} rows {result['rows_per_sec']:>12,.0f} rows/s {result['peak_rss_mb']:>8.1f} MB")
+
+    importtime = None
+    if not args.filter:
+        importtime = profile_imports(args.repeat)
+        print(f"{'importtime':<28}{importtime['import_ms']:>9.1f} ms import {importtime['first_data_ms']:>9.1f} ms first /data")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if importtime:
+        report["importtime"] = importtime
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline["results"], args.threshold)
+        if importtime and baseline.get("importtime"):
+            regressions += compare_imports(importtime, baseline["importtime"], args.threshold)
+        for name, metric, previous, current in regressions:
+            print(f"REGRESSION {name}: {metric} {previous} -> {current}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
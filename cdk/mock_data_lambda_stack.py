@@ -6,6 +6,7 @@ from aws_cdk import (
     Duration,
     CfnOutput,
     RemovalPolicy,
+    ArnFormat,
 )
 from aws_cdk.aws_lambda import Runtime
 from aws_cdk.aws_lambda_python_alpha import PythonFunction
@@ -38,23 +39,33 @@ class MockDataLambdaStack(Stack):
             }
         )
 
-        # Grant Lambda write permissions to the S3 bucket
-        data_bucket.grant_write(mock_data_lambda)
-        
-        # Grant Lambda permissions to create S3 buckets
+        # Grant Lambda read/write permissions to the S3 bucket; datasets are written
+        # under <dataset_id>/<date>/ and job manifests under jobs/, so no buckets
+        # are created at request time
+        data_bucket.grant_read_write(mock_data_lambda)
+
+        # Asynchronous bulk jobs invoke the function itself. The ARN is built by
+        # name pattern because referencing the function here would be circular
         mock_data_lambda.add_to_role_policy(
             iam.PolicyStatement(
                 effect=iam.Effect.ALLOW,
-                actions=["s3:CreateBucket", "s3:PutObject", "s3:PutBucketPolicy", "s3:PutBucketPublicAccessBlock"],
-                resources=["arn:aws:s3:::mock-data-*", "arn:aws:s3:::mock-data-*/*"]
+                actions=["lambda:InvokeFunction"],
+                resources=[self.format_arn(
+                    service="lambda",
+                    resource="function",
+                    resource_name=f"{self.stack_name}-MockDataLambda*",
+                    arn_format=ArnFormat.COLON_RESOURCE_NAME
+                )]
             )
         )
 
         # API Gateway
+        # Binary media types let the Lambda return gzip/zstd bodies as base64
         api = apigw.LambdaRestApi(
             self, "MockDataApi",
             handler=mock_data_lambda,
-            proxy=False
+            proxy=False,
+            binary_media_types=["*/*"]
         )
 
         # /single endpoint
@@ -66,6 +77,15 @@ class MockDataLambdaStack(Stack):
         bulk.add_method("GET")
         bulk.add_method("POST")
 
+        # /page endpoint for paging through a seeded virtual dataset
+        page = api.root.add_resource("page")
+        page.add_method("GET")
+
+        # /jobs/{id} endpoint for asynchronous bulk jobs
+        jobs = api.root.add_resource("jobs")
+        job = jobs.add_resource("{id}")
+        job.add_method("GET")
+
         # Output the API URL
         CfnOutput(
             self, "ApiUrl",
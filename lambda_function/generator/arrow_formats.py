@@ -0,0 +1,130 @@
+"""Parquet and Arrow IPC output, written in row-group batches.
+
+pyarrow is optional: HAS_PYARROW is False when it is not installed and
+the columnar formats are unavailable. It is imported on first use, so
+cold starts that never write Parquet or Arrow do not load it.
+"""
+import importlib.util
+
+pa = None
+pq = None
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _load_pyarrow():
+    global pa, pq
+    if pa is None:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+        pa, pq = pyarrow, pyarrow.parquet
+    return pa
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def arrow_type(value_type):
+    """Arrow type for a CompiledField.value_type"""
+    _load_pyarrow()
+    return {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "date": pa.date32(),
+        "datetime": pa.timestamp("us"),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+    }.get(value_type, pa.string())
+
+
+def arrow_schema(plan):
+    _load_pyarrow()
+    return pa.schema([(field.name, arrow_type(field.value_type)) for field in plan.compiled])
+
+
+def _to_array(values, field_type):
+    if pa.types.is_dictionary(field_type):
+        return pa.array(values, pa.string()).dictionary_encode()
+    if pa.types.is_string(field_type):
+        return pa.array([value if value is None or isinstance(value, str) else str(value) for value in values], pa.string())
+    try:
+        return pa.array(values, field_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Provider returned something other than its declared type
+        raise ValueError(f"Column of type {field_type} received incompatible values: {str(e)}")
+
+
+def record_batch(columns, schema):
+    _load_pyarrow()
+    arrays = [_to_array(values, field.type) for values, field in zip(columns, schema)]
+    return pa.record_batch(arrays, schema=schema)
+
+
+class _ChunkSink:
+    """Minimal writable file that collects what pyarrow writes so it can be streamed out"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_arrow(column_chunks, plan, output_format="parquet"):
+    """
+    Write chunks of columns (one list per field, in plan order) as a Parquet
+    file or Arrow IPC file, yielding bytes as each row group is written.
+    """
+    if not HAS_PYARROW:
+        raise ValueError(f"Output format '{output_format}' requires pyarrow")
+
+    schema = arrow_schema(plan)
+    sink = _ChunkSink()
+    if output_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_file(sink, schema)
+
+    for columns in column_chunks:
+        writer.write_batch(record_batch(columns, schema))
+        data = sink.drain()
+        if data:
+            yield data
+    writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def iter_columnar_format(column_chunks, plan, output_format="parquet"):
+    """Returns (extension, chunks) like formatters.iter_format"""
+    output_format = output_format.lower()
+    return output_format, iter_arrow(column_chunks, plan, output_format)
+
+
+def format_as_parquet(columns, plan):
+    """Format one set of columns as a Parquet file"""
+    return b"".join(iter_arrow([columns], plan, "parquet"))
+
+
+def format_as_arrow(columns, plan):
+    """Format one set of columns as an Arrow IPC file"""
+    return b"".join(iter_arrow([columns], plan, "arrow"))
@@ -0,0 +1,47 @@
+"""Vectorized column builders for custom choice and prefix fields.
+
+NumPy is optional: when it is not installed HAS_NUMPY is False and callers
+fall back to generating columns one value at a time.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def default_rng(seed=None):
+    """Return a NumPy Generator, or None when NumPy is unavailable"""
+    if not HAS_NUMPY:
+        return None
+    return np.random.default_rng(seed)
+
+
+def choice_column(options, size, rng):
+    """Draw size values from options with one batch of option indices"""
+    indices = rng.integers(0, len(options), size)
+    return np.asarray(options, dtype=object)[indices].tolist()
+
+
+def random_string_column(alphabet, length, size, rng, prefix=""):
+    """
+    Build size strings of prefix + length characters from alphabet.
+
+    Characters are drawn as a (size, length) byte matrix and every row is
+    decoded in one pass, instead of one random call per character.
+    """
+    table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+    if not prefix.isascii():
+        suffixes = random_string_column(alphabet, length, size, rng)
+        return [prefix + suffix for suffix in suffixes]
+
+    width = len(prefix) + length
+    if width == 0:
+        return [""] * size
+
+    matrix = np.empty((size, width), dtype=np.uint8)
+    if prefix:
+        matrix[:, :len(prefix)] = np.frombuffer(prefix.encode("ascii"), dtype=np.uint8)
+    matrix[:, len(prefix):] = table[rng.integers(0, len(table), (size, length))]
+    return matrix.view(f"S{width}").ravel().astype(f"U{width}").tolist()
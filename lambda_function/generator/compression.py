@@ -0,0 +1,85 @@
+"""Streaming gzip/zstd compression for uploads and API responses.
+
+zstandard is optional: zstd is only offered when it is installed.
+"""
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+# Levels tuned for throughput rather than ratio; mock data still
+# compresses several times over at these settings
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+# codec -> (file extension, Content-Encoding)
+CODECS = {
+    "gzip": ("gz", "gzip"),
+    "zstd": ("zst", "zstd"),
+}
+
+
+def available_codecs():
+    return [codec for codec in CODECS if codec != "zstd" or zstandard is not None]
+
+
+def validate_codec(codec):
+    """Return the normalised codec name, None for no compression, or raise ValueError"""
+    if codec is None or codec == "":
+        return None
+    codec = codec.lower() if isinstance(codec, str) else codec
+    if codec in ("none", "identity"):
+        return None
+    if codec not in available_codecs():
+        raise ValueError(f"Unsupported compression '{codec}'. Use one of: {', '.join(available_codecs())}")
+    return codec
+
+
+def _compressor(codec, level):
+    if codec == "gzip":
+        # wbits=31 writes a gzip header and trailer
+        compressor = zlib.compressobj(GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31)
+        return compressor.compress, compressor.flush
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL if level is None else level).compressobj()
+    return compressor.compress, compressor.flush
+
+
+def compress_chunks(chunks, codec, level=None):
+    """Compress an iterable of bytes chunks, yielding compressed chunks as they fill"""
+    compress, flush = _compressor(codec, level)
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    data = flush()
+    if data:
+        yield data
+
+
+def compress_bytes(data, codec, level=None):
+    return b"".join(compress_chunks([data], codec, level))
+
+
+def negotiate(accept_encoding):
+    """Pick the codec to use for an Accept-Encoding header, or None"""
+    accepted = set()
+    for token in (accept_encoding or "").split(","):
+        parts = token.strip().split(";")
+        coding = parts[0].strip().lower()
+        quality = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding)
+
+    for codec in ("zstd", "gzip"):
+        if codec in available_codecs() and (codec in accepted or "*" in accepted):
+            return codec
+    return None
@@ -1,9 +1,86 @@
+import hashlib
 import random
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from faker import Faker
+from faker.providers import BaseProvider
 import string
+from . import columnar, native, unique
+from .rows import RowBatch
 
-fake = Faker()
+_fake = None
+_numpy_rng = columnar.default_rng()
+
+# Number of compiled field lists kept per container
+PLAN_CACHE_SIZE = 32
+
+# Rows per deterministic block; block N is always generated from the same
+# derived seed, so sharded output does not depend on how blocks are grouped
+BLOCK_SIZE = 1024
+
+# Rows per Faker reseed within a block, so a page in the middle of a block
+# only calls Faker for the sub-blocks it overlaps
+FAKER_SUB_BLOCK = 32
+
+# Value types of Faker providers whose return type matters to typed
+# (columnar) outputs; every other provider is treated as "str"
+FAKER_VALUE_TYPES = {
+    "random_int": "int",
+    "pyint": "int",
+    "random_digit": "int",
+    "random_digit_not_null": "int",
+    "random_number": "int",
+    "pyfloat": "float",
+    "boolean": "bool",
+    "pybool": "bool",
+    "date_of_birth": "date",
+    "date_object": "date",
+    "date_between": "date",
+    "date_between_dates": "date",
+    "future_date": "date",
+    "past_date": "date",
+    "date_this_century": "date",
+    "date_this_decade": "date",
+    "date_this_year": "date",
+    "date_this_month": "date",
+    "date_time": "datetime",
+    "date_time_between": "datetime",
+    "date_time_between_dates": "datetime",
+    "future_datetime": "datetime",
+    "past_datetime": "datetime",
+    "date_time_this_century": "datetime",
+    "date_time_this_decade": "datetime",
+    "date_time_this_year": "datetime",
+    "date_time_this_month": "datetime",
+}
+
+PREFIX_ALPHABETS = {
+    "int": string.digits,
+    "str": string.ascii_uppercase,
+    "mixed": string.ascii_letters + string.digits,
+}
+
+def get_fake():
+    """The shared Faker instance, created on first use (or by warmup during init)"""
+    global _fake
+    if _fake is None:
+        _fake = Faker()
+    return _fake
+
+def __getattr__(name):
+    # Keeps faker_generator.fake working now that the instance is lazy
+    if name == "fake":
+        return get_fake()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def reseed():
+    """Replace the shared random state with fresh entropy, e.g. after a snapshot restore"""
+    global _numpy_rng
+    random.seed()
+    Faker.seed()
+    _numpy_rng = columnar.default_rng()
 
 def parse_field(field_str):
     """
@@ -29,68 +106,360 @@ def parse_field(field_str):
     # Otherwise just a normal field
     return field_str, None, None
 
-def generate_row(fields):
-    row = {}
-    for field_str in fields:
-        name, options, args = parse_field(field_str)
-        
-        if options:
-            # If options look like [prefix, length] or [prefix, length, type]
-            if len(options) >= 2 and options[1].isdigit():
-                prefix = options[0]
-                length = int(options[1])
-                kind = options[2].lower() if len(options) > 2 else "int"
-
-                if kind == "int":
-                    random_part = "".join(str(random.randint(0, 9)) for _ in range(length))
-                elif kind == "str":
-                    random_part = "".join(random.choice(string.ascii_uppercase) for _ in range(length))
-                elif kind == "mixed":
-                    random_part = "".join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
-                else:
-                    random_part = "".join(str(random.randint(0, 9)) for _ in range(length))  # fallback to digits
-
-                row[name] = prefix + random_part
-            else:
-                # regular random choice from list
-                row[name] = random.choice(options)
+def _convert_arg(value):
+    """Convert a descriptor argument to int when possible"""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def parse_args(args):
+    """Split descriptor args into positional args and keyword args"""
+    positional = []
+    kwargs = {}
+    for arg in args:
+        if '=' in arg:
+            key, value = arg.split('=', 1)
+            kwargs[key] = _convert_arg(value)
         else:
-            try:
-                faker_method = getattr(fake, name)
-                if args:
-                    # Convert string args to kwargs if they contain '='
-                    kwargs = {}
-                    for arg in args:
-                        if '=' in arg:
-                            key, value = arg.split('=', 1)
-                            # Try to convert to int if possible
-                            try:
-                                kwargs[key] = int(value)
-                            except ValueError:
-                                kwargs[key] = value
-                        else:
-                            # Positional arg, try to convert to int
-                            try:
-                                kwargs.setdefault('args', []).append(int(arg))
-                            except ValueError:
-                                kwargs.setdefault('args', []).append(arg)
-                    
-                    if 'args' in kwargs:
-                        row[name] = faker_method(*kwargs.pop('args'), **kwargs)
-                    else:
-                        row[name] = faker_method(**kwargs)
-                else:
-                    row[name] = faker_method()
-            except AttributeError:
-                row[name] = fake.word()
-    return row
+            positional.append(_convert_arg(arg))
+    return positional, kwargs
+
+class CompiledField:
+    """
+    A parsed field descriptor.
+
+    generate(rnd) returns one value; build_column(size, rng), when set,
+    returns a whole column using a NumPy Generator. value_type is one of
+    "str", "category", "int", "float", "bool", "date" or "datetime".
+    id_space, set on unique fields, is the unique.IdSpace rows draw from.
+    row_builder(seed, position, first_row), set on fields whose values
+    depend on the row number, returns the build(size, rnd, rng) of the
+    rows of a seeded dataset from first_row on.
+    """
+    __slots__ = ("name", "kind", "value_type", "options", "args", "generate", "build_column", "id_space", "row_builder")
+
+    def __init__(self, name, kind, generate, build_column=None, options=None, args=None, value_type="str"):
+        self.id_space = None
+        self.row_builder = None
+        self.name = name
+        self.kind = kind
+        self.value_type = value_type
+        self.options = options
+        self.args = args
+        self.generate = generate
+        self.build_column = build_column
+
+    def column(self, size, rnd=random, rng=None):
+        if rng is not None and self.build_column is not None:
+            return self.build_column(size, rng)
+        if self.id_space is not None:
+            # Without NumPy a unique column is still one permutation with a random key
+            unique.validate_size(self.id_space, self.name, size)
+            return unique.column_builder(self.id_space, rnd.randrange(unique.MAX_ID_SPACE))(size)
+        generate = self.generate
+        return [generate(rnd) for _ in range(size)]
+
+def _is_true(value):
+    return str(value).lower() in ("true", "1", "yes")
+
+def with_unique(field, id_space):
+    """
+    Make field draw distinct values from id_space. Seeded datasets number
+    rows globally (see generate_block_columns); an unseeded column is one
+    permutation with a random key, so its values are distinct within it,
+    with or without NumPy (see CompiledField.column).
+    """
+    def generate(rnd):
+        return id_space.values([rnd.randrange(id_space.size)])[0]
+
+    def build_column(size, rng):
+        unique.validate_size(id_space, field.name, size)
+        return unique.column_builder(id_space, int(rng.integers(0, unique.MAX_ID_SPACE)))(size)
+
+    def row_builder(seed, position, first_row):
+        return unique.column_builder(id_space, derive_seed(seed, "unique", position), first_row)
+
+    field.generate = generate
+    field.build_column = build_column
+    field.id_space = id_space
+    field.row_builder = row_builder
+    return field
+
+def _prefix_field(name, options):
+    prefix = options[0]
+    length = int(options[1])
+    kind = options[2].lower() if len(options) > 2 else "int"
+    alphabet = PREFIX_ALPHABETS.get(kind, string.digits)  # fallback to digits
+
+    def generate(rnd):
+        return prefix + "".join(rnd.choices(alphabet, k=length))
+
+    def build_column(size, rng):
+        return columnar.random_string_column(alphabet, length, size, rng, prefix)
+
+    field = CompiledField(name, "prefix", generate, build_column, options=options)
+    if len(options) > 3 and options[3].lower() == "unique":
+        return with_unique(field, unique.string_space(prefix, alphabet, length))
+    return field
+
+def _choice_field(name, options):
+    def generate(rnd):
+        return rnd.choice(options)
+
+    def build_column(size, rng):
+        return columnar.choice_column(options, size, rng)
+
+    return CompiledField(name, "choice", generate, build_column, options=options, value_type="category")
+
+def native_field(name, provider, generate, build_column, args=None, value_type="str"):
+    """
+    CompiledField of the native.py builder of provider. Columns come from
+    the builder. Single values keep the Faker call generate unless the
+    builder is faster even for one row; then they are one-row columns
+    drawn from the shared Generator rather than a new one per value.
+    """
+    if native.builds_scalars(provider):
+        generate = lambda rnd: build_column(1, _numpy_rng)[0]
+    return CompiledField(name, "native", generate, build_column, args=args, value_type=value_type)
+
+def provider_method(faker, name):
+    """
+    The bound Faker formatter called name, or None when there is none.
+    Only methods of providers count: Generator and Faker proxy methods such
+    as set_formatter or seed_instance would change the shared instance.
+    """
+    if not isinstance(name, str) or name.startswith("_"):
+        return None
+    try:
+        method = getattr(faker, name)
+    except (AttributeError, TypeError):
+        return None
+    if not callable(method) or not isinstance(getattr(method, "__self__", None), BaseProvider):
+        return None
+    return method
+
+def _unique_faker_field(faker, name, positional, kwargs, args):
+    # Only random_int has an id space: min, min + step, ... max
+    if name != "random_int":
+        raise ValueError(f"unique is not supported for field '{name}'")
+    bounds = {"min": 0, "max": 9999, "step": 1, **dict(zip(("min", "max", "step"), positional)), **kwargs}
+    low, high, step = (bounds[key] for key in ("min", "max", "step"))
+    if not all(isinstance(value, int) for value in (low, high, step)) or step < 1 or high < low:
+        raise ValueError(f"Invalid bounds for unique field '{name}'")
+    field = _faker_field(faker, name, [f"{key}={value}" for key, value in bounds.items()])
+    field.args = args
+    return with_unique(field, unique.integer_space(low, high, step))
+
+def _faker_field(faker, name, args):
+    positional, kwargs = parse_args(args or [])
+    if "unique" in kwargs:
+        if _is_true(kwargs.pop("unique")):
+            return _unique_faker_field(faker, name, positional, kwargs, args)
+        args = [arg for arg in args if not arg.startswith("unique=")]
+    method = provider_method(faker, name)
+    if method is None:
+        word = faker.word
+        return CompiledField(name, "fallback", lambda rnd: word(), args=args)
+
+    if positional:
+        generate = lambda rnd: method(*positional, **kwargs)
+    elif kwargs:
+        generate = lambda rnd: method(**kwargs)
+    else:
+        generate = lambda rnd: method()
+    build_column = native.native_builder(faker, name, positional, kwargs)
+    if build_column is not None:
+        return native_field(name, name, generate, build_column, args, FAKER_VALUE_TYPES.get(name, "str"))
+    return CompiledField(name, "faker", generate, args=args, value_type=FAKER_VALUE_TYPES.get(name, "str"))
+
+def compile_field(field_str, faker=None):
+    """
+    Compile a field string into a CompiledField. Custom fields draw from the
+    rnd/rng they are given, Faker fields are bound to the given Faker instance.
+    """
+    faker = faker or get_fake()
+    if field_str.startswith("{"):
+        # A column of a typed schema, already validated by schema.validate_schema
+        from .schema import compile_column
+        return compile_column(field_str, faker)
+    name, options, args = parse_field(field_str)
+
+    if options:
+        # If options look like [prefix, length] or [prefix, length, type]
+        if len(options) >= 2 and options[1].isdigit():
+            return _prefix_field(name, options)
+        # regular random choice from list
+        return _choice_field(name, options)
+
+    return _faker_field(faker, name, args)
+
+class SchemaPlan:
+    """A field list parsed once into compiled fields, reusable for any number of rows"""
+
+    def __init__(self, fields, faker=None):
+        self.fields = tuple(fields)
+        self.faker = faker or get_fake()
+        self.compiled = [compile_field(field_str, self.faker) for field_str in self.fields]
+        self.names = [field.name for field in self.compiled]
+
+    def generate_row(self, rnd=random):
+        return {field.name: field.generate(rnd) for field in self.compiled}
+
+    def generate_column_list(self, size, rnd=random, rng=None):
+        """Generate one list per compiled field, in field order"""
+        if rng is None:
+            rng = _numpy_rng
+        return [field.column(size, rnd, rng) for field in self.compiled]
+
+    def generate_columns(self, size, rnd=random, rng=None):
+        return dict(zip(self.names, self.generate_column_list(size, rnd, rng)))
+
+    def generate_batch(self, size, rnd=random, rng=None):
+        return RowBatch(self.names, self.generate_column_list(size, rnd, rng))
+
+    def generate_rows(self, size, rnd=random, rng=None):
+        if rng is None and not columnar.HAS_NUMPY and all(field.id_space is None for field in self.compiled):
+            compiled = self.compiled
+            return [{field.name: field.generate(rnd) for field in compiled} for _ in range(size)]
+        # Columnar generation, rows assembled only at the end
+        return self.assemble_rows(self.generate_column_list(size, rnd, rng))
+
+    def generate_seeded_columns(self, size, seed, builders=None, first=0):
+        """
+        Generate rows first..size of one list per field, each from its own
+        stream derived from seed. Streams are independent, so the first k
+        values of a column do not depend on size. Faker fields are reseeded
+        every FAKER_SUB_BLOCK rows, and only the sub-blocks from first on
+        are generated; other fields are cheap and build from row 0. builders
+        may replace the column builder of some field positions with
+        build(size, rnd, rng). Reseeds self.faker, so only use on plans that
+        own their Faker instance.
+        """
+        columns = []
+        for position, field in enumerate(self.compiled):
+            field_seed = derive_seed(seed, position)
+            build = builders.get(position) if builders else None
+            if build is not None:
+                columns.append(build(size, random.Random(field_seed), columnar.default_rng(field_seed))[first:])
+            elif field.kind in ("faker", "fallback"):
+                columns.append(self._faker_column(field, size, field_seed, first))
+            else:
+                columns.append(field.column(size, random.Random(field_seed), columnar.default_rng(field_seed))[first:])
+        return columns
+
+    def _faker_column(self, field, size, field_seed, first):
+        values = []
+        first_sub_block = first // FAKER_SUB_BLOCK
+        for sub_block in range(first_sub_block, -(-size // FAKER_SUB_BLOCK)):
+            sub_seed = derive_seed(field_seed, sub_block)
+            self.faker.seed_instance(sub_seed)
+            rows = min(FAKER_SUB_BLOCK, size - sub_block * FAKER_SUB_BLOCK)
+            values.extend(field.column(rows, random.Random(sub_seed)))
+        return values[first - first_sub_block * FAKER_SUB_BLOCK:]
+
+    def assemble_rows(self, columns):
+        names = self.names
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_plan(fields):
+    return SchemaPlan(fields)
+
+def compile_fields(fields):
+    """Return the compiled plan for a field list, cached across calls with the same fields"""
+    return _cached_plan(tuple(fields))
+
+_thread_local = threading.local()
+
+def _seeded_plan(fields):
+    # Seeded plans get their own Faker so reseeding never touches the shared
+    # instance, and one per thread because reseeding a Faker is not thread-safe
+    plans = getattr(_thread_local, "plans", None)
+    if plans is None:
+        plans = _thread_local.plans = OrderedDict()
+    plan = plans.get(fields)
+    if plan is None:
+        plan = plans[fields] = SchemaPlan(fields, faker=Faker())
+        if len(plans) > PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+    else:
+        plans.move_to_end(fields)
+    return plan
+
+def new_seed():
+    """Pick a random seed for requests that did not specify one"""
+    return random.getrandbits(63)
+
+def derive_seed(seed, *keys):
+    """Derive a stable 63-bit seed from a base seed and any number of keys"""
+    material = ":".join(str(part) for part in (seed, *keys)).encode()
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "big") >> 1
+
+def generate_block_columns(fields, seed, index, size=BLOCK_SIZE, pools=None, first=0):
+    """
+    Generate block number index of the dataset identified by (fields, seed)
+    as one list per field. A short block holds the first size rows of the
+    full block, so rows never depend on where a dataset ends; first skips
+    the rows before it. pools, a pools.PoolConfig, samples Faker fields
+    from precomputed value pools.
+    """
+    plan = _seeded_plan(tuple(fields))
+    builders = {}
+    if pools:
+        from .pools import block_builders
+        builders = block_builders(plan, pools, seed, index)
+    for position, field in enumerate(plan.compiled):
+        if field.row_builder is not None:
+            # Unique and reference fields map the global row number, so
+            # values stay consistent across blocks, shards and pages
+            builders[position] = field.row_builder(seed, position, index * BLOCK_SIZE)
+    return plan.generate_seeded_columns(size, derive_seed(seed, index), builders, first)
+
+def generate_block_batch(fields, seed, index, size=BLOCK_SIZE, pools=None):
+    """generate_block_columns as a RowBatch"""
+    return RowBatch(_seeded_plan(tuple(fields)).names, generate_block_columns(fields, seed, index, size, pools))
+
+def generate_block(fields, seed, index, size=BLOCK_SIZE, pools=None, first=0):
+    """Row-wise counterpart of generate_block_columns"""
+    return _seeded_plan(tuple(fields)).assemble_rows(generate_block_columns(fields, seed, index, size, pools, first))
+
+def generate_range(fields, seed, start, stop):
+    """
+    Rows start..stop of the virtual dataset identified by (fields, seed).
+    Faker fields are only generated for the sub-blocks overlapping the
+    range, so the cost does not depend on start.
+    """
+    if start < 0 or stop < start:
+        raise ValueError("Invalid row range")
+    rows = []
+    for index in range(start // BLOCK_SIZE, -(-stop // BLOCK_SIZE)):
+        block_start = index * BLOCK_SIZE
+        rows.extend(generate_block(fields, seed, index, min(BLOCK_SIZE, stop - block_start), first=max(start - block_start, 0)))
+    return rows
+
+def generate_row(fields):
+    return compile_fields(fields).generate_row()
 
 def generate_chunk(fields, size):
-    return [generate_row(fields) for _ in range(size)]
+    return compile_fields(fields).generate_rows(size)
+
+def generate_columns(fields, size):
+    """Generate data column by column, as {name: [values]}"""
+    return compile_fields(fields).generate_columns(size)
 
 def generate_data(fields, size, output_format="compact_json", table_name="mock_data"):
     """Generate data in specified format"""
     from .formatters import format_as_json, format_as_compact_json, format_as_csv, format_as_sql
+    from .arrow_formats import format_as_parquet, format_as_arrow
+    
+    if output_format.lower() in ("parquet", "arrow"):
+        # Columnar formats never assemble rows; they return bytes
+        plan = compile_fields(fields)
+        columns = plan.generate_column_list(size)
+        if output_format.lower() == "parquet":
+            return format_as_parquet(columns, plan)
+        return format_as_arrow(columns, plan)
     
     data = generate_chunk(fields, size)
     
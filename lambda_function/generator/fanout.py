@@ -0,0 +1,136 @@
+"""Fan-out bulk generation across several worker invocations.
+
+The coordinator splits a dataset into shards aligned to BLOCK_SIZE, so every
+shard contains exactly the rows a single run with the same seed would have
+produced at those positions. Each shard is dispatched as a worker payload
+that writes its own part file; the coordinator then publishes a manifest
+listing the parts in order.
+
+Dispatch is pluggable: LambdaDispatcher invokes a Lambda function per shard,
+LocalDispatcher runs a handler on a thread pool (for tests and local runs).
+"""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .faker_generator import BLOCK_SIZE
+
+logger = logging.getLogger()
+
+# Upper bounds on shards per dataset and on shards running at once
+MAX_SHARDS = 1000
+MAX_CONCURRENT_SHARDS = int(os.environ.get("MAX_CONCURRENT_SHARDS", 100))
+
+_dispatcher = None
+
+
+def shard_ranges(size, shards):
+    """Split rows 0..size into at most shards (start, stop) ranges aligned to BLOCK_SIZE"""
+    if shards < 1 or shards > MAX_SHARDS:
+        raise ValueError(f"shards must be between 1 and {MAX_SHARDS}")
+    total_blocks = -(-size // BLOCK_SIZE)
+    blocks_per_shard = max(1, -(-total_blocks // shards))
+    shard_rows = blocks_per_shard * BLOCK_SIZE
+    return [(start, min(start + shard_rows, size)) for start in range(0, size, shard_rows)]
+
+
+def part_key(prefix, index):
+    return f"{prefix}/part-{index:05d}"
+
+
+def manifest_key(prefix):
+    return f"{prefix}/manifest.json"
+
+
+class LocalDispatcher:
+    """Runs shard payloads through handler on a thread pool"""
+
+    def __init__(self, handler, max_workers=None):
+        self.handler = handler
+        self.max_workers = max_workers
+
+    def __call__(self, payloads):
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(payloads) or 1) as executor:
+            return list(executor.map(self.handler, payloads))
+
+
+class LambdaDispatcher:
+    """Invokes a Lambda function synchronously for every shard, up to max_concurrency at a time"""
+
+    def __init__(self, function_name=None, max_concurrency=MAX_CONCURRENT_SHARDS):
+        self.function_name = function_name or os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+        self.max_concurrency = max_concurrency
+        self._client = None
+
+    def _invoke(self, payload):
+        response = self._client.invoke(
+            FunctionName=self.function_name,
+            InvocationType='RequestResponse',
+            Payload=json.dumps(payload).encode('utf-8')
+        )
+        result = json.loads(response['Payload'].read())
+        if response.get('FunctionError'):
+            raise RuntimeError(f"Shard {payload['shard']['index']} failed: {result.get('errorMessage', result)}")
+        return result
+
+    def __call__(self, payloads):
+        if not self.function_name:
+            raise RuntimeError("No function to invoke: AWS_LAMBDA_FUNCTION_NAME is not set")
+        concurrency = min(self.max_concurrency, len(payloads)) or 1
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+            # Workers may run for the full 15 minutes; never retry a shard implicitly
+            self._client = boto3.client('lambda', config=Config(
+                max_pool_connections=concurrency,
+                read_timeout=960,
+                retries={'max_attempts': 0}
+            ))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self._invoke, payloads))
+
+
+def get_dispatcher():
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = LambdaDispatcher()
+    return _dispatcher
+
+
+def set_dispatcher(dispatcher):
+    """Replace the shard dispatcher; any callable mapping a list of payloads to results works. None restores the default"""
+    global _dispatcher
+    _dispatcher = dispatcher
+
+
+def shard_payloads(fields, params, prefix, shards):
+    """Worker payloads for every shard of a dataset"""
+    return [
+        {'shard': {
+            'index': index,
+            'start': start,
+            'stop': stop,
+            'key': part_key(prefix, index),
+            'fields': list(fields),
+            'params': params,
+        }}
+        for index, (start, stop) in enumerate(shard_ranges(params['size'], shards))
+    ]
+
+
+def build_manifest(params, prefix, results):
+    """Manifest of a fanned-out dataset from the ordered shard results"""
+    return {
+        'dataset_id': params['dataset_id'],
+        'prefix': prefix,
+        'seed': params['seed'],
+        'size': params['size'],
+        'output_format': params['output_format'],
+        'compression': params['compression'],
+        'parts': [
+            {key: result[key] for key in ('index', 'key', 'start', 'stop', 'rows', 'bytes')}
+            for result in sorted(results, key=lambda result: result['index'])
+        ],
+        'bytes': sum(result['bytes'] for result in results),
+    }
@@ -1,14 +1,18 @@
-import json
 import csv
 from io import StringIO
 
+from . import serializer
+
+# Target size in bytes of each chunk yielded by the streaming formatters
+CHUNK_SIZE = 1024 * 1024
+
 def format_as_json(data, indent=2):
     """Format data as pretty JSON"""
-    return json.dumps(data, indent=indent)
+    return serializer.dumps(data, indent=indent, default=str)
 
 def format_as_compact_json(data):
     """Format data as compact JSON"""
-    return json.dumps(data, separators=(',', ':'))
+    return serializer.dumps(data, compact=True, default=str)
 
 def format_as_csv(data):
     """Format data as CSV"""
@@ -21,6 +25,15 @@ def format_as_csv(data):
     writer.writerows(data)
     return output.getvalue()
 
+def _sql_literal():
+    # Imported here: sql_export builds on this module's chunking. Rows carry
+    # no value types, so values are rendered by their Python type
+    from .sql_export import literal_renderer
+    return literal_renderer(None, "postgres")
+
+def _sql_row(row, columns, render):
+    return f"({', '.join(render(row[col]) for col in columns)})"
+
 def format_as_sql(data, table_name="mock_data"):
     """Format data as SQL INSERT statements"""
     if not data:
@@ -28,21 +41,12 @@ def format_as_sql(data, table_name="mock_data"):
     
     columns = list(data[0].keys())
     column_names = ", ".join(columns)
+    render = _sql_literal()
     
     sql_lines = [f"INSERT INTO {table_name} ({column_names}) VALUES"]
     
     for i, row in enumerate(data):
-        values = []
-        for col in columns:
-            value = row[col]
-            if isinstance(value, str):
-                # Escape single quotes in strings
-                escaped_value = value.replace("'", "''")
-                values.append(f"'{escaped_value}'")
-            else:
-                values.append(str(value))
-        
-        value_str = f"({', '.join(values)})"
+        value_str = _sql_row(row, columns, render)
         if i < len(data) - 1:
             value_str += ","
         else:
@@ -50,4 +54,169 @@ def format_as_sql(data, table_name="mock_data"):
         
         sql_lines.append(f"  {value_str}")
     
-    return "\n".join(sql_lines)
\ No newline at end of file
+    return "\n".join(sql_lines)
+
+def _encode_chunks(pieces, chunk_size=CHUNK_SIZE):
+    """Join text pieces and yield them as UTF-8 bytes chunks of about chunk_size"""
+    buffer = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+def _json_pieces(rows, indent, separators=None):
+    item_separator = separators[0] if separators else ", "
+    if indent is None:
+        opening, separator, closing = "[", item_separator, "]"
+    else:
+        padding = " " * indent
+        opening, separator, closing = "[\n" + padding, item_separator.rstrip() + "\n" + padding, "\n]"
+
+    first = True
+    for row in rows:
+        item = serializer.dumps(row, indent=indent, compact=separators == (",", ":"), default=str)
+        if indent is not None:
+            item = item.replace("\n", "\n" + padding)
+        yield (opening if first else separator) + item
+        first = False
+    yield "[]" if first else closing
+
+def iter_json(rows, indent=2, chunk_size=CHUNK_SIZE):
+    """
+    Stream rows as a JSON array, yielding bytes chunks.
+    Output is identical to serializer.dumps(list(rows), indent=indent, default=str).
+    """
+    return _encode_chunks(_json_pieces(rows, indent), chunk_size)
+
+def iter_compact_json(rows, chunk_size=CHUNK_SIZE):
+    """Stream rows as compact JSON, yielding bytes chunks"""
+    return _encode_chunks(_json_pieces(rows, None, (',', ':')), chunk_size)
+
+def iter_csv(rows, chunk_size=CHUNK_SIZE):
+    """
+    Stream rows as CSV with a header taken from the first row, yielding bytes
+    chunks. One csv.writer writes into a buffer that is flushed whenever it
+    holds chunk_size characters.
+    """
+    output = StringIO()
+    writer = csv.writer(output)
+    fieldnames = None
+    for row in rows:
+        if fieldnames is None:
+            fieldnames = list(row.keys())
+            writer.writerow(fieldnames)
+        writer.writerow([row.get(name, "") for name in fieldnames])
+        if output.tell() >= chunk_size:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+def _sql_pieces(rows, table_name, rows_per_statement):
+    render = _sql_literal()
+    columns = None
+    in_statement = 0
+    for row in rows:
+        if columns is None:
+            columns = list(row.keys())
+            header = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES"
+            opening = f"{header}\n  "
+        elif in_statement == 0:
+            opening = f"\n{header}\n  "
+        else:
+            opening = ",\n  "
+        yield opening + _sql_row(row, columns, render)
+        in_statement += 1
+        if in_statement == rows_per_statement:
+            yield ";"
+            in_statement = 0
+    if in_statement:
+        yield ";"
+
+def iter_sql(rows, table_name="mock_data", rows_per_statement=1000, chunk_size=CHUNK_SIZE):
+    """Stream rows as INSERT statements of at most rows_per_statement rows each, yielding bytes chunks"""
+    return _encode_chunks(_sql_pieces(rows, table_name, rows_per_statement), chunk_size)
+
+def _json_batch_pieces(batches, indent):
+    # Each batch is dumped as one list of dicts, which the serializer does much
+    # faster than row by row (or than joining per-value JSON from the columns);
+    # its brackets are trimmed so the batches join into one array
+    compact = indent is None
+    opening, separator, closing = ("[", ",", "]") if compact else ("[\n", ",\n", "\n]")
+    trim = 1 if compact else 2
+    first = True
+    for batch in batches:
+        if not len(batch):
+            continue
+        text = serializer.dumps(batch.to_dicts(), indent=indent, compact=compact, default=str)
+        yield (opening if first else separator) + text[trim:-trim]
+        first = False
+    yield "[]" if first else closing
+
+def iter_json_batches(batches, indent=2, chunk_size=CHUNK_SIZE):
+    """Stream RowBatches as a JSON array; same output as iter_json over their rows"""
+    return _encode_chunks(_json_batch_pieces(batches, indent), chunk_size)
+
+def iter_compact_json_batches(batches, chunk_size=CHUNK_SIZE):
+    """Stream RowBatches as compact JSON; same output as iter_compact_json over their rows"""
+    return _encode_chunks(_json_batch_pieces(batches, None), chunk_size)
+
+def iter_csv_batches(batches, chunk_size=CHUNK_SIZE):
+    """
+    Stream RowBatches as CSV with a header from the batch names, yielding
+    bytes chunks. Rows are written as value tuples with writerows, with no
+    per-row key lookups.
+    """
+    output = StringIO()
+    writer = csv.writer(output)
+    header_written = False
+    for batch in batches:
+        if not len(batch):
+            continue
+        if not header_written:
+            writer.writerow(batch.names)
+            header_written = True
+        writer.writerows(batch)
+        if output.tell() >= chunk_size:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+STREAM_FORMATS = {
+    "json": ("json", lambda rows, table_name: iter_json(rows)),
+    "compact_json": ("json", lambda rows, table_name: iter_compact_json(rows)),
+    "csv": ("csv", lambda rows, table_name: iter_csv(rows)),
+    "sql": ("sql", lambda rows, table_name: iter_sql(rows, table_name)),
+}
+
+def iter_format(rows, output_format="compact_json", table_name="mock_data"):
+    """
+    Stream rows in the given output format. Returns (extension, chunks);
+    unknown formats fall back to compact JSON like generate_data.
+    """
+    extension, formatter = STREAM_FORMATS.get(output_format.lower(), STREAM_FORMATS["compact_json"])
+    return extension, formatter(rows, table_name)
+
+BATCH_FORMATS = {
+    "json": ("json", iter_json_batches),
+    "compact_json": ("json", iter_compact_json_batches),
+    "csv": ("csv", iter_csv_batches),
+}
+
+def iter_format_batches(batches, output_format="compact_json"):
+    """
+    Stream RowBatches in a row-oriented output format. Returns (extension,
+    chunks); unknown formats fall back to compact JSON like iter_format.
+    SQL is written by sql_export and the columnar formats by arrow_formats.
+    """
+    extension, formatter = BATCH_FORMATS.get(output_format.lower(), BATCH_FORMATS["compact_json"])
+    return extension, formatter(batches)
@@ -0,0 +1,122 @@
+"""Asynchronous bulk jobs.
+
+A job is described by a JSON manifest stored in the dataset bucket under
+jobs/<job_id>.json. submit_job writes the manifest and hands the job id to
+an invoker, which by default invokes this Lambda function asynchronously;
+the worker invocation updates the manifest as it makes progress.
+"""
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+
+from .s3_uploader import put_json, get_json
+
+logger = logging.getLogger()
+
+JOB_PREFIX = "jobs"
+
+# Minimum seconds between manifest updates while a job is running
+PROGRESS_INTERVAL = 5
+
+_JOB_ID = re.compile(r"[0-9a-f]{32}")
+
+_invoker = None
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def job_key(job_id):
+    return f"{JOB_PREFIX}/{job_id}.json"
+
+
+def is_job_id(value):
+    return bool(value) and _JOB_ID.fullmatch(value) is not None
+
+
+def save_manifest(manifest):
+    manifest['updated_at'] = now_iso()
+    put_json(job_key(manifest['job_id']), manifest)
+
+
+def load_manifest(job_id):
+    """Return the manifest of job_id, or None if there is no such job"""
+    if not is_job_id(job_id):
+        return None
+    return get_json(job_key(job_id))
+
+
+class LambdaInvoker:
+    """Runs a job by invoking a Lambda function asynchronously (InvocationType=Event)"""
+
+    def __init__(self, function_name=None):
+        self.function_name = function_name or os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+        self._client = None
+
+    def __call__(self, payload):
+        if not self.function_name:
+            raise RuntimeError("No function to invoke: AWS_LAMBDA_FUNCTION_NAME is not set")
+        if self._client is None:
+            import boto3
+            self._client = boto3.client('lambda')
+        self._client.invoke(
+            FunctionName=self.function_name,
+            InvocationType='Event',
+            Payload=json.dumps(payload).encode('utf-8')
+        )
+
+
+def get_invoker():
+    global _invoker
+    if _invoker is None:
+        _invoker = LambdaInvoker()
+    return _invoker
+
+
+def set_invoker(invoker):
+    """Replace the job invoker; any callable taking the worker payload works. None restores the default"""
+    global _invoker
+    _invoker = invoker
+
+
+def submit_job(fields, params):
+    """Persist a queued job manifest and dispatch it to the invoker"""
+    manifest = {
+        'job_id': uuid.uuid4().hex,
+        'status': 'queued',
+        'created_at': now_iso(),
+        'fields': list(fields),
+        'params': params,
+        'rows_written': 0,
+        'parts_uploaded': 0,
+        'bytes_uploaded': 0,
+    }
+    save_manifest(manifest)
+    get_invoker()({'job_id': manifest['job_id']})
+    logger.info(f"Submitted job {manifest['job_id']}")
+    return manifest
+
+
+class JobProgress:
+    """Progress callback for run_bulk that writes throttled updates to the manifest"""
+
+    def __init__(self, manifest, interval=PROGRESS_INTERVAL):
+        self.manifest = manifest
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_saved = self.started
+
+    def __call__(self, progress):
+        self.manifest.update(progress)
+        elapsed = time.monotonic() - self.started
+        if elapsed > 0:
+            self.manifest['rows_per_second'] = round(self.manifest['rows_written'] / elapsed, 1)
+        now = time.monotonic()
+        if now - self.last_saved >= self.interval:
+            save_manifest(self.manifest)
+            self.last_saved = now
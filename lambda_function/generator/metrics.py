@@ -0,0 +1,180 @@
+"""Per-request stage timers, counters and memory figures.
+
+Stages nest: time spent inside an inner stage (or an inner timed iterator)
+is only counted there, so the stage totals of a streamed pipeline add up to
+its wall time instead of each layer including the layers it pulls from.
+
+emit() writes one CloudWatch Embedded Metric Format line to stdout, where
+Lambda turns it into metrics without any API calls.
+"""
+import json
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from . import columnar
+from .faker_generator import BLOCK_SIZE, compile_fields
+
+NAMESPACE = "MockDataApi"
+
+# EMF units of the counters this module knows about; other counters are Count
+COUNTER_UNITS = {
+    "bytes_serialized": "Bytes",
+    "bytes_uploaded": "Bytes",
+    "cache_bytes": "Bytes",
+}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Metrics:
+    """Collects stage timings, counters and memory for one request"""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.stages = {}
+        self.counters = {}
+        self.properties = {}
+        self.field_costs = None
+        self.tracemalloc_peak_mb = None
+        self._stack = []
+        self._started = time.perf_counter()
+        self._tracing = False
+
+    def start_tracing(self):
+        """Track peak Python heap usage with tracemalloc until finish(); slows allocation-heavy code"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        name, started, inner = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed - inner
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block of code as stage name"""
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def timed_iter(self, name, iterable, bytes_counter=None):
+        """Yield from iterable, timing every next() as stage name; optionally count len() of items"""
+        iterator = iter(iterable)
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            if bytes_counter:
+                self.count(bytes_counter, len(item))
+            yield item
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, **properties):
+        """Attach properties (dataset id, format, ...) to the emitted record"""
+        self.properties.update(properties)
+
+    def profile_fields(self, fields, size=BLOCK_SIZE):
+        """Time each field of a schema over one sample block, as the per-field cost breakdown"""
+        self.field_costs = field_costs(fields, size)
+
+    def finish(self):
+        """Stop memory tracing and return the collected figures"""
+        if self._tracing:
+            self.tracemalloc_peak_mb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            tracemalloc.stop()
+            self._tracing = False
+        return self.to_dict()
+
+    def to_dict(self):
+        result = {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 2),
+            "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+        if self.tracemalloc_peak_mb is not None:
+            result["tracemalloc_peak_mb"] = self.tracemalloc_peak_mb
+        if self.field_costs is not None:
+            result["fields"] = self.field_costs
+        return result
+
+    def emf(self):
+        """The collected figures as a CloudWatch Embedded Metric Format record"""
+        figures = self.to_dict()
+        record = {"Endpoint": self.endpoint, **self.properties}
+        definitions = []
+
+        def metric(name, value, unit):
+            record[name] = value
+            definitions.append({"Name": name, "Unit": unit})
+
+        metric("total_ms", figures["total_ms"], "Milliseconds")
+        for name, value in figures["stages_ms"].items():
+            metric(f"{name}_ms", value, "Milliseconds")
+        for name, value in figures["counters"].items():
+            metric(name, value, COUNTER_UNITS.get(name, "Count"))
+        metric("peak_rss_mb", figures["peak_rss_mb"], "Megabytes")
+        if "tracemalloc_peak_mb" in figures:
+            metric("tracemalloc_peak_mb", figures["tracemalloc_peak_mb"], "Megabytes")
+        if "fields" in figures:
+            record["fields"] = figures["fields"]
+
+        record["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": NAMESPACE,
+                "Dimensions": [["Endpoint"]],
+                "Metrics": definitions,
+            }],
+        }
+        return record
+
+    def emit(self, stream=None):
+        """Write the EMF record as one JSON line"""
+        stream = stream or sys.stdout
+        stream.write(json.dumps(self.emf(), default=str) + "\n")
+        stream.flush()
+
+
+def field_costs(fields, size=BLOCK_SIZE):
+    """
+    Microseconds per row spent generating each field, measured over size
+    rows, with each field's share of the total.
+    """
+    plan = compile_fields(fields)
+    rng = columnar.default_rng(0)
+    costs = {}
+    for field_str, field in zip(plan.fields, plan.compiled):
+        # A unique field cannot have more rows than its id space
+        rows = min(size, field.id_space.size) if field.id_space is not None else size
+        started = time.perf_counter()
+        field.column(rows, random.Random(0), rng)
+        costs[field_str] = (time.perf_counter() - started) * 1e6 / max(rows, 1)
+    total = sum(costs.values()) or 1.0
+    return {
+        field_str: {"us_per_row": round(cost, 3), "share": round(cost / total, 3)}
+        for field_str, cost in costs.items()
+    }
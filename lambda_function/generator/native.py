@@ -0,0 +1,288 @@
+"""Table-driven column builders for the most common Faker fields.
+
+faker_generator consults this registry before Faker: a field with a native
+builder gets whole columns from NumPy index arrays into the Faker
+provider's own tables (names, phone formats, domains) instead of one
+provider call per cell. Builders take (size, rng) like the columnar custom
+fields and return plain Python lists.
+
+Every builder makes a single row-major draw from rng and derives all of a
+row's values from its own slice of it, so the first k values of a column
+do not depend on size, as generate_block requires.
+
+Only calls whose arguments a builder understands are native; anything
+else, and every field when NumPy is missing or NATIVE_GENERATORS=0, stays
+with Faker.
+"""
+import os
+import re
+from datetime import date
+from functools import lru_cache
+
+from . import columnar
+
+np = columnar.np
+
+ENABLED = os.environ.get("NATIVE_GENERATORS", "1") != "0"
+
+_registry = {}
+
+# Fields whose builder also beats the Faker call for a single value
+_scalar = set()
+
+_DIGIT_RANGES = {"#": (0, 10), "%": (1, 10), "$": (2, 10)}
+
+
+def native(name, scalar=False):
+    """
+    Register factory(faker, positional, kwargs) -> build(size, rng), or None
+    for unsupported args. scalar marks builders that are faster than Faker
+    even for one-row columns.
+    """
+    def register(factory):
+        _registry[name] = factory
+        if scalar:
+            _scalar.add(name)
+        return factory
+    return register
+
+
+def native_builder(faker, name, positional=(), kwargs=None):
+    """Column builder for a Faker call, or None when it has to go through Faker"""
+    factory = _registry.get(name)
+    if factory is None or not ENABLED or not columnar.HAS_NUMPY:
+        return None
+    return factory(faker, list(positional), dict(kwargs or {}))
+
+
+def registered():
+    return sorted(_registry)
+
+
+def builds_scalars(name):
+    """Whether single values of name are cheaper from its builder than from Faker"""
+    return name in _scalar
+
+
+def _provider(faker, attribute, module="faker.providers"):
+    """The first provider of faker in module with attribute (tables are per locale)"""
+    for provider in faker.providers:
+        if type(provider).__module__.startswith(module) and hasattr(provider, attribute):
+            return provider
+    return None
+
+
+class _Table:
+    """Values of a Faker table, with its weights when the table has them"""
+
+    def __init__(self, values):
+        if isinstance(values, dict):
+            weights = np.asarray(list(values.values()), dtype=float)
+            self.cumulative = np.cumsum(weights / weights.sum())
+            values = list(values)
+        else:
+            self.cumulative = None
+            values = list(values)
+        self.values = np.empty(len(values), dtype=object)
+        self.values[:] = values
+
+    def pick(self, uniforms):
+        """Values for an array of uniform [0, 1) draws"""
+        if self.cumulative is None:
+            indices = (uniforms * len(self.values)).astype(np.int64)
+        else:
+            # Inverse CDF sampling
+            indices = np.searchsorted(self.cumulative, uniforms, side="right")
+        # min() guards against float rounding at the top of the range
+        return self.values[np.minimum(indices, len(self.values) - 1)]
+
+    def map(self, convert):
+        """The same table and weights with every value converted"""
+        table = _Table([convert(value) for value in self.values])
+        table.cumulative = self.cumulative
+        return table
+
+
+def _slug(value):
+    # What Faker's user_name keeps of a name: lowercase ASCII letters and digits
+    return re.sub(r"[^a-z0-9]", "", value.lower())
+
+
+@lru_cache(maxsize=None)
+def _person_tables(provider_class):
+    tables = {"first": _Table(provider_class.first_names), "last": _Table(provider_class.last_names)}
+    for gender in ("female", "male"):
+        names = getattr(provider_class, f"first_names_{gender}", None)
+        tables[gender] = _Table(names) if names else tables["first"]
+    tables["first_user"] = tables["first"].map(_slug)
+    tables["last_user"] = tables["last"].map(_slug)
+    return tables
+
+
+def _tables(faker):
+    provider = _provider(faker, "last_names")
+    return _person_tables(type(provider)) if provider is not None else None
+
+
+def _full_names(tables, size, rng):
+    # Faker's name() is "first last" for 97% of rows, with prefixes and
+    # suffixes for the rest; native names are always "first last"
+    draws = rng.random((size, 3))
+    firsts = np.where(draws[:, 0] < 0.5, tables["female"].pick(draws[:, 1]), tables["male"].pick(draws[:, 1]))
+    return list(map("{} {}".format, firsts.tolist(), tables["last"].pick(draws[:, 2]).tolist()))
+
+
+@native("name", scalar=True)
+def _name(faker, positional, kwargs):
+    tables = _tables(faker)
+    if positional or kwargs or tables is None:
+        return None
+    return lambda size, rng: _full_names(tables, size, rng)
+
+
+@native("first_name", scalar=True)
+def _first_name(faker, positional, kwargs):
+    tables = _tables(faker)
+    if positional or kwargs or tables is None:
+        return None
+    return lambda size, rng: tables["first"].pick(rng.random(size)).tolist()
+
+
+@native("last_name", scalar=True)
+def _last_name(faker, positional, kwargs):
+    tables = _tables(faker)
+    if positional or kwargs or tables is None:
+        return None
+    return lambda size, rng: tables["last"].pick(rng.random(size)).tolist()
+
+
+def _user_name(pattern, first, last, number, letter):
+    # The four user_name formats of Faker's internet provider
+    if pattern == 0:
+        return f"{last}.{first}"
+    if pattern == 1:
+        return f"{first}.{last}"
+    if pattern == 2:
+        return f"{first}{number:02d}"
+    return letter + last
+
+
+@native("email", scalar=True)
+def _email(faker, positional, kwargs):
+    tables = _tables(faker)
+    internet = _provider(faker, "safe_domain_names")
+    if positional or kwargs or tables is None or internet is None:
+        return None
+    domains = _Table(internet.safe_domain_names)
+    letters = _Table("abcdefghijklmnopqrstuvwxyz")
+
+    def build(size, rng):
+        # Composed from a first and a last name column drawn from the
+        # person tables, like Faker's user_name formats
+        draws = rng.random((size, 6))
+        users = map(
+            _user_name, (draws[:, 0] * 4).astype(np.int64).tolist(),
+            tables["first_user"].pick(draws[:, 1]).tolist(), tables["last_user"].pick(draws[:, 2]).tolist(),
+            (draws[:, 3] * 100).astype(np.int64).tolist(), letters.pick(draws[:, 4]).tolist()
+        )
+        return list(map("{}@{}".format, users, domains.pick(draws[:, 5]).tolist()))
+    return build
+
+
+_HEX = np.frombuffer(b"0123456789abcdef", dtype=np.uint8) if np is not None else None
+
+
+@native("uuid4")
+def _uuid4(faker, positional, kwargs):
+    if positional or kwargs:
+        return None
+
+    def build(size, rng):
+        data = rng.integers(0, 256, (size, 16), dtype=np.uint8)
+        data[:, 6] = (data[:, 6] & 0x0F) | 0x40  # version 4
+        data[:, 8] = (data[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        digits = np.empty((size, 32), dtype=np.uint8)
+        digits[:, 0::2] = _HEX[data >> 4]
+        digits[:, 1::2] = _HEX[data & 0x0F]
+        text = np.full((size, 36), ord("-"), dtype=np.uint8)
+        for start, stop, offset in ((0, 8, 0), (8, 12, 1), (12, 16, 2), (16, 20, 3), (20, 32, 4)):
+            text[:, start + offset:stop + offset] = digits[:, start:stop]
+        return text.view("S36").ravel().astype("U36").tolist()
+    return build
+
+
+@native("random_int")
+def _random_int(faker, positional, kwargs):
+    names = ("min", "max", "step")
+    if len(positional) > len(names) or set(kwargs) - set(names):
+        return None
+    bounds = {"min": 0, "max": 9999, "step": 1, **dict(zip(names, positional)), **kwargs}
+    if not all(isinstance(value, int) for value in bounds.values()) or bounds["step"] < 1:
+        return None
+    low, step = bounds["min"], bounds["step"]
+    count = (bounds["max"] - low) // step + 1
+    if count < 1:
+        return None  # Faker raises the error for an empty range
+    return lambda size, rng: (rng.integers(0, count, size) * step + low).tolist()
+
+
+@native("date")
+def _date(faker, positional, kwargs):
+    if len(positional) > 1 or set(kwargs) - {"pattern"}:
+        return None
+    if (positional[0] if positional else kwargs.get("pattern", "%Y-%m-%d")) != "%Y-%m-%d":
+        return None
+
+    def build(size, rng):
+        # Like Faker, any day between 1970-01-01 and today
+        days = (date.today() - date(1970, 1, 1)).days + 1
+        return (np.datetime64("1970-01-01") + rng.integers(0, days, size)).astype("U10").tolist()
+    return build
+
+
+def _pattern_column(formats, size, rng):
+    """Fill #, % and $ of randomly picked formats with digits, as numerify does"""
+    width = max(len(pattern) for pattern in formats)
+    draws = rng.random((size, width + 1))
+    picks = np.minimum((draws[:, 0] * len(formats)).astype(np.int64), len(formats) - 1)
+    values = np.empty(size, dtype=object)
+    for index, pattern in enumerate(formats):
+        rows = (picks == index).nonzero()[0]
+        if not len(rows):
+            continue
+        template = np.frombuffer(pattern.encode("ascii"), dtype=np.uint8)
+        matrix = np.tile(template, (len(rows), 1))
+        for symbol, (low, high) in _DIGIT_RANGES.items():
+            positions = (template == ord(symbol)).nonzero()[0]
+            if len(positions):
+                digits = low + (draws[rows[:, None], positions + 1] * (high - low)).astype(np.uint8)
+                matrix[:, positions] = digits + ord("0")
+        values[rows] = matrix.view(f"S{len(pattern)}").ravel().astype(f"U{len(pattern)}")
+    return values.tolist()
+
+
+@native("phone_number")
+def _phone_number(faker, positional, kwargs):
+    provider = _provider(faker, "formats", "faker.providers.phone_number")
+    if positional or kwargs or provider is None:
+        return None
+    formats = tuple(provider.formats)
+    # Formats with optional digits (! and @) or template syntax stay with Faker
+    if not formats or not all(pattern.isascii() and not set(pattern) & set("!@{") for pattern in formats):
+        return None
+    return lambda size, rng: _pattern_column(formats, size, rng)
+
+
+@native("ean13")
+def _ean13(faker, positional, kwargs):
+    if positional or kwargs:
+        return None
+    weights = np.tile(np.array([1, 3], dtype=np.int64), 6)
+
+    def build(size, rng):
+        digits = np.empty((size, 13), dtype=np.uint8)
+        digits[:, :12] = rng.integers(0, 10, (size, 12), dtype=np.uint8)
+        digits[:, 12] = (10 - (digits[:, :12] @ weights) % 10) % 10
+        digits += ord("0")
+        return digits.view("S13").ravel().astype("U13").tolist()
+    return build
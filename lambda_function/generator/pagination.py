@@ -0,0 +1,104 @@
+"""Cursors and cache validators for paging through a seeded virtual dataset.
+
+A page is determined by (fields, seed, offset, limit) and the settings that
+change generation or encoding, so its ETag can be computed without
+generating it. Faker providers relative to today (date_of_birth, past_date,
+date_time, ...) make a page change daily: their ETag includes the date and
+their responses are cached until midnight only.
+"""
+import base64
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+
+from faker import VERSION as FAKER_VERSION
+
+from . import native, serializer
+
+# Bump when generation changes so cached pages and ETags are invalidated
+GENERATOR_VERSION = 4
+
+# Seconds a page of fields that do not depend on today may be cached
+MAX_AGE = 86400
+
+# Faker providers whose values may depend on the current date
+_TIME_RELATIVE = re.compile(r"date|time|year|month|century|decade|iso8601|unix")
+
+
+def schema_hash(fields):
+    """Short stable hash of a field list"""
+    return hashlib.sha256(json.dumps(list(fields)).encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(fields, seed, offset, limit):
+    state = {"s": schema_hash(fields), "seed": seed, "o": offset, "l": limit}
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, fields):
+    """Return (seed, offset, limit) from a cursor; raises ValueError if it is malformed or for other fields"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        seed, offset, limit = int(state["seed"]), int(state["o"]), int(state["l"])
+        cursor_schema = state["s"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+    if cursor_schema != schema_hash(fields):
+        raise ValueError("Cursor does not match the requested fields")
+    return seed, offset, limit
+
+
+def _provider(field_str):
+    """The Faker provider a field calls, or None for custom fields and typed non-Faker columns"""
+    if field_str.startswith("{"):
+        column = json.loads(field_str)
+        return column.get("provider") if column.get("type") == "faker" else None
+    if "[" in field_str:
+        return None
+    return field_str.split("(", 1)[0].strip()
+
+
+def depends_on_today(fields):
+    """True when some field may return different values on another day"""
+    return any(_TIME_RELATIVE.search(_provider(field) or "") for field in fields)
+
+
+def today_key(fields, now=None):
+    """Today's date for fields that depend on it, else None; part of cache keys of generated rows"""
+    return (now or datetime.now()).date().isoformat() if depends_on_today(fields) else None
+
+
+def page_etag(fields, seed, offset, limit, now=None):
+    """Weak ETag for a page; weak because the body may be served compressed"""
+    today = today_key(fields, now)
+    material = json.dumps([
+        GENERATOR_VERSION, FAKER_VERSION, native.ENABLED, serializer.backend, today, list(fields), seed, offset, limit
+    ])
+    return f'W/"{hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def cache_control(fields, now=None):
+    """Cache-Control of a page: a day, or until midnight for fields relative to today"""
+    if not depends_on_today(fields):
+        return f"public, max-age={MAX_AGE}"
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return f"public, max-age={max(int((midnight - now).total_seconds()), 1)}"
+
+
+def etag_matches(if_none_match, etag):
+    """True when an If-None-Match header lists etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
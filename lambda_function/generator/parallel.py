@@ -0,0 +1,90 @@
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from .faker_generator import BLOCK_SIZE, generate_block_batch
+from .rows import RowBatch
+
+logger = logging.getLogger()
+
+# Blocks handed to a worker process per task
+TASK_BLOCKS = 16
+
+def default_workers():
+    """Default worker count: one per available CPU"""
+    return os.cpu_count() or 1
+
+def _generate_task(fields, seed, size, first_block, block_count, pools=None):
+    batches = []
+    for index in range(first_block, first_block + block_count):
+        start = index * BLOCK_SIZE
+        batches.append(generate_block_batch(fields, seed, index, min(BLOCK_SIZE, size - start), pools))
+    return RowBatch.concat(batches[0].names, batches) if len(batches) > 1 else batches[0]
+
+def _tasks(size, start=0):
+    total_blocks = -(-size // BLOCK_SIZE)
+    for first_block in range(start // BLOCK_SIZE, total_blocks, TASK_BLOCKS):
+        yield first_block, min(TASK_BLOCKS, total_blocks - first_block)
+
+def _create_executor(workers):
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError) as e:
+        # AWS Lambda has no /dev/shm, so multiprocessing queues cannot be created
+        logger.warning(f"Process pool unavailable, generating on one core: {str(e)}")
+        return None
+
+def iter_parallel_batches(fields, size, seed, workers=None, start=0, pools=None):
+    """
+    Generate rows start..size of a dataset across a process pool and yield
+    them in order, one RowBatch per task. Output depends only on (fields,
+    seed, size, pools), never on the number of workers. start must be a
+    multiple of BLOCK_SIZE.
+    """
+    if start % BLOCK_SIZE:
+        raise ValueError(f"start must be a multiple of {BLOCK_SIZE}")
+    fields = tuple(fields)
+    tasks = list(_tasks(size, start))
+    workers = min(workers or default_workers(), len(tasks))
+
+    executor = _create_executor(workers) if workers > 1 else None
+    if executor is None:
+        for first_block, block_count in tasks:
+            yield _generate_task(fields, seed, size, first_block, block_count, pools)
+        return
+
+    with executor:
+        # Keep a bounded number of tasks in flight so results do not pile up
+        # in memory when the consumer is slower than the workers
+        pending = []
+        task_iter = iter(tasks)
+        for first_block, block_count in task_iter:
+            pending.append(executor.submit(_generate_task, fields, seed, size, first_block, block_count, pools))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            batch = pending.pop(0).result()
+            next_task = next(task_iter, None)
+            if next_task is not None:
+                pending.append(executor.submit(_generate_task, fields, seed, size, *next_task, pools))
+            yield batch
+
+def iter_parallel_chunks(fields, size, seed, workers=None, as_columns=False, start=0, pools=None):
+    """
+    iter_parallel_batches as one list of row dicts per task (or one list of
+    columns with as_columns=True)
+    """
+    for batch in iter_parallel_batches(fields, size, seed, workers, start, pools):
+        yield batch.columns if as_columns else batch.to_dicts()
+
+def iter_parallel_rows(fields, size, seed, workers=None, start=0):
+    """Row-by-row view of iter_parallel_chunks"""
+    for chunk in iter_parallel_chunks(fields, size, seed, workers, start=start):
+        yield from chunk
+
+def generate_parallel(fields, size, seed, workers=None):
+    """Generate size rows in parallel and return them as one list"""
+    rows = []
+    for chunk in iter_parallel_chunks(fields, size, seed, workers):
+        rows.extend(chunk)
+    return rows
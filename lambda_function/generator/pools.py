@@ -0,0 +1,195 @@
+"""Precomputed value pools for expensive Faker providers.
+
+In pool mode a Faker field is called only to fill a pool of distinct values
+once per container; every row then samples the pool by index, so large
+datasets cost array indexing instead of one provider call per cell.
+
+Pools are seeded from the dataset seed, so every worker and shard builds
+the same pool and output stays reproducible. With refresh set, a new pool
+is drawn every refresh rows (rounded up to whole blocks). Fields listed in
+unique are read through a seeded permutation of their pool instead of
+being sampled, so no value repeats; such datasets may not be larger than
+the pool.
+"""
+import os
+import random
+import threading
+from collections import OrderedDict, namedtuple
+
+from . import columnar
+from .faker_generator import BLOCK_SIZE, derive_seed
+
+# Largest pool a request may ask for
+MAX_POOL_SIZE = 200_000
+
+# Values (pool entries and permutation indices) kept per process. Each
+# process-pool worker builds and caches its own pools, so a container holds
+# up to this many per worker; the default keeps that to tens of MB
+POOL_CACHE_VALUES = int(os.environ.get("POOL_CACHE_VALUES", 400_000))
+
+# Distinct-value attempts per pool slot before giving up
+UNIQUE_ATTEMPTS = 10
+
+POOLED_KINDS = ("faker", "fallback", "native")
+
+PoolConfig = namedtuple("PoolConfig", ["size", "refresh", "unique"], defaults=(0, ()))
+
+
+
+class _ValueCache:
+    """LRU of pools and permutations bounded by the total number of values they hold"""
+
+    def __init__(self, max_values):
+        self.max_values = max_values
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            values = self._entries.get(key)
+            if values is not None:
+                self._entries.move_to_end(key)
+            return values
+
+    def put(self, key, values):
+        # Callers keep using values that are too large to cache
+        if len(values) > self.max_values:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = values
+            self.size += len(values)
+            while self.size > self.max_values:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+_cache = _ValueCache(POOL_CACHE_VALUES)
+
+
+def pool_config(size, refresh=0, unique=()):
+    """Validated PoolConfig, or None when size is 0 (pool mode off)"""
+    size, refresh = int(size or 0), int(refresh or 0)
+    if size == 0:
+        if unique:
+            raise ValueError("pool_unique requires pool_size")
+        return None
+    if not 1 <= size <= MAX_POOL_SIZE:
+        raise ValueError(f"pool_size must be between 1 and {MAX_POOL_SIZE}")
+    if refresh < 0:
+        raise ValueError("pool_refresh must be >= 0")
+    return PoolConfig(size, refresh, tuple(unique))
+
+
+def validate(config, plan, size):
+    """Check a config against a compiled plan and dataset size before generating"""
+    pooled = {field.name for field in plan.compiled if field.kind in POOLED_KINDS}
+    for name in config.unique:
+        if name not in pooled:
+            raise ValueError(f"pool_unique field '{name}' is not a Faker field")
+    if config.unique and size > config.size:
+        raise ValueError(f"size ({size}) exceeds pool_size ({config.size}) for unique fields")
+
+
+def _build_pool(plan, position, size, pool_seed):
+    """Draw size distinct values from the field's provider"""
+    field = plan.compiled[position]
+    plan.faker.seed_instance(pool_seed)
+    values = {}
+    if field.build_column is not None and columnar.HAS_NUMPY:
+        # Native and vectorised fields draw a column at a time instead of one value per call
+        rng = columnar.default_rng(pool_seed)
+        for _ in range(UNIQUE_ATTEMPTS):
+            values.update(dict.fromkeys(field.build_column(size, rng)))
+            if len(values) >= size:
+                break
+    else:
+        rnd = random.Random(pool_seed)
+        for _ in range(size * UNIQUE_ATTEMPTS):
+            values.setdefault(field.generate(rnd), None)
+            if len(values) == size:
+                break
+    if len(values) < size:
+        raise ValueError(f"Field '{field.name}' produced only {len(values)} distinct values for a pool of {size}")
+    values = list(values)[:size]
+    if columnar.HAS_NUMPY:
+        pool = columnar.np.empty(size, dtype=object)
+        pool[:] = values
+        return pool
+    return values
+
+
+def get_pool(plan, position, config, seed, epoch=0):
+    """The pool for one field of a dataset, built once and cached per container"""
+    key = ("pool", plan.fields[position], position, config.size, seed, epoch)
+    pool = _cache.get(key)
+    if pool is None:
+        pool = _build_pool(plan, position, config.size, derive_seed(seed, "pool", position, epoch))
+        _cache.put(key, pool)
+    return pool
+
+
+def _permutation(size, seed, position):
+    rng = random.Random(derive_seed(seed, "pool-permutation", position))
+    order = list(range(size))
+    rng.shuffle(order)
+    return order
+
+
+def block_builders(plan, config, seed, index):
+    """
+    Column builders for the pooled fields of block index, as
+    {position: build(size, rnd, rng)} for SchemaPlan.generate_seeded_columns.
+    """
+    epoch_blocks = -(-config.refresh // BLOCK_SIZE) if config.refresh else 0
+    builders = {}
+    for position, field in enumerate(plan.compiled):
+        if field.kind not in POOLED_KINDS or field.row_builder is not None:
+            continue
+        if field.name in config.unique:
+            builders[position] = _unique_builder(plan, position, config, seed, index)
+        else:
+            epoch = index // epoch_blocks if epoch_blocks else 0
+            builders[position] = _sample_builder(get_pool(plan, position, config, seed, epoch))
+    return builders
+
+
+def _sample_builder(pool):
+    def build(size, rnd, rng):
+        if rng is not None:
+            return pool[rng.integers(0, len(pool), size)].tolist()
+        return rnd.choices(pool, k=size)
+    return build
+
+
+def _unique_builder(plan, position, config, seed, index):
+    # Unique fields keep one pool for the whole dataset; row i reads
+    # pool[order[i]], so values repeat only if the dataset outgrows the pool
+    pool = get_pool(plan, position, config, seed)
+    order = _cached_permutation(config.size, seed, position)
+    first_row = index * BLOCK_SIZE
+
+    def build(size, rnd, rng):
+        return [pool[i] for i in order[first_row:first_row + size]]
+    return build
+
+
+def _cached_permutation(size, seed, position):
+    key = ("permutation", size, seed, position)
+    order = _cache.get(key)
+    if order is None:
+        order = _permutation(size, seed, position)
+        _cache.put(key, order)
+    return order
+
+
+def clear():
+    _cache.clear()
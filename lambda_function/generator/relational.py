@@ -0,0 +1,262 @@
+"""Multi-table datasets whose foreign keys are derived, never looked up.
+
+A multi-table schema lists tables, each parent before the tables that
+reference it:
+
+    {"tables": [
+        {"name": "customers", "size": 1000, "columns": [
+            {"name": "id", "type": "prefix", "prefix": "C", "length": 8, "unique": true},
+            {"name": "name", "type": "faker", "provider": "name"}]},
+        {"name": "orders", "columns": [
+            {"name": "id", "type": "int", "min": 1, "max": 999999999, "unique": true},
+            {"name": "customer_id", "type": "reference", "table": "customers", "column": "id",
+             "per_parent": {"min": 1, "max": 20}}]}
+    ]}
+
+A reference column points at a unique column of an earlier table. Unique
+values are a keyed permutation of the row number (see unique.py), so the
+key of any parent row is computed from the parent's seed alone and no
+parent table is ever held in memory or read back.
+
+With per_parent, the table gets min..max rows for every parent row,
+grouped by parent in parent order, and its size is the total. Child counts
+are drawn per parent block, so the child rows of any range are found from
+the per-block totals and a few regenerated blocks. Without it, every row
+references a random parent row.
+
+bind_tables() fixes the seed and size of every table for a dataset seed;
+each table is then generated and written like any single-table dataset.
+"""
+import json
+import random
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from itertools import accumulate
+
+from . import columnar, unique
+from .faker_generator import BLOCK_SIZE, CompiledField, compile_fields, derive_seed
+from .schema import (
+    SchemaError, _bounds, _integer, _normal_parameters, canonical_column, compile_column, load_schema,
+    validate_columns, DISTRIBUTIONS, NAME_PATTERN,
+)
+
+np = columnar.np
+
+MAX_TABLES = 32
+
+TABLE_KEYS = {"name", "size", "columns"}
+PER_PARENT_KEYS = {"min", "max", "distribution", "mean", "stddev"}
+
+
+class Cardinality(namedtuple("Cardinality", ["low", "high", "distribution", "mean", "stddev"])):
+    """Children per parent row: low..high, uniform or a clipped normal"""
+    __slots__ = ()
+
+    @classmethod
+    def from_column(cls, column):
+        spec = {"name": column["name"], **column["per_parent"]}
+        low, high = _bounds(spec, _integer)
+        distribution = spec.get("distribution", "uniform")
+        mean, stddev = _normal_parameters(spec, low, high) if distribution == "normal" else (None, None)
+        return cls(low, high, distribution, mean, stddev)
+
+    def counts(self, seed, block, parents):
+        """Children of the first parents rows of parent block block"""
+        block_seed = derive_seed(seed, "per_parent", block)
+        if np is None:
+            rnd = random.Random(block_seed)
+            if self.distribution == "normal":
+                return [min(max(round(rnd.gauss(self.mean, self.stddev)), self.low), self.high) for _ in range(parents)]
+            return [rnd.randint(self.low, self.high) for _ in range(parents)]
+        # Always a full block of draws, so a short last block is a prefix of it
+        rng = np.random.default_rng(block_seed)
+        if self.distribution == "normal":
+            counts = np.clip(np.rint(rng.normal(self.mean, self.stddev, BLOCK_SIZE)), self.low, self.high).astype(np.int64)
+        else:
+            counts = rng.integers(self.low, self.high + 1, BLOCK_SIZE)
+        return counts[:parents]
+
+
+def _block_parents(parent_size, block):
+    return min(BLOCK_SIZE, parent_size - block * BLOCK_SIZE)
+
+
+@lru_cache(maxsize=16)
+def child_offsets(cardinality, seed, parent_size):
+    """First child row of every parent block, plus the total number of child rows"""
+    blocks = -(-parent_size // BLOCK_SIZE)
+    totals = (int(sum(cardinality.counts(seed, block, _block_parents(parent_size, block)))) for block in range(blocks))
+    return list(accumulate(totals, initial=0))
+
+
+def parent_rows(cardinality, seed, parent_size, first_row, size):
+    """The parent row of child rows first_row..first_row+size"""
+    offsets = child_offsets(cardinality, seed, parent_size)
+    if first_row + size > offsets[-1]:
+        raise ValueError(f"Rows up to {first_row + size} requested of a table of {offsets[-1]} rows")
+    rows = []
+    block = bisect_right(offsets, first_row) - 1
+    while size > 0:
+        counts = cardinality.counts(seed, block, _block_parents(parent_size, block))
+        start = first_row - offsets[block]
+        if np is None:
+            parents = [block * BLOCK_SIZE + parent for parent, count in enumerate(counts) for _ in range(count)]
+        else:
+            parents = np.repeat(np.arange(block * BLOCK_SIZE, block * BLOCK_SIZE + len(counts)), counts)
+        taken = parents[start:start + size]
+        rows.append(taken)
+        first_row += len(taken)
+        size -= len(taken)
+        block += 1
+    if np is None:
+        return [row for taken in rows for row in taken]
+    return np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+
+def reference_field(column):
+    """Compile a bound reference column (see bind_tables) into a CompiledField"""
+    name = column["name"]
+    key_field = compile_column(column["key"])
+    id_space = key_field.id_space
+    permutation = unique.permutation(id_space.size, derive_seed(column["parent_seed"], "unique", column["key_position"]))
+    parent_size = column["parent_size"]
+
+    def keys(rows):
+        return id_space.values(permutation(rows))
+
+    def generate(rnd):
+        return keys([rnd.randrange(parent_size)])[0]
+
+    def build_column(size, rng):
+        return keys(rng.integers(0, parent_size, size))
+
+    field = CompiledField(name, "reference", generate, build_column if columnar.HAS_NUMPY else None,
+                          value_type=key_field.value_type)
+    if "per_parent" in column:
+        cardinality = Cardinality.from_column(column)
+
+        def row_builder(seed, position, first_row):
+            def build(size, rnd=None, rng=None):
+                return keys(parent_rows(cardinality, seed, parent_size, first_row, size))
+            return build
+
+        field.row_builder = row_builder
+    return field
+
+
+def is_relational(schema):
+    """Whether a schema (dict or JSON text) lists tables rather than columns"""
+    schema = load_schema(schema)
+    return isinstance(schema, dict) and "tables" in schema
+
+
+def _resolve_reference(column, tables):
+    name = column["name"]
+    parent = tables.get(column.get("table"))
+    if parent is None:
+        raise SchemaError(f"Column '{name}': 'table' must name a table defined before this one")
+    for position, field in enumerate(parent["fields"]):
+        key = json.loads(field)
+        if key["name"] == column.get("column"):
+            break
+    else:
+        raise SchemaError(f"Column '{name}': table '{parent['name']}' has no column {column.get('column')!r}")
+    if not key.get("unique"):
+        raise SchemaError(f"Column '{name}': '{parent['name']}.{key['name']}' must be a unique column")
+    if "per_parent" in column:
+        per_parent = column["per_parent"]
+        if not isinstance(per_parent, dict) or set(per_parent) - PER_PARENT_KEYS:
+            raise SchemaError(f"Column '{name}': 'per_parent' must be an object with {', '.join(sorted(PER_PARENT_KEYS))}")
+        if per_parent.get("distribution", "uniform") not in DISTRIBUTIONS:
+            raise SchemaError(f"Column '{name}': 'distribution' must be one of {', '.join(DISTRIBUTIONS)}")
+        if column.get("null_rate"):
+            raise SchemaError(f"Column '{name}': a column with 'per_parent' cannot have a 'null_rate'")
+        if Cardinality.from_column(column).low < 0:
+            raise SchemaError(f"Column '{name}': 'min' of 'per_parent' must be >= 0")
+    return {**column, "key": key, "key_position": position}
+
+
+def _check_table(table, position, tables):
+    if not isinstance(table, dict):
+        raise SchemaError(f"Table {position} must be an object")
+    name = table.get("name")
+    if not isinstance(name, str) or not NAME_PATTERN.match(name):
+        raise SchemaError(f"Table {position}: 'name' must be an identifier")
+    if name in tables:
+        raise SchemaError(f"Table '{name}' is defined twice")
+    unknown = set(table) - TABLE_KEYS
+    if unknown:
+        raise SchemaError(f"Table '{name}': unknown keys: {', '.join(sorted(unknown))}")
+    columns = table.get("columns")
+    if not isinstance(columns, list) or not columns:
+        raise SchemaError(f"Table '{name}' must have a non-empty 'columns' list")
+    drivers = [column for column in columns if isinstance(column, dict) and "per_parent" in column]
+    if len(drivers) > 1:
+        raise SchemaError(f"Table '{name}': only one column can have 'per_parent'")
+    if drivers and "size" in table:
+        raise SchemaError(f"Table '{name}': the size comes from 'per_parent' of column '{drivers[0].get('name')}'")
+    if not drivers:
+        size = table.get("size")
+        if isinstance(size, bool) or not isinstance(size, int) or size < 0:
+            raise SchemaError(f"Table '{name}': 'size' must be an integer >= 0")
+
+
+def validate_tables(schema):
+    """
+    Validate a multi-table schema (dict, or its JSON text) and return its
+    tables as {"name", "size", "fields"} dicts, size None for tables sized
+    by a per_parent column. Raises SchemaError naming the table or column.
+    """
+    schema = load_schema(schema)
+    tables = schema.get("tables") if isinstance(schema, dict) else None
+    if not isinstance(tables, list) or not tables:
+        raise SchemaError("Schema must have a non-empty 'tables' list")
+    if len(tables) > MAX_TABLES:
+        raise SchemaError(f"Schema has {len(tables)} tables; at most {MAX_TABLES} are supported")
+    validated = {}
+    for position, table in enumerate(tables):
+        _check_table(table, position, validated)
+        fields = validate_columns(table["columns"], lambda column: _resolve_reference(column, validated))
+        validated[table["name"]] = {"name": table["name"], "size": table.get("size"), "fields": fields}
+    return list(validated.values())
+
+
+def bind_tables(tables, seed):
+    """
+    Fix validated tables to the dataset seed: each gets its own seed, tables
+    sized by per_parent get their total number of rows and reference
+    columns the seed and size of their parent. Raises ValueError when a
+    table has more rows than one of its unique columns has values.
+    """
+    bound = {}
+    for table in tables:
+        table_seed = derive_seed(seed, "table", table["name"])
+        size = table["size"]
+        fields = []
+        for field in table["fields"]:
+            column = json.loads(field)
+            if column["type"] == "reference":
+                parent = bound[column["table"]]
+                if "per_parent" in column:
+                    size = child_offsets(Cardinality.from_column(column), table_seed, parent["size"])[-1]
+                elif not parent["size"]:
+                    raise ValueError(f"Column '{column['name']}' references the empty table '{parent['name']}'")
+                field = canonical_column({**column, "parent_seed": parent["seed"], "parent_size": parent["size"]})
+            fields.append(field)
+        unique.validate(compile_fields(fields), size)
+        bound[table["name"]] = {"name": table["name"], "size": size, "seed": table_seed, "fields": fields}
+    return list(bound.values())
+
+
+def build_manifest(params, prefix, results):
+    """Manifest of a multi-table dataset, listing each table's object in schema order"""
+    return {
+        'dataset_id': params['dataset_id'],
+        'prefix': prefix,
+        'seed': params['seed'],
+        'output_format': params['output_format'],
+        'compression': params['compression'],
+        'tables': results,
+        'bytes': sum(result['bytes'] for result in results),
+    }
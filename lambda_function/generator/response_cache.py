@@ -0,0 +1,126 @@
+"""In-process caches for small /data responses.
+
+ResponseCache keeps serialized bodies of seeded requests, which are
+deterministic, under an LRU bounded by total body size. RowPool serves
+unseeded requests from a ring buffer of rows generated and serialized ahead
+of time, so a warm request costs little more than joining strings.
+"""
+import threading
+from collections import OrderedDict
+
+from . import serializer
+
+
+class ResponseCache:
+    """LRU of serialized response bodies bounded by their total length"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        # Bodies that could never fit are not worth evicting everything for
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class RowPool:
+    """
+    Ring buffer of pre-serialized rows for one field list.
+
+    Rows are generated once with generate_chunk and dumped to JSON; take()
+    hands them out in order and wraps around, so unseeded data repeats after
+    capacity rows. A single take() never exceeds capacity, so no response
+    holds the same row twice.
+    """
+
+    def __init__(self, generate_chunk, fields, capacity):
+        self.capacity = capacity
+        self._rows = [serializer.dumps(row) for row in generate_chunk(fields, capacity)]
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def take(self, count):
+        """Return the next count serialized rows; count may not exceed capacity"""
+        if count > self.capacity:
+            raise ValueError(f"Cannot take {count} rows from a pool of {self.capacity}")
+        with self._lock:
+            start = self._position
+            self._position = (start + count) % self.capacity
+        rows = self._rows[start:start + count]
+        return rows + self._rows[:count - len(rows)]
+
+    def body(self, count, as_object=False):
+        """JSON array body of count rows (or the row itself when as_object)"""
+        rows = self.take(count)
+        if as_object:
+            return rows[0]
+        return "[" + ",".join(rows) + "]"
+
+
+class PoolRegistry:
+    """Bounded LRU of RowPools keyed by field list"""
+
+    def __init__(self, generate_chunk, capacity, max_pools):
+        self.generate_chunk = generate_chunk
+        self.capacity = capacity
+        self.max_pools = max_pools
+        self._pools = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fields):
+        key = tuple(fields)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is not None:
+                self._pools.move_to_end(key)
+                return pool
+        pool = RowPool(self.generate_chunk, list(fields), self.capacity)
+        with self._lock:
+            self._pools[key] = pool
+            while len(self._pools) > self.max_pools:
+                self._pools.popitem(last=False)
+        return pool
+
+    def clear(self):
+        with self._lock:
+            self._pools.clear()
@@ -0,0 +1,76 @@
+"""Compact row container used between generation and the formatters.
+
+A RowBatch holds one header of column names for all of its rows, and the
+values either as one list per column or as one tuple per row, whichever
+the producer had. Dicts are only built by to_dicts(): for the public
+row-returning APIs, and by the JSON batch writers, which hand each batch
+to the serializer as one list of dicts because that is faster than
+assembling the objects from the columns in Python. The CSV, SQL and
+columnar writers never create one dict per row.
+"""
+
+
+class RowBatch:
+    """Rows sharing one header, stored column-wise or as value tuples"""
+    __slots__ = ("names", "_columns", "_rows")
+
+    def __init__(self, names, columns=None, rows=None):
+        self.names = tuple(names)
+        self._columns = columns
+        self._rows = rows
+        if columns is None and rows is None:
+            self._columns = [[] for _ in self.names]
+
+    @classmethod
+    def from_dicts(cls, dicts, names=None):
+        """Pack a list of dicts; names defaults to the keys of the first one"""
+        if names is None:
+            names = tuple(dicts[0]) if dicts else ()
+        return cls(names, rows=[tuple(row.get(name) for name in names) for row in dicts])
+
+    @classmethod
+    def concat(cls, names, batches):
+        """One column-wise batch holding the rows of batches in order"""
+        columns = [[] for _ in names]
+        for batch in batches:
+            for column, values in zip(columns, batch.columns):
+                column.extend(values)
+        return cls(names, columns)
+
+    @property
+    def columns(self):
+        """One list per column, in header order"""
+        if self._columns is None:
+            self._columns = [list(values) for values in zip(*self._rows)] or [[] for _ in self.names]
+        return self._columns
+
+    @property
+    def rows(self):
+        """One tuple per row; built from the columns when stored column-wise"""
+        if self._rows is not None:
+            return self._rows
+        return list(zip(*self._columns))
+
+    def __len__(self):
+        if self._rows is not None:
+            return len(self._rows)
+        return len(self._columns[0]) if self._columns else 0
+
+    def __iter__(self):
+        if self._rows is not None:
+            return iter(self._rows)
+        return zip(*self._columns)
+
+    def __reduce__(self):
+        # Worker processes send batches back pickled; only one layout is sent
+        if self._rows is not None:
+            return RowBatch, (self.names, None, self._rows)
+        return RowBatch, (self.names, self._columns)
+
+    def with_columns(self, columns):
+        """A batch with the same header and new column values"""
+        return RowBatch(self.names, columns)
+
+    def to_dicts(self):
+        names = self.names
+        return [dict(zip(names, values)) for values in self]
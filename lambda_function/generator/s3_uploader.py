@@ -1,33 +1,109 @@
-import boto3
 import io
 import csv
 import logging
+import os
+import threading
+import time
 import uuid
-import json
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from .compression import CODECS, compress_chunks
+from . import serializer
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def create_unique_bucket_and_upload(chunk_data, dataset_id, chunk_id):
-    s3 = boto3.client("s3")
-    
-    # Create unique bucket name
+# Connection pool size and retry attempts of the shared S3 client
+S3_MAX_CONNECTIONS = int(os.environ.get("S3_MAX_CONNECTIONS", 10))
+S3_MAX_ATTEMPTS = int(os.environ.get("S3_MAX_ATTEMPTS", 5))
+
+_s3_client = None
+_fallback_bucket = None
+
+# S3 rejects multipart parts smaller than 5 MiB, except for the last one,
+# and larger than 5 GiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+PART_SIZE = int(os.environ.get("S3_PART_SIZE", 8 * 1024 * 1024))
+
+# Parts uploaded at the same time, and attempts per part on top of the
+# client's own retries; a failed part is resent from memory, never regenerated
+UPLOAD_CONCURRENCY = int(os.environ.get("S3_UPLOAD_CONCURRENCY", 4))
+PART_ATTEMPTS = int(os.environ.get("S3_PART_ATTEMPTS", 3))
+RETRY_DELAY = 0.5
+
+def get_s3_client():
+    """
+    Return the shared S3 client, creating it on first use. boto3 is imported
+    here rather than at module load, so requests that never touch S3 do not
+    pay for it on a cold start.
+    """
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        from botocore.config import Config
+        _s3_client = boto3.client("s3", config=Config(
+            max_pool_connections=S3_MAX_CONNECTIONS,
+            retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': 'standard'}
+        ))
+    return _s3_client
+
+def reset_s3_client():
+    """Drop the shared client and fallback bucket (used by tests)"""
+    global _s3_client, _fallback_bucket
+    _s3_client = None
+    _fallback_bucket = None
+
+def create_unique_bucket(s3):
+    """Create a uniquely named bucket in the client's region and return its name"""
     unique_id = str(uuid.uuid4())[:8]
     bucket_name = f"mock-data-{unique_id}"
-    key = f"{dataset_id}.json"
     
     logger.info(f"Creating bucket: {bucket_name}")
-    
-    try:
-        # Create bucket
+    region = s3.meta.region_name
+    if region == 'us-east-1':
+        s3.create_bucket(Bucket=bucket_name)
+    else:
         s3.create_bucket(
             Bucket=bucket_name,
-            CreateBucketConfiguration={'LocationConstraint': 'eu-central-1'}
+            CreateBucketConfiguration={'LocationConstraint': region}
         )
-        logger.info(f"Successfully created bucket: {bucket_name}")
+    logger.info(f"Successfully created bucket: {bucket_name}")
+    return bucket_name
+
+def get_bucket_name(s3):
+    """
+    Bucket that datasets are written to: BUCKET_NAME (provisioned by the CDK
+    stack), or for local runs without it a bucket created once per container.
+    """
+    global _fallback_bucket
+    bucket_name = os.environ.get("BUCKET_NAME")
+    if bucket_name:
+        return bucket_name
+    if _fallback_bucket is None:
+        logger.warning("BUCKET_NAME is not set, creating a bucket for this container")
+        _fallback_bucket = create_unique_bucket(s3)
+    return _fallback_bucket
+
+def dataset_prefix(dataset_id, now=None):
+    """Key prefix of a dataset's objects: <dataset_id>/<YYYY-MM-DD>"""
+    now = now or datetime.now(timezone.utc)
+    return f"{dataset_id}/{now:%Y-%m-%d}"
+
+def dataset_key(dataset_id, extension, now=None):
+    """Object key of a dataset: <dataset_id>/<YYYY-MM-DD>/<dataset_id>.<extension>"""
+    return f"{dataset_prefix(dataset_id, now)}/{dataset_id}.{extension}"
+
+def create_unique_bucket_and_upload(chunk_data, dataset_id, chunk_id):
+    s3 = get_s3_client()
+    key = f"{dataset_id}.json"
+    
+    try:
+        # Create bucket
+        bucket_name = create_unique_bucket(s3)
         
         # Convert chunk data to JSON
-        json_data = json.dumps(chunk_data, indent=2, default=str)
+        json_data = serializer.dumps(chunk_data, indent=2, default=str)
         
         # Upload to S3
         s3.put_object(Bucket=bucket_name, Key=key, Body=json_data)
@@ -37,3 +113,188 @@ def create_unique_bucket_and_upload(chunk_data, dataset_id, chunk_id):
     except Exception as e:
         logger.error(f"Failed to create bucket or upload: {str(e)}")
         raise
+
+def validate_upload_settings(part_size_mb=None, concurrency=None):
+    """
+    Check the part_size_mb and upload_concurrency of a bulk request; returns
+    (part_size_bytes, concurrency) with None for unset values, or raises
+    ValueError
+    """
+    part_size = None
+    if part_size_mb is not None:
+        part_size = int(part_size_mb) * 1024 * 1024
+        if not MIN_PART_SIZE <= part_size <= MAX_PART_SIZE:
+            raise ValueError(f"part_size_mb must be between {MIN_PART_SIZE >> 20} and {MAX_PART_SIZE >> 20}")
+    if concurrency is not None:
+        concurrency = int(concurrency)
+        # More threads than pooled connections would only queue on the pool
+        if not 1 <= concurrency <= S3_MAX_CONNECTIONS:
+            raise ValueError(f"upload_concurrency must be between 1 and {S3_MAX_CONNECTIONS}")
+    return part_size, concurrency
+
+def _send_part(s3, bucket_name, key, upload_id, part_number, body, attempts=PART_ATTEMPTS):
+    for attempt in range(attempts):
+        try:
+            response = s3.upload_part(
+                Bucket=bucket_name, Key=key, UploadId=upload_id,
+                PartNumber=part_number, Body=body
+            )
+            return {'ETag': response['ETag'], 'PartNumber': part_number}
+        except Exception as e:
+            if attempt == attempts - 1:
+                raise
+            logger.warning(f"Part {part_number} of s3://{bucket_name}/{key} failed, retrying: {str(e)}")
+            time.sleep(RETRY_DELAY * 2 ** attempt)
+
+def upload_stream(s3, bucket_name, key, chunks, part_size=PART_SIZE, content_encoding=None, progress=None,
+                  concurrency=UPLOAD_CONCURRENCY):
+    """
+    Upload an iterable of bytes chunks to S3 without holding the whole body.
+
+    Chunks are buffered until part_size bytes are available and sent as
+    multipart upload parts by a pool of concurrency threads, so the caller
+    keeps generating the next parts while earlier ones are in flight. At
+    most concurrency + 1 parts are held at once: when they are all taken,
+    pulling the next chunk waits for an upload to finish. Bodies smaller
+    than one part are sent with a single put_object. progress, if given,
+    is called with {'parts_uploaded': n, 'bytes_uploaded': n} as parts
+    finish, from the calling thread so a slow callback never holds up the
+    part uploads. Returns {'bytes': total_bytes, 'parts': part_count}.
+    """
+    object_args = {'ContentEncoding': content_encoding} if content_encoding else {}
+    part_size = min(max(part_size, MIN_PART_SIZE), MAX_PART_SIZE)
+    concurrency = max(int(concurrency), 1)
+    buffer = bytearray()
+    total_bytes = 0
+    uploaded_bytes = 0
+    upload_id = None
+    part_count = 0
+    executor = None
+    pending = set()
+    parts = []
+    reported_parts = 0
+    lock = threading.Lock()
+
+    def upload_part(part_number, body):
+        nonlocal uploaded_bytes
+        part = _send_part(s3, bucket_name, key, upload_id, part_number, body)
+        with lock:
+            parts.append(part)
+            uploaded_bytes += len(body)
+
+    def report():
+        # Runs on the producer thread: the workers only count under the lock
+        nonlocal reported_parts
+        with lock:
+            counts = {'parts_uploaded': len(parts), 'bytes_uploaded': uploaded_bytes}
+        if progress and counts['parts_uploaded'] > reported_parts:
+            reported_parts = counts['parts_uploaded']
+            progress(counts)
+
+    def collect(return_when):
+        # Re-raises the first failed part once its retries are exhausted
+        nonlocal pending
+        done, pending = wait(pending, return_when=return_when)
+        for future in done:
+            future.result()
+        report()
+
+    def submit(body):
+        nonlocal upload_id, executor, part_count
+        if upload_id is None:
+            upload_id = s3.create_multipart_upload(Bucket=bucket_name, Key=key, **object_args)['UploadId']
+            executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="s3-part")
+        # Bounded queue: wait for a free slot before holding another part
+        while len(pending) > concurrency:
+            collect(FIRST_COMPLETED)
+        report()
+        part_count += 1
+        pending.add(executor.submit(upload_part, part_count, body))
+
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            total_bytes += len(chunk)
+            while len(buffer) >= part_size:
+                body = bytes(buffer[:part_size])
+                del buffer[:part_size]
+                submit(body)
+
+        if upload_id is None:
+            s3.put_object(Bucket=bucket_name, Key=key, Body=bytes(buffer), **object_args)
+            if progress:
+                progress({'parts_uploaded': 1, 'bytes_uploaded': total_bytes})
+            return {'bytes': total_bytes, 'parts': 1}
+
+        if buffer:
+            submit(bytes(buffer))
+        collect(ALL_COMPLETED)
+        s3.complete_multipart_upload(
+            Bucket=bucket_name, Key=key, UploadId=upload_id,
+            MultipartUpload={'Parts': sorted(parts, key=lambda part: part['PartNumber'])}
+        )
+        return {'bytes': total_bytes, 'parts': len(parts)}
+    except Exception:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if upload_id is not None:
+            s3.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+def upload_dataset(chunks, dataset_id, extension="json", compression=None, progress=None, key=None, metrics=None,
+                   part_size=None, concurrency=None):
+    """
+    Stream bytes chunks into the dataset bucket, optionally compressed with
+    gzip or zstd on the way; returns (bucket_name, key, stats). key
+    overrides the default dataset_key (the extension is still appended).
+    metrics, a metrics.Metrics, times compression as its own stage.
+    part_size and concurrency default to PART_SIZE and UPLOAD_CONCURRENCY.
+    """
+    s3 = get_s3_client()
+    content_encoding = None
+    if compression:
+        suffix, content_encoding = CODECS[compression]
+        extension = f"{extension}.{suffix}"
+        chunks = compress_chunks(chunks, compression)
+        if metrics:
+            chunks = metrics.timed_iter("compress", chunks)
+    
+    try:
+        bucket_name = get_bucket_name(s3)
+        key = f"{key}.{extension}" if key else dataset_key(dataset_id, extension)
+        stats = upload_stream(
+            s3, bucket_name, key, chunks, part_size or PART_SIZE, content_encoding, progress,
+            concurrency or UPLOAD_CONCURRENCY
+        )
+        logger.info(f"Successfully uploaded {stats['bytes']} bytes in {stats['parts']} parts to s3://{bucket_name}/{key}")
+        return bucket_name, key, stats
+    except Exception as e:
+        logger.error(f"Failed to upload dataset: {str(e)}")
+        raise
+
+def put_json(key, data):
+    """Write a small JSON document (manifest) to the dataset bucket"""
+    s3 = get_s3_client()
+    bucket_name = get_bucket_name(s3)
+    s3.put_object(
+        Bucket=bucket_name,
+        Key=key,
+        Body=serializer.dumpb(data),
+        ContentType='application/json'
+    )
+    return bucket_name
+
+def get_json(key):
+    """Read a JSON document from the dataset bucket, or None if it does not exist"""
+    from botocore.exceptions import ClientError
+    s3 = get_s3_client()
+    try:
+        response = s3.get_object(Bucket=get_bucket_name(s3), Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            return None
+        raise
+    return serializer.loads(response['Body'].read())
@@ -0,0 +1,393 @@
+"""Typed JSON schemas, an alternative to string field descriptors.
+
+A schema lists columns with an explicit type:
+
+    {"columns": [
+        {"name": "id", "type": "prefix", "prefix": "ID", "length": 6, "unique": true},
+        {"name": "status", "type": "choice", "options": ["active", "inactive"], "weights": [0.8, 0.2]},
+        {"name": "age", "type": "int", "min": 18, "max": 90, "distribution": "normal", "mean": 40, "stddev": 12},
+        {"name": "score", "type": "float", "min": 0, "max": 1, "decimals": 3},
+        {"name": "verified", "type": "bool", "probability": 0.3},
+        {"name": "signup", "type": "date", "start": "2020-01-01", "end": "2024-12-31"},
+        {"name": "full_name", "type": "faker", "provider": "name", "null_rate": 0.05}
+    ]}
+
+validate_schema() checks the whole schema before anything is generated and
+raises SchemaError naming the offending column. Each column becomes a
+canonical JSON string that stands in for a field descriptor everywhere
+(plan caches, shard payloads, job manifests); compile_field recognises the
+leading "{" and compiles it with compile_column.
+"""
+import json
+import random
+import re
+from datetime import date, datetime, timedelta
+
+from faker import Faker
+
+from . import columnar, native, unique
+from .faker_generator import (
+    CompiledField, FAKER_VALUE_TYPES, PREFIX_ALPHABETS, _choice_field, _prefix_field, get_fake, native_field,
+    provider_method, with_unique,
+)
+
+COLUMN_TYPES = ("faker", "choice", "prefix", "int", "float", "bool", "date", "datetime")
+# Column types only valid within a multi-table schema (see relational.py)
+RELATION_TYPES = ("reference",)
+DISTRIBUTIONS = ("uniform", "normal")
+
+# Keys every column may carry, plus the ones specific to each type
+COMMON_KEYS = {"name", "type", "null_rate"}
+TYPE_KEYS = {
+    "faker": {"provider", "args"},
+    "choice": {"options", "weights"},
+    "prefix": {"prefix", "length", "alphabet", "unique"},
+    "int": {"min", "max", "distribution", "mean", "stddev", "unique"},
+    "float": {"min", "max", "distribution", "mean", "stddev", "decimals"},
+    "bool": {"probability"},
+    "date": {"start", "end"},
+    "datetime": {"start", "end"},
+    "reference": {"table", "column", "per_parent"},
+}
+
+NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class SchemaError(ValueError):
+    """A schema that cannot be compiled; the message names the column"""
+
+
+def _number(column, key, default=None):
+    value = column.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise SchemaError(f"Column '{column['name']}': '{key}' must be a number")
+    return value
+
+
+def _integer(column, key, default=None):
+    value = column.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise SchemaError(f"Column '{column['name']}': '{key}' must be an integer")
+    return value
+
+
+def _check_column(column, position, types=COLUMN_TYPES):
+    if not isinstance(column, dict):
+        raise SchemaError(f"Column {position} must be an object")
+    name = column.get("name")
+    if not isinstance(name, str) or not NAME_PATTERN.match(name):
+        raise SchemaError(f"Column {position}: 'name' must be an identifier")
+    column_type = column.get("type")
+    if column_type not in types:
+        raise SchemaError(f"Column '{name}': 'type' must be one of {', '.join(types)}")
+    unknown = set(column) - COMMON_KEYS - TYPE_KEYS[column_type]
+    if unknown:
+        raise SchemaError(f"Column '{name}': unknown keys for type {column_type}: {', '.join(sorted(unknown))}")
+    null_rate = _number(column, "null_rate", 0)
+    if not 0 <= null_rate < 1:
+        raise SchemaError(f"Column '{name}': 'null_rate' must be in [0, 1)")
+    if column.get("distribution", "uniform") not in DISTRIBUTIONS:
+        raise SchemaError(f"Column '{name}': 'distribution' must be one of {', '.join(DISTRIBUTIONS)}")
+    if column.get("unique", False) not in (True, False):
+        raise SchemaError(f"Column '{name}': 'unique' must be true or false")
+    if column.get("unique") and (null_rate or column.get("distribution", "uniform") != "uniform"):
+        raise SchemaError(f"Column '{name}': unique columns cannot have a 'null_rate' or a normal 'distribution'")
+
+
+def load_schema(schema):
+    """A schema as a dict; JSON text is parsed"""
+    if isinstance(schema, str):
+        try:
+            return json.loads(schema)
+        except ValueError as e:
+            raise SchemaError(f"Schema is not valid JSON: {str(e)}")
+    return schema
+
+
+def canonical_column(column):
+    """The descriptor string of a column: its JSON with sorted keys and no whitespace"""
+    return json.dumps(column, sort_keys=True, separators=(",", ":"))
+
+
+def validate_schema(schema):
+    """
+    Validate a schema (dict, or its JSON text) and return its columns as
+    canonical descriptor strings. Every column is compiled and sampled once,
+    so bad provider arguments are reported here too.
+    """
+    schema = load_schema(schema)
+    columns = schema.get("columns") if isinstance(schema, dict) else None
+    if not isinstance(columns, list) or not columns:
+        raise SchemaError("Schema must have a non-empty 'columns' list")
+    return validate_columns(columns)
+
+
+def validate_columns(columns, resolve_reference=None):
+    """
+    Validate a list of columns and return their descriptor strings.
+    resolve_reference(column), when given, allows reference columns and
+    returns the column dict to store for one; they are not sampled.
+    """
+    types = COLUMN_TYPES + RELATION_TYPES if resolve_reference else COLUMN_TYPES
+    # Columns are sampled with their own Faker, so validation never touches the shared one
+    faker = Faker()
+    fields = []
+    names = set()
+    for position, column in enumerate(columns):
+        _check_column(column, position, types)
+        if column["name"] in names:
+            raise SchemaError(f"Column '{column['name']}' is defined twice")
+        names.add(column["name"])
+        if column["type"] in RELATION_TYPES:
+            fields.append(canonical_column(resolve_reference(column)))
+            continue
+        field = compile_column(column, faker)
+        try:
+            field.generate(random.Random(0))
+        except Exception as e:
+            raise SchemaError(f"Column '{column['name']}': {str(e)}")
+        fields.append(canonical_column(column))
+    return fields
+
+
+def is_column_descriptor(field_str):
+    return field_str.startswith("{")
+
+
+def compile_column(column, faker=None):
+    """Compile one column (dict or canonical JSON string) into a CompiledField"""
+    if isinstance(column, str):
+        column = json.loads(column)
+    field = _COMPILERS[column["type"]](column, faker or get_fake())
+    null_rate = column.get("null_rate", 0)
+    return _with_nulls(field, null_rate) if null_rate else field
+
+
+def _with_nulls(field, null_rate):
+    generate, build_column = field.generate, field.build_column
+
+    def generate_nullable(rnd):
+        return None if rnd.random() < null_rate else generate(rnd)
+
+    def build_nullable(size, rng):
+        # The mask has its own stream, so the nulls of a short block are a prefix of a full block's
+        mask_rng = columnar.default_rng(int(rng.integers(0, 2 ** 63)))
+        values = build_column(size, rng)
+        for index in (mask_rng.random(size) < null_rate).nonzero()[0].tolist():
+            values[index] = None
+        return values
+
+    field.generate = generate_nullable
+    field.build_column = build_nullable if build_column is not None else None
+    return field
+
+
+def _faker_column(column, faker):
+    name, provider = column["name"], column.get("provider")
+    method = provider_method(faker, provider)
+    if method is None:
+        raise SchemaError(f"Column '{name}': unknown Faker provider {provider!r}")
+    args = column.get("args", [])
+    if isinstance(args, dict):
+        generate = lambda rnd: method(**args)
+    elif isinstance(args, list):
+        generate = lambda rnd: method(*args)
+    else:
+        raise SchemaError(f"Column '{name}': 'args' must be a list or an object")
+    positional, kwargs = ([], args) if isinstance(args, dict) else (args, {})
+    build_column = native.native_builder(faker, provider, positional, kwargs)
+    if build_column is not None:
+        return native_field(name, provider, generate, build_column, args, FAKER_VALUE_TYPES.get(provider, "str"))
+    return CompiledField(name, "faker", generate, args=args, value_type=FAKER_VALUE_TYPES.get(provider, "str"))
+
+
+def _choice_column(column, faker):
+    name, options, weights = column["name"], column.get("options"), column.get("weights")
+    if not isinstance(options, list) or not options:
+        raise SchemaError(f"Column '{name}': 'options' must be a non-empty list")
+    value_type = _options_type(name, options)
+    if value_type == "float":
+        options = [float(option) for option in options]
+    if weights is None:
+        field = _choice_field(name, options)
+        field.value_type = value_type
+        return field
+    if (not isinstance(weights, list) or len(weights) != len(options)
+            or any(isinstance(w, bool) or not isinstance(w, (int, float)) or w < 0 for w in weights)
+            or not sum(weights)):
+        raise SchemaError(f"Column '{name}': 'weights' must be one non-negative number per option")
+    total = float(sum(weights))
+    probabilities = [weight / total for weight in weights]
+
+    def generate(rnd):
+        return rnd.choices(options, probabilities)[0]
+
+    def build_column(size, rng):
+        indices = rng.choice(len(options), size, p=probabilities)
+        return columnar.np.asarray(options, dtype=object)[indices].tolist()
+
+    return CompiledField(name, "choice", generate, build_column if columnar.HAS_NUMPY else None,
+                         options=options, value_type=value_type)
+
+
+def _options_type(name, options):
+    """value_type of a choice column: strings are a category, numbers and booleans keep their type"""
+    if all(isinstance(option, str) for option in options):
+        return "category"
+    if all(isinstance(option, bool) for option in options):
+        return "bool"
+    if all(isinstance(option, int) and not isinstance(option, bool) for option in options):
+        return "int"
+    if all(isinstance(option, (int, float)) and not isinstance(option, bool) for option in options):
+        return "float"
+    raise SchemaError(f"Column '{name}': 'options' must be all strings, all numbers or all booleans")
+
+
+def _prefix_column(column, faker):
+    name = column["name"]
+    prefix = column.get("prefix", "")
+    length = _integer(column, "length")
+    alphabet = column.get("alphabet", "int")
+    if not isinstance(prefix, str) or length < 0 or alphabet not in PREFIX_ALPHABETS:
+        raise SchemaError(
+            f"Column '{name}': needs a string 'prefix', a 'length' >= 0 and an 'alphabet' of {', '.join(PREFIX_ALPHABETS)}"
+        )
+    options = [prefix, str(length), alphabet] + (["unique"] if column.get("unique") else [])
+    return _prefix_field(name, options)
+
+
+def _bounds(column, number):
+    low, high = number(column, "min", 0), number(column, "max", 100)
+    if low > high:
+        raise SchemaError(f"Column '{column['name']}': 'min' must not exceed 'max'")
+    return low, high
+
+
+def _normal_parameters(column, low, high):
+    mean = _number(column, "mean", (low + high) / 2)
+    stddev = _number(column, "stddev", (high - low) / 6 or 1)
+    if stddev <= 0:
+        raise SchemaError(f"Column '{column['name']}': 'stddev' must be positive")
+    return mean, stddev
+
+
+def _int_column(column, faker):
+    low, high = _bounds(column, _integer)
+    if column.get("distribution", "uniform") == "normal":
+        mean, stddev = _normal_parameters(column, low, high)
+
+        def generate(rnd):
+            return min(max(round(rnd.gauss(mean, stddev)), low), high)
+
+        def build_column(size, rng):
+            return columnar.np.clip(columnar.np.rint(rng.normal(mean, stddev, size)), low, high).astype("int64").tolist()
+    else:
+        def generate(rnd):
+            return rnd.randint(low, high)
+
+        def build_column(size, rng):
+            return rng.integers(low, high + 1, size).tolist()
+
+    field = CompiledField(column["name"], "int", generate, build_column if columnar.HAS_NUMPY else None, value_type="int")
+    if column.get("unique"):
+        return with_unique(field, unique.integer_space(low, high))
+    return field
+
+
+def _float_column(column, faker):
+    low, high = _bounds(column, _number)
+    decimals = column.get("decimals")
+    if decimals is not None:
+        decimals = _integer(column, "decimals")
+    if column.get("distribution", "uniform") == "normal":
+        mean, stddev = _normal_parameters(column, low, high)
+        draw = lambda rnd: min(max(rnd.gauss(mean, stddev), low), high)
+        draw_column = lambda size, rng: columnar.np.clip(rng.normal(mean, stddev, size), low, high)
+    else:
+        draw = lambda rnd: rnd.uniform(low, high)
+        draw_column = lambda size, rng: rng.uniform(low, high, size)
+
+    def generate(rnd):
+        value = draw(rnd)
+        return round(value, decimals) if decimals is not None else value
+
+    def build_column(size, rng):
+        values = draw_column(size, rng)
+        return (columnar.np.round(values, decimals) if decimals is not None else values).tolist()
+
+    return CompiledField(column["name"], "float", generate, build_column if columnar.HAS_NUMPY else None, value_type="float")
+
+
+def _bool_column(column, faker):
+    probability = _number(column, "probability", 0.5)
+    if not 0 <= probability <= 1:
+        raise SchemaError(f"Column '{column['name']}': 'probability' must be in [0, 1]")
+
+    def generate(rnd):
+        return rnd.random() < probability
+
+    def build_column(size, rng):
+        return (rng.random(size) < probability).tolist()
+
+    return CompiledField(column["name"], "bool", generate, build_column if columnar.HAS_NUMPY else None, value_type="bool")
+
+
+def _parse_instant(column, key, default, parse):
+    value = column.get(key, default)
+    try:
+        return parse(value)
+    except (TypeError, ValueError):
+        raise SchemaError(f"Column '{column['name']}': '{key}' must be an ISO 8601 string")
+
+
+def _date_column(column, faker):
+    start = _parse_instant(column, "start", None, date.fromisoformat).toordinal()
+    end = _parse_instant(column, "end", None, date.fromisoformat).toordinal()
+    if start > end:
+        raise SchemaError(f"Column '{column['name']}': 'start' must not be after 'end'")
+
+    def generate(rnd):
+        return date.fromordinal(rnd.randint(start, end))
+
+    def build_column(size, rng):
+        return [date.fromordinal(ordinal) for ordinal in rng.integers(start, end + 1, size).tolist()]
+
+    return CompiledField(column["name"], "date", generate, build_column if columnar.HAS_NUMPY else None, value_type="date")
+
+
+def _datetime_column(column, faker):
+    start = _parse_instant(column, "start", None, datetime.fromisoformat)
+    end = _parse_instant(column, "end", None, datetime.fromisoformat)
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        raise SchemaError(f"Column '{column['name']}': 'start' and 'end' must both have a UTC offset or neither")
+    span = int((end - start).total_seconds())
+    if span < 0:
+        raise SchemaError(f"Column '{column['name']}': 'start' must not be after 'end'")
+
+    def generate(rnd):
+        return start + timedelta(seconds=rnd.randint(0, span))
+
+    def build_column(size, rng):
+        return [start + timedelta(seconds=offset) for offset in rng.integers(0, span + 1, size).tolist()]
+
+    return CompiledField(column["name"], "datetime", generate, build_column if columnar.HAS_NUMPY else None,
+                         value_type="datetime")
+
+
+def _reference_column(column, faker):
+    # Imported here: relational validates tables with this module
+    from .relational import reference_field
+    return reference_field(column)
+
+
+_COMPILERS = {
+    "faker": _faker_column,
+    "choice": _choice_column,
+    "prefix": _prefix_column,
+    "int": _int_column,
+    "float": _float_column,
+    "bool": _bool_column,
+    "date": _date_column,
+    "datetime": _datetime_column,
+    "reference": _reference_column,
+}
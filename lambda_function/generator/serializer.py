@@ -0,0 +1,98 @@
+"""JSON serialization with an optional fast backend.
+
+orjson is used when it is installed (JSON_BACKEND=auto, the default) and the
+standard library otherwise. Both backends give the same values: dates and
+datetimes as ISO 8601 and other unsupported objects (Decimal, UUID) through
+str(), unless a call passes its own default. Whitespace may differ - orjson
+writes compact JSON, and only supports 2-space indentation - and orjson
+writes non-ASCII characters as UTF-8 instead of \\u escapes.
+"""
+import json
+import os
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+BACKENDS = ("orjson", "json")
+
+# Value types whose Python objects have no native JSON representation
+STRINGIFIED_TYPES = ("date", "datetime")
+
+
+def json_default(obj):
+    """Fallback for objects json cannot encode: ISO 8601 for dates, str() for the rest"""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _select_backend(name):
+    name = (name or "auto").lower()
+    if name == "auto":
+        return "orjson" if HAS_ORJSON else "json"
+    if name not in BACKENDS or (name == "orjson" and not HAS_ORJSON):
+        raise ValueError(f"Unsupported JSON backend '{name}'")
+    return name
+
+
+backend = _select_backend(os.environ.get("JSON_BACKEND"))
+
+
+def set_backend(name):
+    """Switch backend ("auto", "orjson" or "json"); returns the previous one"""
+    global backend
+    previous, backend = backend, _select_backend(name)
+    return previous
+
+
+def dumpb(obj, indent=None, compact=False, default=json_default):
+    """Serialize obj to UTF-8 JSON bytes"""
+    if backend == "orjson" and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if default is not json_default and default is not None:
+            # Callers with their own default expect it to see dates too
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=option)
+    return _stdlib_dumps(obj, indent, compact, default).encode("utf-8")
+
+
+def dumps(obj, indent=None, compact=False, default=json_default):
+    """Serialize obj to a JSON string"""
+    if backend == "orjson" and indent in (None, 2):
+        return dumpb(obj, indent, compact, default).decode("utf-8")
+    return _stdlib_dumps(obj, indent, compact, default)
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    if backend == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj, indent, compact, default):
+    separators = (",", ":") if compact else None
+    return json.dumps(obj, indent=indent, separators=separators, default=default)
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def stringify_columns(columns, value_types, convert=_isoformat):
+    """
+    Convert the date/datetime columns of a column list to ISO 8601 strings
+    (or with convert) in one pass per column, so encoding rows never falls
+    back to a default callback. Nulls stay None.
+    """
+    return [
+        [None if value is None else convert(value) for value in column] if value_type in STRINGIFIED_TYPES else column
+        for column, value_type in zip(columns, value_types)
+    ]
@@ -0,0 +1,184 @@
+"""SQL export: batched multi-row INSERTs per dialect, and PostgreSQL COPY.
+
+Rows arrive as chunks of columns, like the Arrow writers. Each column gets
+a renderer picked once from its value_type and dialect, a chunk is rendered
+column by column with map(), and rows are only joined into text at the end,
+so no value goes through an isinstance() chain.
+"""
+import math
+
+from .formatters import CHUNK_SIZE, _encode_chunks
+
+DIALECTS = ("postgres", "mysql", "sqlite")
+
+# output_format -> mode; all of them are written as .sql files
+SQL_FORMATS = {
+    "sql": "insert",
+    "copy": "copy_text",
+    "copy_csv": "copy_csv",
+}
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 100000
+
+NULL = "NULL"
+
+
+def validate_options(dialect, batch_size, output_format="sql"):
+    """Return (dialect, batch_size) normalised, or raise ValueError"""
+    dialect = (dialect or "postgres").lower()
+    if dialect not in DIALECTS:
+        raise ValueError(f"Unsupported SQL dialect '{dialect}'. Use one of: {', '.join(DIALECTS)}")
+    batch_size = DEFAULT_BATCH_SIZE if batch_size is None else int(batch_size)
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"sql_batch_size must be between 1 and {MAX_BATCH_SIZE}")
+    if SQL_FORMATS.get(output_format.lower(), "insert") != "insert" and dialect != "postgres":
+        raise ValueError("COPY output is only available for the postgres dialect")
+    return dialect, batch_size
+
+
+def quote_identifier(name, dialect):
+    if dialect == "mysql":
+        return "`" + name.replace("`", "``") + "`"
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _nullable(render, null=NULL):
+    def render_nullable(value):
+        return null if value is None else render(value)
+    return render_nullable
+
+
+def _string_literal(dialect):
+    if dialect == "mysql":
+        # MySQL treats backslashes in literals as escapes unless NO_BACKSLASH_ESCAPES is set
+        return lambda value: "'" + str(value).replace("\\", "\\\\").replace("'", "''") + "'"
+    return lambda value: "'" + str(value).replace("'", "''") + "'"
+
+
+def _float_literal(value):
+    return repr(float(value)) if math.isfinite(value) else NULL
+
+
+def _quoted(value):
+    # str() of date is ISO 8601 and of datetime "YYYY-MM-DD HH:MM:SS", which all three dialects parse
+    return "'" + str(value) + "'"
+
+
+def _generic_literal(dialect):
+    string = _string_literal(dialect)
+    boolean = _bool_literal(dialect)
+
+    def render(value):
+        if isinstance(value, bool):
+            return boolean(value)
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            return _float_literal(value)
+        return string(value)
+    return render
+
+
+def _bool_literal(dialect):
+    if dialect == "sqlite":
+        return lambda value: "1" if value else "0"
+    return lambda value: "TRUE" if value else "FALSE"
+
+
+def literal_renderer(value_type, dialect):
+    """Renderer of SQL literals for one column"""
+    if value_type == "int":
+        render = str
+    elif value_type == "float":
+        render = _float_literal
+    elif value_type == "bool":
+        render = _bool_literal(dialect)
+    elif value_type in ("date", "datetime"):
+        render = _quoted
+    elif value_type in ("str", "category"):
+        render = _string_literal(dialect)
+    else:
+        render = _generic_literal(dialect)
+    return _nullable(render)
+
+
+def _copy_text_string(value):
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _copy_csv_string(value):
+    # Quoted so that an empty string stays distinct from an unquoted NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_renderer(value_type, mode):
+    """Renderer of COPY text or CSV fields for one column"""
+    if value_type == "bool":
+        render = lambda value: "t" if value else "f"
+    elif value_type in ("int", "date", "datetime"):
+        render = str
+    elif value_type == "float":
+        render = repr
+    elif mode == "copy_csv":
+        render = _copy_csv_string
+    else:
+        render = _copy_text_string
+    return _nullable(render, "" if mode == "copy_csv" else "\\N")
+
+
+def _render_rows(columns, renderers, separator):
+    rendered = [list(map(render, values)) for render, values in zip(renderers, columns)]
+    return [separator.join(values) for values in zip(*rendered)]
+
+
+def _insert_pieces(column_chunks, plan, table_name, dialect, batch_size):
+    renderers = [literal_renderer(field.value_type, dialect) for field in plan.compiled]
+    column_list = ", ".join(quote_identifier(name, dialect) for name in plan.names)
+    header = f"INSERT INTO {quote_identifier(table_name, dialect)} ({column_list}) VALUES\n  "
+    in_statement = 0
+    for columns in column_chunks:
+        rows = _render_rows(columns, renderers, ", ")
+        position = 0
+        while position < len(rows):
+            take = min(batch_size - in_statement, len(rows) - position)
+            body = ",\n  ".join(f"({row})" for row in rows[position:position + take])
+            yield (header if in_statement == 0 else ",\n  ") + body
+            in_statement += take
+            position += take
+            if in_statement == batch_size:
+                yield ";\n"
+                in_statement = 0
+    if in_statement:
+        yield ";\n"
+
+
+def _copy_pieces(column_chunks, plan, table_name, mode):
+    renderers = [copy_renderer(field.value_type, mode) for field in plan.compiled]
+    column_list = ", ".join(quote_identifier(name, "postgres") for name in plan.names)
+    options = " WITH (FORMAT csv)" if mode == "copy_csv" else ""
+    yield f"COPY {quote_identifier(table_name, 'postgres')} ({column_list}) FROM STDIN{options};\n"
+    separator = "," if mode == "copy_csv" else "\t"
+    for columns in column_chunks:
+        rows = _render_rows(columns, renderers, separator)
+        if rows:
+            yield "\n".join(rows) + "\n"
+    yield "\\.\n"
+
+
+def iter_sql_export(column_chunks, plan, table_name="mock_data", dialect="postgres",
+                    batch_size=DEFAULT_BATCH_SIZE, mode="insert", chunk_size=CHUNK_SIZE):
+    """Stream chunks of columns (in plan order) as SQL, yielding bytes chunks"""
+    if mode == "insert":
+        pieces = _insert_pieces(column_chunks, plan, table_name, dialect, batch_size)
+    else:
+        pieces = _copy_pieces(column_chunks, plan, table_name, mode)
+    return _encode_chunks(pieces, chunk_size)
+
+
+def iter_sql_format(column_chunks, plan, output_format="sql", table_name="mock_data",
+                    dialect="postgres", batch_size=DEFAULT_BATCH_SIZE):
+    """Returns (extension, chunks) like formatters.iter_format"""
+    mode = SQL_FORMATS[output_format.lower()]
+    return "sql", iter_sql_export(column_chunks, plan, table_name, dialect, batch_size, mode)
@@ -0,0 +1,161 @@
+"""Unique columns from a keyed permutation of an id space.
+
+A unique field describes its id space: size distinct values and a mapping
+from an index in [0, size) to a value (digits of a prefix id, a stepped
+integer). Row i of a dataset gets the value of perm(i), where perm is a
+Feistel network keyed by the dataset seed and the field position, cycle-
+walked down to the id space. perm is a bijection, so no two rows share a
+value, without a seen-set and whatever the block, shard or page a row is
+generated in. A dataset can have at most size rows.
+"""
+import math
+from functools import lru_cache
+
+from . import columnar
+
+np = columnar.np
+
+# Largest id space a permutation covers; bigger spaces (long prefix ids)
+# use their first MAX_ID_SPACE values
+MAX_ID_SPACE = 1 << 62
+
+ROUNDS = 6
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class IdSpace:
+    """size distinct values; values(indices) maps indices in [0, size) to them"""
+    __slots__ = ("size", "values")
+
+    def __init__(self, size, values):
+        self.size = min(size, MAX_ID_SPACE)
+        self.values = values
+
+
+def integer_space(low, high, step=1):
+    """low, low + step, ... up to high"""
+    count = (high - low) // step + 1 if high >= low else 0
+
+    def values(indices):
+        if np is not None:
+            return (np.asarray(indices, dtype=np.int64) * step + low).tolist()
+        return [low + index * step for index in indices]
+    return IdSpace(count, values)
+
+
+def string_space(prefix, alphabet, length):
+    """prefix followed by length characters of alphabet, i.e. index written in base len(alphabet)"""
+    base = len(alphabet)
+
+    def values(indices):
+        if np is None or not prefix.isascii():
+            return [prefix + _digits(index, alphabet, length) for index in indices]
+        width = len(prefix) + length
+        if width == 0:
+            return [""] * len(indices)
+        table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+        remaining = np.asarray(indices, dtype=np.uint64)
+        matrix = np.empty((len(remaining), width), dtype=np.uint8)
+        matrix[:, :len(prefix)] = np.frombuffer(prefix.encode("ascii"), dtype=np.uint8)
+        for column in range(width - 1, len(prefix) - 1, -1):
+            matrix[:, column] = table[remaining % np.uint64(base)]
+            remaining //= np.uint64(base)
+        return matrix.view(f"S{width}").ravel().astype(f"U{width}").tolist()
+    return IdSpace(base ** length, values)
+
+
+def _digits(index, alphabet, length):
+    digits = []
+    for _ in range(length):
+        index, digit = divmod(index, len(alphabet))
+        digits.append(alphabet[digit])
+    return "".join(reversed(digits))
+
+
+class Permutation:
+    """A keyed bijection of [0, size), a Feistel network with cycle-walking"""
+
+    def __init__(self, size, key):
+        from .faker_generator import derive_seed
+        self.size = size
+        bits = max((size - 1).bit_length(), 2)
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.keys = [derive_seed(key, "feistel", round_index) & self.mask for round_index in range(ROUNDS)]
+
+    def _encrypt_int(self, value):
+        half, mask = self.half, self.mask
+        left, right = value >> half, value & mask
+        for key in self.keys:
+            mixed = (((right ^ key) * _MULTIPLIER) & _MASK64) >> (64 - half)
+            left, right = right, left ^ mixed
+        return (left << half) | right
+
+    def _encrypt_array(self, values):
+        half = np.uint64(self.half)
+        mask = np.uint64(self.mask)
+        shift = np.uint64(64 - self.half)
+        multiplier = np.uint64(_MULTIPLIER)
+        left, right = values >> half, values & mask
+        for key in self.keys:
+            # uint64 products wrap around, which is the mod 2**64 the mixing wants
+            mixed = ((right ^ np.uint64(key)) * multiplier) >> shift
+            left, right = right, left ^ mixed
+        return (left << half) | right
+
+    def __call__(self, indices):
+        """perm(i) for each index; indices must lie in [0, size)"""
+        if np is None:
+            result = []
+            for index in indices:
+                self._check(index)
+                value = self._encrypt_int(index)
+                while value >= self.size:
+                    value = self._encrypt_int(value)
+                result.append(value)
+            return result
+        values = np.asarray(indices, dtype=np.uint64)
+        if len(values):
+            self._check(int(values.max()))
+        with np.errstate(over="ignore"):
+            values = self._encrypt_array(values)
+            # Cycle-walking: re-encrypt values that fell outside the id space
+            outside = values >= np.uint64(self.size)
+            while outside.any():
+                values[outside] = self._encrypt_array(values[outside])
+                outside = values >= np.uint64(self.size)
+        return values
+
+    def _check(self, index):
+        if not 0 <= index < self.size:
+            raise ValueError(f"Row {index} is outside the {self.size} distinct values of a unique field")
+
+
+@lru_cache(maxsize=64)
+def permutation(size, key):
+    return Permutation(size, key)
+
+
+def column_builder(id_space, key, first_row=0):
+    """build(size, rnd, rng) for rows first_row.. of a unique field, as used by SchemaPlan builders"""
+    def build(size, rnd=None, rng=None):
+        return id_space.values(permutation(id_space.size, key)(range(first_row, first_row + size)))
+    return build
+
+
+def capacity(plan):
+    """Most rows a dataset of plan can have, or math.inf without unique fields"""
+    return min((field.id_space.size for field in plan.compiled if field.id_space is not None), default=math.inf)
+
+
+def validate_size(id_space, name, rows):
+    if rows > id_space.size:
+        raise ValueError(f"{rows} rows exceed the {id_space.size} distinct values of unique field '{name}'")
+
+
+def validate(plan, rows):
+    """Reject datasets of more rows than some unique field has distinct values"""
+    for field in plan.compiled:
+        if field.id_space is not None:
+            validate_size(field.id_space, field.name, rows)
@@ -0,0 +1,69 @@
+"""Cold-start handling: a controlled init phase and SnapStart hooks.
+
+init() runs while the handler module is imported, in Lambda's init phase.
+It creates the shared Faker and calls the providers of WARM_FIELDS once, so
+lazily loaded provider data is resolved before the first request instead of
+during it. boto3 and pyarrow stay unimported until a request needs them.
+
+With SnapStart (snapshot_restore_py is available), the bulk-path imports are
+done before the snapshot is taken as well, and every restored instance
+reseeds its random state so instances restored from one snapshot do not
+generate identical data.
+"""
+import logging
+import os
+
+from .faker_generator import compile_fields, get_fake, reseed
+from .s3_uploader import reset_s3_client
+
+try:
+    from snapshot_restore_py import register_before_snapshot, register_after_restore
+except ImportError:  # pragma: no cover - only available on SnapStart runtimes
+    register_before_snapshot = register_after_restore = None
+
+logger = logging.getLogger()
+
+# Fields warmed when WARM_FIELDS is not set; set it to an empty string to skip warm-up
+DEFAULT_WARM_FIELDS = "name,first_name,last_name,email,address,company,phone_number,date_of_birth,random_int,ean13"
+
+
+def warm_fields():
+    """Fields to warm up, from WARM_FIELDS (comma-separated)"""
+    value = os.environ.get("WARM_FIELDS", DEFAULT_WARM_FIELDS)
+    return [field.strip() for field in value.split(",") if field.strip()]
+
+
+def warm_up(fields):
+    """Create the shared Faker and generate one value per field so provider lookups and data are resolved"""
+    get_fake()
+    for field in fields:
+        try:
+            compile_fields([field]).generate_row()
+        except Exception as e:
+            logger.warning(f"Could not warm up field {field}: {str(e)}")
+
+
+def prime_imports():
+    """Import what bulk requests need, so a snapshot already contains it"""
+    import boto3  # noqa: F401
+    from .arrow_formats import HAS_PYARROW, _load_pyarrow
+    if HAS_PYARROW:
+        _load_pyarrow()
+
+
+def before_snapshot():
+    prime_imports()
+
+
+def after_restore():
+    reseed()
+    # Connections in a snapshot belong to another execution environment
+    reset_s3_client()
+
+
+def init(fields=None):
+    """Warm up the given fields (default warm_fields()) and register SnapStart hooks when available"""
+    warm_up(warm_fields() if fields is None else fields)
+    if register_before_snapshot is not None:
+        register_before_snapshot(before_snapshot)
+        register_after_restore(after_restore)
@@ -1,9 +1,11 @@
+import base64
 import json
+import math
 import os
 import sys
+import time
 import logging
 from pathlib import Path
-from datetime import date, datetime
 
 # Add current directory to path for generator imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -11,24 +13,68 @@ sys.path.insert(0, str(Path(__file__).parent))
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-from generator.faker_generator import generate_row, generate_chunk
-from generator.s3_uploader import create_unique_bucket_and_upload
+from generator.faker_generator import generate_row, generate_chunk, generate_range, new_seed, compile_fields
+from generator.parallel import iter_parallel_batches, default_workers
+from generator.formatters import iter_format_batches
+from generator.arrow_formats import COLUMNAR_FORMATS, iter_columnar_format
+from generator.s3_uploader import upload_dataset, dataset_prefix, put_json, validate_upload_settings
+from generator.compression import CODECS, compress_bytes, negotiate, validate_codec
+from generator.response_cache import ResponseCache, PoolRegistry
+from generator.metrics import Metrics
+from generator.schema import SchemaError, validate_schema
+from generator import jobs, fanout, pagination, pools, relational, serializer, sql_export, unique, warmup
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (date, datetime)):
-            return obj.isoformat()
-        return str(obj)
+# Init phase: resolve Faker providers before the first request (see generator/warmup.py)
+warmup.init()
+
+# Responses smaller than this are returned uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+# Maximum rows * columns returned by /data and /page
+MAX_DATA_POINTS = 200
+
+# Rows per /page response when no limit is given
+DEFAULT_PAGE_LIMIT = 20
+
+# Default bulk pool_size; 0 leaves pool mode off unless a request asks for it
+VALUE_POOL_SIZE = int(os.environ.get('VALUE_POOL_SIZE', 0))
+
+# Serialized /data bodies of seeded requests, kept across warm invocations
+response_cache = ResponseCache(int(os.environ.get('DATA_CACHE_BYTES', 8 * 1024 * 1024)))
+
+# Unseeded /data requests are served from ring buffers of this many
+# pre-generated rows per field list when DATA_POOL_SIZE is set (0 disables)
+DATA_POOL_SIZE = int(os.environ.get('DATA_POOL_SIZE', 0))
+row_pools = PoolRegistry(generate_chunk, DATA_POOL_SIZE, int(os.environ.get('DATA_POOL_SCHEMAS', 32)))
 
 def lambda_handler(event, context):
+    # Worker invocations are not HTTP requests: errors must propagate so the
+    # invoker sees a FunctionError instead of an HTTP-style 500 body
+    if 'httpMethod' not in event:
+        # Asynchronous bulk jobs carry only a job id
+        if 'job_id' in event:
+            return run_job(event['job_id'])
+        # Fanned-out bulk datasets carry one shard
+        if 'shard' in event:
+            return run_shard(event['shard'])
+    
     try:
         # Parse the HTTP method and path
         http_method = event.get('httpMethod', 'GET')
         path = event.get('path', '/')
         
+        # Job status does not take fields
+        if '/jobs/' in path:
+            job_id = (event.get('pathParameters') or {}).get('id') or path.rstrip('/').rsplit('/', 1)[-1]
+            return handle_job_status(job_id)
+        
         # Parse query parameters and body
         query_params = event.get('queryStringParameters') or {}
+        headers = event.get('headers') or {}
         body = event.get('body')
+        if body and event.get('isBase64Encoded'):
+            # API Gateway base64-encodes bodies when binary media types are enabled
+            body = base64.b64decode(body)
         if body:
             try:
                 body = json.loads(body)
@@ -45,6 +91,30 @@ def lambda_handler(event, context):
             fields = re.split(r',(?![^\[\(]*[\]\)])', fields)
             fields = [f.strip() for f in fields if f.strip()]
         
+        # A typed schema replaces the field descriptors and is validated before generating
+        schema = query_params.get('schema') or body.get('schema')
+        tables = None
+        if schema:
+            try:
+                if relational.is_relational(schema):
+                    tables = relational.validate_tables(schema)
+                else:
+                    fields = validate_schema(schema)
+            except SchemaError as e:
+                return {
+                    'statusCode': 400,
+                    'body': json.dumps({'error': str(e)})
+                }
+        
+        # Several tables linked by foreign keys are only written to S3
+        if tables is not None:
+            if path == '/bulk' or path.endswith('/bulk'):
+                return handle_bulk_data([], query_params, body, tables)
+            return {
+                'statusCode': 400,
+                'body': json.dumps({'error': 'Multi-table schemas are only supported by /bulk'})
+            }
+        
         if not fields:
             return {
                 'statusCode': 400,
@@ -53,9 +123,11 @@ def lambda_handler(event, context):
         
         # Route to appropriate endpoint
         if path == '/data' or path.endswith('/data'):
-            return handle_single_row(fields, query_params, body)
+            return handle_single_row(fields, query_params, body, headers)
         elif path == '/bulk' or path.endswith('/bulk'):
             return handle_bulk_data(fields, query_params, body)
+        elif path == '/page' or path.endswith('/page'):
+            return handle_page(fields, query_params, body, headers)
         else:
             return {
                 'statusCode': 404,
@@ -68,66 +140,507 @@ def lambda_handler(event, context):
             'body': json.dumps({'error': str(e)})
         }
 
-def handle_single_row(fields, query_params, body):
+def get_header(headers, name):
+    """Case-insensitive header lookup"""
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+def compress_response(response, headers):
+    """Compress the body if the client accepts gzip/zstd, base64-encoding it for API Gateway"""
+    codec = negotiate(get_header(headers, 'accept-encoding'))
+    body = response['body'].encode('utf-8')
+    if codec is None or len(body) < MIN_COMPRESS_BYTES:
+        return response
+    response['body'] = base64.b64encode(compress_bytes(body, codec)).decode('ascii')
+    response['isBase64Encoded'] = True
+    response['headers'] = {
+        **response.get('headers', {}),
+        'Content-Encoding': CODECS[codec][1],
+        'Vary': 'Accept-Encoding'
+    }
+    return response
+
+def handle_single_row(fields, query_params, body, headers=None):
     """Return mock data with configurable rows and columns (max 200 data points)"""
-    # Get rows parameter
-    rows = int(query_params.get('rows') or body.get('rows', 1))
+    try:
+        rows, seed = parse_data_params(query_params, body)
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': str(e)})
+        }
     columns = len(fields)
     
     # Validate data point limit (rows * columns <= 200)
     total_data_points = rows * columns
-    if total_data_points > 200:
+    if total_data_points > MAX_DATA_POINTS:
         return {
             'statusCode': 400,
             'body': json.dumps({
-                'error': f'Total data points ({total_data_points}) exceeds limit of 200. '
+                'error': f'Total data points ({total_data_points}) exceeds limit of {MAX_DATA_POINTS}. '
                         f'Reduce rows ({rows}) or columns ({columns}).'
             })
         }
     
+    try:
+        plan = compile_fields(fields)
+        unique.validate(plan, rows)
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': str(e)})
+        }
+    
     # Generate data
-    if rows == 1:
-        # Single row - return as object
-        data = generate_row(fields)
+    if seed is not None:
+        # Seeded - the first rows of the reproducible dataset for this seed.
+        # Rows of fields relative to today change at midnight, so the date is part of the key
+        key = (tuple(fields), rows, seed, pagination.today_key(fields))
+        payload = response_cache.get(key)
+        cache_status = 'HIT' if payload is not None else 'MISS'
+        if payload is None:
+            data = generate_range(fields, seed, 0, rows)
+            payload = serializer.dumps(data[0] if rows == 1 else data)
+            response_cache.put(key, payload)
+        emit_cache_metrics(cache_status)
+        response_headers = {'Content-Type': 'application/json', 'X-Cache': cache_status}
+    elif 0 < rows <= DATA_POOL_SIZE and unique.capacity(plan) == math.inf:
+        # Unseeded with pools enabled - ready-made rows from the ring buffer.
+        # Larger requests would wrap around it and repeat rows within one
+        # response, and pools would repeat values of unique columns
+        payload = row_pools.get(fields).body(rows, as_object=rows == 1)
+        response_headers = {'Content-Type': 'application/json'}
     else:
-        # Multiple rows - return as array
-        data = generate_chunk(fields, rows)
+        if rows == 1:
+            # Single row - return as object
+            data = generate_row(fields)
+        else:
+            # Multiple rows - return as array
+            data = generate_chunk(fields, rows)
+        payload = serializer.dumps(data)
+        response_headers = {'Content-Type': 'application/json'}
     
-    return {
+    return compress_response({
         'statusCode': 200,
-        'headers': {'Content-Type': 'application/json'},
-        'body': json.dumps(data, cls=CustomJSONEncoder)
+        'headers': response_headers,
+        'body': payload
+    }, headers)
+
+def parse_data_params(query_params, body):
+    """(rows, seed) of a /data request, seed None when not given; raises ValueError for invalid values"""
+    rows = first_given(query_params.get('rows'), body.get('rows'), 1)
+    seed = first_given(query_params.get('seed'), body.get('seed'))
+    try:
+        rows = int(rows)
+    except (TypeError, ValueError):
+        raise ValueError(f"rows must be an integer, got {rows!r}")
+    if rows < 1:
+        raise ValueError("rows must be at least 1")
+    try:
+        seed = int(seed) if seed is not None else None
+    except (TypeError, ValueError):
+        raise ValueError(f"seed must be an integer, got {seed!r}")
+    return rows, seed
+
+def emit_cache_metrics(cache_status):
+    """One EMF record per seeded /data request with its response cache outcome and the cache size"""
+    metrics = Metrics('/data')
+    metrics.count('cache_hits', int(cache_status == 'HIT'))
+    metrics.count('cache_misses', int(cache_status == 'MISS'))
+    metrics.count('cache_bytes', response_cache.stats()['bytes'])
+    metrics.emit()
+
+def handle_page(fields, query_params, body, headers=None):
+    """
+    Return rows offset..offset+limit of the virtual dataset (fields, seed),
+    generated on demand. Pages carry cursors to their neighbours and an ETag
+    derived from (fields, seed, offset, limit).
+    """
+    try:
+        cursor = query_params.get('cursor') or body.get('cursor')
+        if cursor:
+            seed, offset, limit = pagination.decode_cursor(cursor, fields)
+        else:
+            seed = int(query_params.get('seed') or body.get('seed') or 0)
+            offset = int(query_params.get('offset') or body.get('offset') or 0)
+            limit = int(query_params.get('limit') or body.get('limit') or DEFAULT_PAGE_LIMIT)
+        if offset < 0 or limit < 1:
+            raise ValueError('offset must be >= 0 and limit >= 1')
+        if limit * len(fields) > MAX_DATA_POINTS:
+            raise ValueError(f'Total data points ({limit * len(fields)}) exceeds limit of {MAX_DATA_POINTS}. '
+                             f'Reduce limit ({limit}) or columns ({len(fields)}).')
+        # Pages past the last id of a unique field do not exist
+        plan = compile_fields(fields)
+        unique.validate(plan, offset + limit)
+        capacity = unique.capacity(plan)
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': str(e)})
+        }
+    
+    etag = pagination.page_etag(fields, seed, offset, limit)
+    cache_headers = {
+        'ETag': etag,
+        # Not immutable: pages of fields relative to today change at midnight
+        'Cache-Control': pagination.cache_control(fields)
+    }
+    if pagination.etag_matches(get_header(headers, 'if-none-match'), etag):
+        return {'statusCode': 304, 'headers': cache_headers, 'body': ''}
+    
+    previous_offset = max(offset - limit, 0)
+    page = {
+        'rows': generate_range(fields, seed, offset, offset + limit),
+        'seed': seed,
+        'offset': offset,
+        'limit': limit,
+        'next_cursor': pagination.encode_cursor(fields, seed, offset + limit, limit) if offset + limit < capacity else None,
+        'prev_cursor': pagination.encode_cursor(fields, seed, previous_offset, limit) if offset > 0 else None
+    }
+    return compress_response({
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json', **cache_headers},
+        'body': serializer.dumps(page)
+    }, headers)
+
+def as_bool(value):
+    return value is True or str(value).lower() in ('true', '1', 'yes')
+
+def parse_debug(value):
+    """debug flag: False, True, or 'memory' to trace allocations as well"""
+    if str(value).lower() == 'memory':
+        return 'memory'
+    return as_bool(value)
+
+def first_given(*values):
+    """The first value that is not None or empty, so an explicit 0 is kept"""
+    return next((value for value in values if value is not None and value != ''), None)
+
+def parse_bulk_params(query_params, body):
+    """Read /bulk parameters into a JSON-serialisable dict; raises ValueError for invalid values"""
+    seed = query_params.get('seed') or body.get('seed')
+    params = {
+        'size': int(query_params.get('size') or body.get('size', 100)),
+        'dataset_id': query_params.get('dataset_id') or body.get('dataset_id', 'mock_dataset'),
+        'workers': int(first_given(query_params.get('workers'), body.get('workers'), default_workers())),
+        'seed': int(seed) if seed is not None else new_seed(),
+        'output_format': query_params.get('output_format') or body.get('output_format', 'json'),
+        'table_name': query_params.get('table_name') or body.get('table_name', 'mock_data'),
+        'compression': validate_codec(query_params.get('compression') or body.get('compression')),
+        'shards': int(query_params.get('shards') or body.get('shards') or 1),
+        'debug': parse_debug(query_params.get('debug') or body.get('debug')),
     }
+    if params['workers'] < 1:
+        raise ValueError("workers must be at least 1")
+    # One process per CPU at most; more only adds start-up and memory
+    params['workers'] = min(params['workers'], default_workers())
+    if not 1 <= params['shards'] <= fanout.MAX_SHARDS:
+        raise ValueError(f"shards must be between 1 and {fanout.MAX_SHARDS}")
+    params['sql_dialect'], params['sql_batch_size'] = sql_export.validate_options(
+        query_params.get('sql_dialect') or body.get('sql_dialect'),
+        query_params.get('sql_batch_size') or body.get('sql_batch_size'),
+        params['output_format']
+    )
+    params['part_size'], params['upload_concurrency'] = validate_upload_settings(
+        query_params.get('part_size_mb') or body.get('part_size_mb'),
+        query_params.get('upload_concurrency') or body.get('upload_concurrency')
+    )
+    
+    unique_columns = query_params.get('pool_unique') or body.get('pool_unique') or []
+    if isinstance(unique_columns, str):
+        unique_columns = [name.strip() for name in unique_columns.split(',') if name.strip()]
+    config = pools.pool_config(
+        query_params.get('pool_size') or body.get('pool_size') or VALUE_POOL_SIZE,
+        query_params.get('pool_refresh') or body.get('pool_refresh'),
+        unique_columns
+    )
+    params['pool'] = config._asdict() if config else None
+    return params
+
+def pool_settings(params):
+    """The PoolConfig of a bulk request, or None when pool mode is off"""
+    pool = params.get('pool')
+    return pools.PoolConfig(pool['size'], pool['refresh'], tuple(pool['unique'])) if pool else None
+
+def _counted(batches, counter):
+    for batch in batches:
+        counter['rows_written'] += len(batch)
+        yield batch
+
+def write_dataset(fields, params, start=0, stop=None, key=None, progress=None, metrics=None):
+    """
+    Generate rows start..stop of a dataset and stream them to S3. progress,
+    if given, is called with rows_written/parts_uploaded/bytes_uploaded as
+    parts are sent; metrics, if given, receives the time spent generating,
+    assembling, serializing, compressing and uploading.
+    Returns (bucket_name, s3_key, stats).
+    """
+    metrics = metrics or Metrics('/bulk')
+    stop = params['size'] if stop is None else stop
+    output_format = params['output_format'].lower()
+    plan = compile_fields(fields)
+    counter = {'rows_written': 0}
+
+    def report(upload_progress):
+        if progress:
+            progress({**counter, **upload_progress})
+
+    # Stream row batches through the formatter into a multipart upload
+    logger.info(f"Generating rows {start}-{stop} with {len(fields)} fields as {output_format}")
+    batches = iter_parallel_batches(fields, stop, params['seed'], params['workers'], start=start, pools=pool_settings(params))
+    batches = _counted(metrics.timed_iter('generate', batches), counter)
+    if output_format in COLUMNAR_FORMATS:
+        extension, chunks = iter_columnar_format((batch.columns for batch in batches), plan, output_format)
+    elif output_format in sql_export.SQL_FORMATS:
+        # Literals are rendered a column at a time by renderers picked from the value types
+        extension, chunks = sql_export.iter_sql_format(
+            (batch.columns for batch in batches), plan, output_format, params['table_name'],
+            params.get('sql_dialect', 'postgres'), params.get('sql_batch_size', sql_export.DEFAULT_BATCH_SIZE)
+        )
+    else:
+        if output_format in ('json', 'compact_json'):
+            # Dates are converted a column at a time instead of one default() call per value
+            value_types = [field.value_type for field in plan.compiled]
+            batches = metrics.timed_iter('assemble', (
+                batch.with_columns(serializer.stringify_columns(batch.columns, value_types)) for batch in batches
+            ))
+        extension, chunks = iter_format_batches(batches, output_format)
+    chunks = metrics.timed_iter('serialize', chunks, bytes_counter='bytes_serialized')
+    with metrics.stage('upload'):
+        bucket_name, s3_key, stats = upload_dataset(
+            chunks, params['dataset_id'], extension, params['compression'], report, key, metrics,
+            params.get('part_size'), params.get('upload_concurrency')
+        )
+    report({'parts_uploaded': stats['parts'], 'bytes_uploaded': stats['bytes']})
+    metrics.count('rows', counter['rows_written'])
+    metrics.count('bytes_uploaded', stats['bytes'])
+    metrics.count('parts', stats['parts'])
+    return bucket_name, s3_key, stats
+
+def run_fanout(fields, params, metrics=None, prefix=None):
+    """Coordinator: dispatch every shard to a worker, then publish the dataset manifest"""
+    metrics = metrics or Metrics('/bulk')
+    prefix = prefix or dataset_prefix(params['dataset_id'])
+    payloads = fanout.shard_payloads(fields, params, prefix, params['shards'])
+    logger.info(f"Dispatching {len(payloads)} shards for {params['size']} rows")
+    with metrics.stage('dispatch'):
+        results = fanout.get_dispatcher()(payloads)
+    manifest = fanout.build_manifest(params, prefix, results)
+    bucket_name = put_json(fanout.manifest_key(prefix), manifest)
+    return bucket_name, fanout.manifest_key(prefix), manifest
+
+def run_shard(shard):
+    """Worker entry point: write one shard of a fanned-out dataset as its own part file"""
+    metrics = Metrics('shard')
+    metrics.set(dataset_id=shard['params']['dataset_id'], shard=shard['index'])
+    bucket_name, s3_key, stats = write_dataset(
+        shard['fields'], shard['params'], shard['start'], shard['stop'], shard['key'], metrics=metrics
+    )
+    metrics.finish()
+    metrics.emit()
+    return {
+        'index': shard['index'],
+        'key': s3_key,
+        'start': shard['start'],
+        'stop': shard['stop'],
+        'rows': shard['stop'] - shard['start'],
+        'bytes': stats['bytes'],
+    }
+
+def run_tables(params, progress=None, metrics=None):
+    """
+    Write every table of a multi-table dataset (params['tables'], see
+    relational.bind_tables) to its own object, parents first, then publish
+    a manifest listing them. Returns (bucket_name, manifest_key, manifest).
+    """
+    metrics = metrics or Metrics('/bulk')
+    prefix = dataset_prefix(params['dataset_id'])
+    done = {'rows_written': 0, 'parts_uploaded': 0, 'bytes_uploaded': 0}
+    results = []
+
+    def report(upload_progress):
+        # Progress of the table being written, on top of the finished ones
+        progress({name: done[name] + upload_progress.get(name, 0) for name in done})
+
+    for table in params['tables']:
+        # Each table is an ordinary dataset with its own seed, size and SQL table name
+        table_params = {key: value for key, value in params.items() if key != 'tables'}
+        table_params.update(size=table['size'], seed=table['seed'], table_name=table['name'])
+        key = f"{prefix}/{table['name']}"
+        if params['shards'] > 1:
+            bucket_name, table_key, manifest = run_fanout(table['fields'], table_params, metrics, key)
+            table_bytes = manifest['bytes']
+        else:
+            bucket_name, table_key, stats = write_dataset(
+                table['fields'], table_params, key=key, progress=report if progress else None, metrics=metrics
+            )
+            table_bytes = stats['bytes']
+            done['parts_uploaded'] += stats['parts']
+        done['rows_written'] += table['size']
+        done['bytes_uploaded'] += table_bytes
+        results.append({'name': table['name'], 'rows': table['size'], 'key': table_key, 'bytes': table_bytes})
+        if progress:
+            progress(dict(done))
+    manifest = relational.build_manifest(params, prefix, results)
+    bucket_name = put_json(fanout.manifest_key(prefix), manifest)
+    return bucket_name, fanout.manifest_key(prefix), manifest
+
+def run_bulk(fields, params, progress=None, metrics=None):
+    """
+    Generate a bulk dataset, on this invocation or fanned out over shards.
+    Emits the request metrics and returns the result summary, with the
+    metrics under 'debug' when params['debug'] is set.
+    """
+    metrics = metrics or Metrics('/bulk')
+    metrics.set(dataset_id=params['dataset_id'], output_format=params['output_format'], shards=params['shards'])
+    if params.get('debug'):
+        with metrics.stage('profile'):
+            metrics.profile_fields(fields or [field for table in params.get('tables') or [] for field in table['fields']])
+    if params.get('debug') == 'memory':
+        # Started after profiling: tracing slows Faker down several times over
+        metrics.start_tracing()
+    result = {
+        'message': f"Generated {params['size']} rows",
+        'records_count': params['size'],
+        'compression': params['compression'],
+        'seed': params['seed']
+    }
+    try:
+        if params.get('tables'):
+            bucket_name, manifest_key, manifest = run_tables(params, progress, metrics)
+            result.update(
+                s3_location=f's3://{bucket_name}/{manifest_key}',
+                bucket_name=bucket_name,
+                bytes_uploaded=manifest['bytes'],
+                tables=[{'name': table['name'], 'rows': table['rows'], 's3_location': f"s3://{bucket_name}/{table['key']}"}
+                        for table in manifest['tables']]
+            )
+        elif params['shards'] > 1:
+            bucket_name, manifest_key, manifest = run_fanout(fields, params, metrics)
+            if progress:
+                progress({'rows_written': params['size'], 'parts_uploaded': len(manifest['parts']),
+                          'bytes_uploaded': manifest['bytes']})
+            result.update(
+                s3_location=f's3://{bucket_name}/{manifest_key}',
+                bucket_name=bucket_name,
+                bytes_uploaded=manifest['bytes'],
+                parts=[f"s3://{bucket_name}/{part['key']}" for part in manifest['parts']]
+            )
+        else:
+            bucket_name, s3_key, stats = write_dataset(fields, params, progress=progress, metrics=metrics)
+            result.update(
+                s3_location=f's3://{bucket_name}/{s3_key}',
+                bucket_name=bucket_name,
+                bytes_uploaded=stats['bytes']
+            )
+    finally:
+        # Failed requests are reported too, with the stages they reached
+        figures = metrics.finish()
+        metrics.emit()
+    if params.get('debug'):
+        result['debug'] = figures
+    return result
 
-def handle_bulk_data(fields, query_params, body):
-    """Generate bulk data and save to S3"""
-    # Get parameters
-    size = int(query_params.get('size') or body.get('size', 100))
-    dataset_id = query_params.get('dataset_id') or body.get('dataset_id', 'mock_dataset')
+def handle_bulk_data(fields, query_params, body, tables=None):
+    """
+    Generate bulk data and save to S3, or submit it as an asynchronous job.
+    tables, the validated tables of a multi-table schema, replaces fields.
+    """
+    try:
+        params = parse_bulk_params(query_params, body)
+        metrics = Metrics('/bulk')
+        with metrics.stage('parse'):
+            if tables:
+                if params['pool'] and params['pool']['unique']:
+                    raise ValueError('pool_unique is not supported with multi-table schemas')
+                # Fixes the size of every table sized by its parent for this seed
+                params['tables'] = relational.bind_tables(tables, params['seed'])
+                params['size'] = sum(table['size'] for table in params['tables'])
+            else:
+                plan = compile_fields(fields)
+                unique.validate(plan, params['size'])
+                if params['pool']:
+                    pools.validate(pool_settings(params), plan, params['size'])
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': str(e)})
+        }
     
-    logger.info(f"Bulk request: size={size}, dataset_id={dataset_id}")
+    logger.info(f"Bulk request: size={params['size']}, dataset_id={params['dataset_id']}, "
+                f"workers={params['workers']}, seed={params['seed']}")
     
     try:
-        # Generate data
-        logger.info(f"Generating {size} rows with {len(fields)} fields")
-        data = generate_chunk(fields, size)
-        
-        # Create unique bucket and upload to S3
-        bucket_name, s3_key = create_unique_bucket_and_upload(data, dataset_id, 'bulk')
+        if as_bool(query_params.get('async') or body.get('async')):
+            manifest = jobs.submit_job(fields, params)
+            return {
+                'statusCode': 202,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({
+                    'job_id': manifest['job_id'],
+                    'status': manifest['status'],
+                    'status_url': f"/jobs/{manifest['job_id']}",
+                    'seed': params['seed']
+                })
+            }
         
         return {
             'statusCode': 200,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'message': f'Generated {size} rows',
-                's3_location': f's3://{bucket_name}/{s3_key}',
-                'bucket_name': bucket_name,
-                'records_count': len(data)
-            })
+            'body': serializer.dumps(run_bulk(fields, params, metrics=metrics))
         }
     except Exception as e:
         logger.error(f"Error in bulk data generation: {str(e)}")
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
-        }
\ No newline at end of file
+        }
+
+def run_job(job_id):
+    """Worker entry point: run a submitted bulk job, recording progress in its manifest"""
+    manifest = jobs.load_manifest(job_id)
+    if manifest is None:
+        logger.error(f"Job {job_id} not found")
+        return {'job_id': job_id, 'status': 'not_found'}
+    if manifest['status'] == 'completed':
+        # Asynchronous invocations can be retried; never redo finished work
+        return manifest
+    
+    manifest.update(status='running', started_at=jobs.now_iso())
+    jobs.save_manifest(manifest)
+    started = time.monotonic()
+    try:
+        result = run_bulk(manifest['fields'], manifest['params'], jobs.JobProgress(manifest), Metrics('/jobs'))
+        manifest.update(
+            status='completed',
+            s3_location=result['s3_location'],
+            rows_written=result['records_count'],
+            bytes_uploaded=result['bytes_uploaded'],
+        )
+        if 'debug' in result:
+            manifest['debug'] = result['debug']
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {str(e)}")
+        manifest.update(status='failed', error=str(e))
+    elapsed = time.monotonic() - started
+    manifest['duration_seconds'] = round(elapsed, 3)
+    if elapsed > 0:
+        manifest['rows_per_second'] = round(manifest['rows_written'] / elapsed, 1)
+    jobs.save_manifest(manifest)
+    return manifest
+
+def handle_job_status(job_id):
+    """Report the manifest of an asynchronous bulk job"""
+    manifest = jobs.load_manifest(job_id)
+    if manifest is None:
+        return {
+            'statusCode': 404,
+            'body': json.dumps({'error': f'Job {job_id} not found'})
+        }
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': serializer.dumps(manifest)
+    }
@@ -2,7 +2,9 @@
 import json
 import os
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -10,9 +12,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from moto import mock_aws
 import boto3
 from lambda_function.lambda_function import lambda_handler
+from lambda_function import lambda_function as handler_module
 
 # Set environment variable for S3 bucket (optional)
 os.environ['S3_BUCKET'] = 'test-bucket'
+os.environ['BUCKET_NAME'] = 'test-bucket'
+os.environ.setdefault('AWS_DEFAULT_REGION', 'eu-central-1')
+
+def create_test_bucket():
+    """Create the configured bucket inside the active moto mock"""
+    boto3.client('s3').create_bucket(
+        Bucket='test-bucket',
+        CreateBucketConfiguration={'LocationConstraint': os.environ['AWS_DEFAULT_REGION']}
+    )
 
 def test_single_endpoint():
     """Test /data endpoint with multiple rows"""
@@ -38,6 +50,7 @@ def test_single_endpoint():
 @mock_aws
 def test_bulk_endpoint():
     """Test /bulk endpoint with mock S3"""
+    create_test_bucket()
     event = {
         'httpMethod': 'POST',
         'path': '/bulk',
@@ -56,6 +69,484 @@ def test_bulk_endpoint():
     assert data['records_count'] == 5
     print("✓ Bulk endpoint created S3 file with correct record count")
 
+@mock_aws
+def test_bulk_endpoint_parquet():
+    """Test /bulk endpoint writes a Parquet object with typed columns"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    create_test_bucket()
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({
+            'size': 50,
+            'dataset_id': 'parquet_dataset',
+            'output_format': 'parquet',
+            'fields': ['name', 'status[active,inactive]', 'random_int(min=1,max=10)']
+        })
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    data = json.loads(response['body'])
+    assert data['s3_location'].startswith('s3://test-bucket/parquet_dataset/')
+    assert data['s3_location'].endswith('/parquet_dataset.parquet')
+    key = data['s3_location'][len('s3://test-bucket/'):]
+    body = boto3.client('s3').get_object(Bucket='test-bucket', Key=key)['Body'].read()
+    table = pq.read_table(pa.BufferReader(body))
+    assert table.num_rows == 50
+    assert table.schema.field('random_int').type == pa.int64()
+    print("✓ Bulk endpoint wrote Parquet with typed columns")
+
+def test_single_endpoint_gzip():
+    """Test /data endpoint compresses large responses when the client accepts gzip"""
+    import base64
+    import gzip
+
+    event = {
+        'httpMethod': 'GET',
+        'path': '/data',
+        'headers': {'Accept-Encoding': 'gzip, deflate'},
+        'queryStringParameters': {
+            'fields': 'name,email,company,address',
+            'rows': '50'
+        }
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    assert response['isBase64Encoded'] is True
+    assert response['headers']['Content-Encoding'] == 'gzip'
+    data = json.loads(gzip.decompress(base64.b64decode(response['body'])))
+    assert len(data) == 50
+    print("✓ Large /data response gzip-compressed for Accept-Encoding: gzip")
+
+@mock_aws
+def test_bulk_endpoint_compressed():
+    """Test /bulk endpoint uploads a gzip object with ContentEncoding set"""
+    import gzip
+
+    create_test_bucket()
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({
+            'size': 200,
+            'dataset_id': 'packed_dataset',
+            'output_format': 'csv',
+            'compression': 'gzip',
+            'fields': ['name', 'status[active,inactive]']
+        })
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    data = json.loads(response['body'])
+    assert data['s3_location'].endswith('/packed_dataset.csv.gz')
+    key = data['s3_location'][len('s3://test-bucket/'):]
+    obj = boto3.client('s3').get_object(Bucket='test-bucket', Key=key)
+    assert obj['ContentEncoding'] == 'gzip'
+    lines = gzip.decompress(obj['Body'].read()).decode('utf-8').splitlines()
+    assert lines[0] == 'name,status'
+    assert len(lines) == 201
+    print("✓ Bulk endpoint uploaded gzip-compressed CSV")
+
+def test_bulk_endpoint_invalid_compression():
+    """Test /bulk endpoint rejects unknown compression codecs"""
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({'size': 5, 'compression': 'rar', 'fields': ['name']})
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 400
+    assert 'Unsupported compression' in json.loads(response['body'])['error']
+    print("✓ Unknown compression rejected with 400")
+
+def test_bulk_endpoint_workers():
+    """Test /bulk rejects worker counts below 1 and caps the rest at the CPU count"""
+    event = {'httpMethod': 'POST', 'path': '/bulk', 'body': json.dumps({'size': 5, 'workers': 0, 'fields': ['name']})}
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 400
+    assert 'workers' in json.loads(response['body'])['error']
+    
+    params = handler_module.parse_bulk_params({'workers': '10000'}, {})
+    assert params['workers'] == handler_module.default_workers()
+    print("✓ Bulk worker count validated and capped")
+
+@mock_aws
+def test_async_bulk_job():
+    """Test async /bulk returns a job id and /jobs/{id} reports completion"""
+    create_test_bucket()
+    invocations = []
+
+    def fake_invoker(payload):
+        # Stands in for the asynchronous self-invocation
+        invocations.append(payload)
+        lambda_handler(payload, None)
+
+    handler_module.jobs.set_invoker(fake_invoker)
+    try:
+        event = {
+            'httpMethod': 'POST',
+            'path': '/bulk',
+            'body': json.dumps({
+                'size': 30,
+                'async': True,
+                'dataset_id': 'async_dataset',
+                'fields': ['name', 'status[active,inactive]']
+            })
+        }
+        response = lambda_handler(event, {})
+        assert response['statusCode'] == 202
+        data = json.loads(response['body'])
+        assert invocations == [{'job_id': data['job_id']}]
+        assert data['status_url'] == f"/jobs/{data['job_id']}"
+
+        status = lambda_handler({'httpMethod': 'GET', 'path': data['status_url']}, {})
+        assert status['statusCode'] == 200
+        manifest = json.loads(status['body'])
+        assert manifest['status'] == 'completed'
+        assert manifest['rows_written'] == 30
+        assert manifest['parts_uploaded'] == 1
+        assert manifest['s3_location'].endswith('/async_dataset.json')
+        assert 'rows_per_second' in manifest
+    finally:
+        handler_module.jobs.set_invoker(None)
+    print("✓ Async bulk job completed and reported via /jobs/{id}")
+
+@mock_aws
+def test_job_status_not_found():
+    """Test /jobs/{id} returns 404 for unknown jobs"""
+    create_test_bucket()
+    response = lambda_handler({'httpMethod': 'GET', 'path': '/jobs/' + '0' * 32}, {})
+    assert response['statusCode'] == 404
+    print("✓ Unknown job returns 404")
+
+@mock_aws
+def test_bulk_fanout():
+    """Test /bulk with shards writes part files and a manifest matching a single run"""
+    create_test_bucket()
+    s3 = boto3.client('s3')
+    fields = ['status[active,inactive]', 'customer_id[ID,6,int]', 'random_int(min=1,max=100)']
+    handler_module.fanout.set_dispatcher(
+        handler_module.fanout.LocalDispatcher(lambda payload: lambda_handler(payload, None))
+    )
+    try:
+        event = {
+            'httpMethod': 'POST',
+            'path': '/bulk',
+            'body': json.dumps({'size': 5000, 'shards': 3, 'seed': 11, 'dataset_id': 'fanned', 'fields': fields})
+        }
+        response = lambda_handler(event, {})
+        assert response['statusCode'] == 200
+        data = json.loads(response['body'])
+        assert data['s3_location'].startswith('s3://test-bucket/fanned/')
+        assert data['s3_location'].endswith('/manifest.json')
+        manifest_key = data['s3_location'][len('s3://test-bucket/'):]
+        manifest = json.loads(s3.get_object(Bucket='test-bucket', Key=manifest_key)['Body'].read())
+        assert len(manifest['parts']) == 3
+        assert sum(part['rows'] for part in manifest['parts']) == 5000
+
+        sharded_rows = []
+        for part in manifest['parts']:
+            sharded_rows.extend(json.loads(s3.get_object(Bucket='test-bucket', Key=part['key'])['Body'].read()))
+    finally:
+        handler_module.fanout.set_dispatcher(None)
+
+    single = json.loads(lambda_handler({
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({'size': 5000, 'seed': 11, 'dataset_id': 'single', 'fields': fields})
+    }, {})['body'])
+    single_key = single['s3_location'][len('s3://test-bucket/'):]
+    assert json.loads(s3.get_object(Bucket='test-bucket', Key=single_key)['Body'].read()) == sharded_rows
+    print(f"✓ Fan-out wrote {len(manifest['parts'])} parts identical to a single run")
+
+@mock_aws
+def test_bulk_pooled():
+    """Test /bulk in pool mode with a unique pooled column"""
+    create_test_bucket()
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({
+            'size': 300, 'seed': 4, 'pool_size': 300, 'pool_unique': 'name',
+            'dataset_id': 'pooled', 'fields': ['name', 'company']
+        })
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    key = json.loads(response['body'])['s3_location'][len('s3://test-bucket/'):]
+    rows = json.loads(boto3.client('s3').get_object(Bucket='test-bucket', Key=key)['Body'].read())
+    assert len({row['name'] for row in rows}) == 300
+    
+    # A unique column cannot be larger than its pool
+    event['body'] = json.dumps({'size': 301, 'pool_size': 300, 'pool_unique': 'name', 'fields': ['name']})
+    assert lambda_handler(event, {})['statusCode'] == 400
+    print("✓ Pool mode keeps unique columns distinct")
+
+@mock_aws
+def test_bulk_sql_copy():
+    """Test /bulk writes a PostgreSQL COPY script, and rejects COPY for other dialects"""
+    create_test_bucket()
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({
+            'size': 1500, 'seed': 5, 'workers': 1, 'output_format': 'copy', 'table_name': 'machines',
+            'fields': ['random_int', 'machine_type[sewing,printer]']
+        })
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    key = json.loads(response['body'])['s3_location'][len('s3://test-bucket/'):]
+    assert key.endswith('.sql')
+    lines = boto3.client('s3').get_object(Bucket='test-bucket', Key=key)['Body'].read().decode().splitlines()
+    assert lines[0] == 'COPY "machines" ("random_int", "machine_type") FROM STDIN;'
+    assert len(lines) == 1502 and lines[-1] == '\\.'
+    
+    event['body'] = json.dumps({'size': 10, 'output_format': 'copy', 'sql_dialect': 'mysql', 'fields': ['name']})
+    assert lambda_handler(event, {})['statusCode'] == 400
+    print("✓ Bulk COPY export works")
+
+@mock_aws
+def test_bulk_multi_table():
+    """Test /bulk writes each table of a multi-table schema with valid foreign keys, sharded or not"""
+    create_test_bucket()
+    s3 = boto3.client('s3')
+    schema = {'tables': [
+        {'name': 'customers', 'size': 1500, 'columns': [
+            {'name': 'id', 'type': 'prefix', 'prefix': 'C', 'length': 6, 'unique': True},
+            {'name': 'name', 'type': 'faker', 'provider': 'name'}]},
+        {'name': 'orders', 'columns': [
+            {'name': 'id', 'type': 'int', 'min': 1, 'max': 10 ** 9, 'unique': True},
+            {'name': 'customer_id', 'type': 'reference', 'table': 'customers', 'column': 'id',
+             'per_parent': {'min': 1, 'max': 4}}]}
+    ]}
+    
+    def read_tables(body):
+        response = lambda_handler({'httpMethod': 'POST', 'path': '/bulk', 'body': json.dumps(body)}, {})
+        assert response['statusCode'] == 200
+        data = json.loads(response['body'])
+        assert data['s3_location'].endswith('/manifest.json')
+        tables = {}
+        for table in data['tables']:
+            key = table['s3_location'][len('s3://test-bucket/'):]
+            if key.endswith('manifest.json'):
+                parts = json.loads(s3.get_object(Bucket='test-bucket', Key=key)['Body'].read())['parts']
+                keys = [part['key'] for part in parts]
+            else:
+                keys = [key]
+            tables[table['name']] = [row for key in keys
+                                     for row in json.loads(s3.get_object(Bucket='test-bucket', Key=key)['Body'].read())]
+            assert len(tables[table['name']]) == table['rows']
+        assert data['records_count'] == sum(len(rows) for rows in tables.values())
+        return tables
+    
+    tables = read_tables({'schema': schema, 'seed': 3, 'workers': 1, 'dataset_id': 'shop'})
+    customer_ids = [row['id'] for row in tables['customers']]
+    assert len(set(customer_ids)) == 1500
+    orders_per_customer = {}
+    for order in tables['orders']:
+        orders_per_customer[order['customer_id']] = orders_per_customer.get(order['customer_id'], 0) + 1
+    assert set(orders_per_customer) == set(customer_ids)
+    assert min(orders_per_customer.values()) >= 1 and max(orders_per_customer.values()) <= 4
+    
+    handler_module.fanout.set_dispatcher(
+        handler_module.fanout.LocalDispatcher(lambda payload: lambda_handler(payload, None))
+    )
+    try:
+        sharded = read_tables({'schema': schema, 'seed': 3, 'shards': 2, 'dataset_id': 'shop_sharded'})
+    finally:
+        handler_module.fanout.set_dispatcher(None)
+    assert sharded == tables
+    
+    # Multi-table schemas only go to S3
+    event = {'httpMethod': 'GET', 'path': '/data', 'queryStringParameters': {'schema': json.dumps(schema)}}
+    assert lambda_handler(event, {})['statusCode'] == 400
+    print(f"✓ Multi-table bulk wrote {len(tables['orders'])} orders for {len(customer_ids)} customers")
+
+@mock_aws
+def test_bulk_debug():
+    """Test /bulk returns stage timings and a per-field breakdown with debug=true"""
+    create_test_bucket()
+    event = {
+        'httpMethod': 'POST',
+        'path': '/bulk',
+        'body': json.dumps({
+            'size': 2000, 'workers': 1, 'debug': 'memory', 'compression': 'gzip',
+            'fields': ['random_int', 'status[active,inactive]']
+        })
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    debug = json.loads(response['body'])['debug']
+    for stage in ('parse', 'generate', 'serialize', 'compress', 'upload'):
+        assert stage in debug['stages_ms'], stage
+    assert debug['counters']['rows'] == 2000
+    assert debug['counters']['bytes_serialized'] > debug['counters']['bytes_uploaded']
+    assert 'tracemalloc_peak_mb' in debug
+    assert set(debug['fields']) == {'random_int', 'status[active,inactive]'}
+    print("✓ Debug section reports stages, counters and field costs")
+
+def test_single_endpoint_seeded():
+    """Test /data endpoint returns identical rows for the same seed"""
+    event = {
+        'httpMethod': 'GET',
+        'path': '/data',
+        'queryStringParameters': {
+            'fields': 'name,status[active,inactive],user_id[ID,3,int]',
+            'rows': '5',
+            'seed': '42'
+        }
+    }
+    
+    first = json.loads(lambda_handler(event, {})['body'])
+    second = json.loads(lambda_handler(event, {})['body'])
+    assert len(first) == 5
+    assert first == second
+    print("✓ Seeded /data requests are reproducible")
+
+def test_single_endpoint_cached():
+    """Test seeded /data responses are served from the response cache"""
+    event = {
+        'httpMethod': 'GET',
+        'path': '/data',
+        'queryStringParameters': {
+            'fields': 'name,status[active,inactive]',
+            'rows': '4',
+            'seed': '77'
+        }
+    }
+    
+    handler_module.response_cache.clear()
+    first = lambda_handler(event, {})
+    second = lambda_handler(event, {})
+    assert first['headers']['X-Cache'] == 'MISS'
+    assert second['headers']['X-Cache'] == 'HIT'
+    assert first['body'] == second['body']
+    assert handler_module.response_cache.stats()['hits'] == 1
+    
+    # Rows of fields relative to today are cached for the current day only
+    event['queryStringParameters']['fields'] = 'name,date'
+    assert lambda_handler(event, {})['headers']['X-Cache'] == 'MISS'
+    assert lambda_handler(event, {})['headers']['X-Cache'] == 'HIT'
+    
+    class Tomorrow(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=1)
+    
+    with patch.object(handler_module.pagination, 'datetime', Tomorrow):
+        assert lambda_handler(event, {})['headers']['X-Cache'] == 'MISS'
+    print("✓ Repeated seeded /data requests hit the response cache")
+
+def test_single_endpoint_row_pool():
+    """Test unseeded /data uses the row pool only when it cannot repeat rows within a response"""
+    pool_size, pools = handler_module.DATA_POOL_SIZE, handler_module.row_pools
+    handler_module.DATA_POOL_SIZE = 4
+    handler_module.row_pools = handler_module.PoolRegistry(handler_module.generate_chunk, 4, 8)
+    try:
+        def get(fields, rows):
+            event = {'httpMethod': 'GET', 'path': '/data', 'queryStringParameters': {'fields': fields, 'rows': str(rows)}}
+            response = lambda_handler(event, {})
+            assert response['statusCode'] == 200
+            return json.loads(response['body'])
+        
+        assert len(get('name', 3)) == 3
+        assert len(handler_module.row_pools._pools) == 1
+        # More rows than the pool holds, and unique columns, are generated fresh
+        assert len(get('email', 6)) == 6
+        assert len({row['code'] for row in get('code[C,3,int,unique]', 4)}) == 4
+        assert len(handler_module.row_pools._pools) == 1
+    finally:
+        handler_module.DATA_POOL_SIZE, handler_module.row_pools = pool_size, pools
+    print("✓ Row pool skipped for oversized requests and unique columns")
+
+def test_single_endpoint_schema():
+    """Test /data with a typed schema, and that schema errors are 400s"""
+    schema = {'columns': [
+        {'name': 'id', 'type': 'prefix', 'prefix': 'U', 'length': 4},
+        {'name': 'age', 'type': 'int', 'min': 18, 'max': 30},
+        {'name': 'email', 'type': 'faker', 'provider': 'email', 'null_rate': 0.2}
+    ]}
+    event = {
+        'httpMethod': 'POST',
+        'path': '/data',
+        'body': json.dumps({'schema': schema, 'rows': 5, 'seed': 3})
+    }
+    
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    rows = json.loads(response['body'])
+    assert len(rows) == 5
+    assert all(set(row) == {'id', 'age', 'email'} and 18 <= row['age'] <= 30 for row in rows)
+    
+    schema['columns'][2]['provider'] = 'not_a_provider'
+    event['body'] = json.dumps({'schema': schema, 'rows': 5})
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 400
+    assert 'not_a_provider' in json.loads(response['body'])['error']
+    print("✓ Typed schemas generate typed rows and are validated up front")
+
+def test_unique_fields_limits():
+    """Test requests larger than the id space of a unique field are rejected"""
+    fields = 'code[C,2,int,unique],name'
+    event = {'httpMethod': 'GET', 'path': '/page', 'queryStringParameters': {'fields': fields, 'offset': '80', 'limit': '20'}}
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 200
+    page = json.loads(response['body'])
+    assert len({row['code'] for row in page['rows']}) == 20
+    assert page['next_cursor'] is None
+    
+    event['queryStringParameters']['offset'] = '90'
+    assert lambda_handler(event, {})['statusCode'] == 400
+    
+    event = {'httpMethod': 'POST', 'path': '/bulk', 'body': json.dumps({'size': 101, 'fields': ['code[C,2,int,unique]', 'name']})}
+    response = lambda_handler(event, {})
+    assert response['statusCode'] == 400
+    assert 'unique' in json.loads(response['body'])['error']
+    print("✓ Unique fields reject oversized requests")
+
+def test_page_endpoint():
+    """Test /page endpoint serves consistent slices of a seeded dataset"""
+    fields = 'name,status[active,inactive],user_id[ID,3,int]'
+    def page(params, headers=None):
+        return lambda_handler({
+            'httpMethod': 'GET',
+            'path': '/page',
+            'queryStringParameters': {'fields': fields, **params},
+            'headers': headers or {}
+        }, {})
+    
+    first = page({'seed': '9', 'offset': '0', 'limit': '10'})
+    assert first['statusCode'] == 200
+    assert first['headers']['Cache-Control'].startswith('public')
+    body = json.loads(first['body'])
+    assert len(body['rows']) == 10
+    assert body['prev_cursor'] is None
+    
+    # The next cursor continues exactly where the page ended
+    following = json.loads(page({'cursor': body['next_cursor']})['body'])
+    window = json.loads(page({'seed': '9', 'offset': '5', 'limit': '10'})['body'])
+    assert following['offset'] == 10
+    assert window['rows'] == body['rows'][5:] + following['rows'][:5]
+    
+    # Unchanged pages are revalidated without a body
+    not_modified = page({'seed': '9', 'offset': '0', 'limit': '10'}, {'If-None-Match': first['headers']['ETag']})
+    assert not_modified['statusCode'] == 304
+    assert not_modified['body'] == ''
+    
+    assert page({'seed': '9', 'limit': '100'})['statusCode'] == 400
+    assert page({'cursor': 'garbage'})['statusCode'] == 400
+    print("✓ /page serves cursor-linked, cacheable pages")
+
 def test_single_endpoint_200_limit():
     """Test /data endpoint 200 data point limit"""
     event = {
@@ -111,6 +602,15 @@ def test_single_endpoint_no_rows():
     assert 'email' in data
     print("✓ Default behavior returns single object")
 
+def test_single_endpoint_invalid_params():
+    """Test /data rejects non-integer seeds and row counts below 1 with a 400"""
+    for params in ({'seed': 'abc'}, {'rows': '0'}, {'rows': '-3'}, {'rows': 'many'}):
+        event = {'httpMethod': 'GET', 'path': '/data', 'queryStringParameters': {'fields': 'name', **params}}
+        response = lambda_handler(event, {})
+        assert response['statusCode'] == 400, params
+        assert 'must be' in json.loads(response['body'])['error']
+    print("✓ Invalid /data rows and seeds rejected")
+
 def test_missing_fields():
     """Test error handling for missing fields"""
     event = {
@@ -147,7 +647,26 @@ if __name__ == "__main__":
     test_single_endpoint_200_limit()
     test_single_endpoint_max_data()
     test_single_endpoint_no_rows()
+    test_single_endpoint_invalid_params()
+    test_single_endpoint_gzip()
+    test_single_endpoint_seeded()
+    test_single_endpoint_cached()
+    test_single_endpoint_row_pool()
+    test_single_endpoint_schema()
+    test_page_endpoint()
+    test_unique_fields_limits()
     test_missing_fields()
     test_invalid_endpoint()
     test_bulk_endpoint()
+    test_bulk_endpoint_parquet()
+    test_bulk_endpoint_compressed()
+    test_bulk_endpoint_invalid_compression()
+    test_bulk_endpoint_workers()
+    test_async_bulk_job()
+    test_job_status_not_found()
+    test_bulk_fanout()
+    test_bulk_pooled()
+    test_bulk_sql_copy()
+    test_bulk_multi_table()
+    test_bulk_debug()
     print("Tests completed.")
\ No newline at end of file
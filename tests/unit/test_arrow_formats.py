@@ -0,0 +1,86 @@
+import unittest
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import arrow_formats
+from lambda_function.generator.faker_generator import compile_fields, generate_data
+from lambda_function.generator.parallel import iter_parallel_chunks
+from lambda_function.generator.schema import validate_schema
+
+if arrow_formats.HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+
+
+@unittest.skipUnless(arrow_formats.HAS_PYARROW, "pyarrow not installed")
+class TestArrowFormats(unittest.TestCase):
+
+    FIELDS = [
+        "name",
+        "status[active,inactive]",
+        "customer_id[ID,6,int]",
+        "random_int(min=1,max=100)",
+        "date_of_birth(minimum_age=30,maximum_age=50)",
+    ]
+
+    def test_schema_types_from_descriptors(self):
+        schema = arrow_formats.arrow_schema(compile_fields(self.FIELDS))
+        self.assertEqual(schema.field("name").type, pa.string())
+        self.assertTrue(pa.types.is_dictionary(schema.field("status").type))
+        self.assertEqual(schema.field("customer_id").type, pa.string())
+        self.assertEqual(schema.field("random_int").type, pa.int64())
+        self.assertEqual(schema.field("date_of_birth").type, pa.date32())
+
+    def test_generate_data_parquet(self):
+        result = generate_data(self.FIELDS, 25, "parquet")
+        self.assertIsInstance(result, bytes)
+        table = pq.read_table(pa.BufferReader(result))
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(table.column_names, ["name", "status", "customer_id", "random_int", "date_of_birth"])
+        self.assertIsInstance(table.column("date_of_birth")[0].as_py(), date)
+
+    def test_generate_data_arrow(self):
+        result = generate_data(self.FIELDS, 10, "arrow")
+        table = pa.ipc.open_file(pa.BufferReader(result)).read_all()
+        self.assertEqual(table.num_rows, 10)
+        self.assertTrue(all(1 <= value <= 100 for value in table.column("random_int").to_pylist()))
+
+    def test_row_groups_per_chunk(self):
+        fields = ["status[on,off]", "random_int(min=1,max=9)"]
+        chunks = iter_parallel_chunks(fields, 40000, seed=3, workers=1, as_columns=True)
+        data = b"".join(arrow_formats.iter_arrow(chunks, compile_fields(fields), "parquet"))
+        parquet_file = pq.ParquetFile(pa.BufferReader(data))
+        self.assertEqual(parquet_file.metadata.num_rows, 40000)
+        self.assertGreater(parquet_file.metadata.num_row_groups, 1)
+
+    def test_string_column_converts_non_strings(self):
+        plan = compile_fields(["passport_owner(M)"])
+        table = pq.read_table(pa.BufferReader(arrow_formats.format_as_parquet(plan.generate_column_list(3), plan)))
+        self.assertIsInstance(table.column("passport_owner")[0].as_py(), str)
+
+    def test_choice_columns_keep_the_type_of_their_options(self):
+        fields = validate_schema({"columns": [
+            {"name": "level", "type": "choice", "options": [1, 2, 3]},
+            {"name": "ratio", "type": "choice", "options": [0.5, 1], "weights": [1, 1]},
+            {"name": "status", "type": "choice", "options": ["a", "b"]},
+        ]})
+        plan = compile_fields(fields)
+        table = pq.read_table(pa.BufferReader(arrow_formats.format_as_parquet(plan.generate_column_list(50), plan)))
+        self.assertEqual(table.schema.field("level").type, pa.int64())
+        self.assertEqual(table.schema.field("ratio").type, pa.float64())
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+        self.assertTrue(set(table.column("level").to_pylist()) <= {1, 2, 3})
+
+    def test_incompatible_values_raise(self):
+        plan = compile_fields(["random_int"])
+        with self.assertRaises(ValueError):
+            arrow_formats.format_as_arrow([["not a number"]], plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import columnar
+from lambda_function.generator.faker_generator import SchemaPlan, generate_columns
+
+
+@unittest.skipUnless(columnar.HAS_NUMPY, "numpy not installed")
+class TestColumnar(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = columnar.default_rng(42)
+
+    def test_choice_column(self):
+        result = columnar.choice_column(["a", "b", "c"], 500, self.rng)
+        self.assertEqual(len(result), 500)
+        self.assertEqual(set(result), {"a", "b", "c"})
+        self.assertIsInstance(result[0], str)
+
+    def test_random_string_column_digits(self):
+        result = columnar.random_string_column("0123456789", 8, 100, self.rng, "ORD")
+        self.assertEqual(len(result), 100)
+        for value in result:
+            self.assertIsInstance(value, str)
+            self.assertEqual(len(value), 11)
+            self.assertTrue(value.startswith("ORD"))
+            self.assertTrue(value[3:].isdigit())
+
+    def test_random_string_column_non_ascii_prefix(self):
+        result = columnar.random_string_column("ABC", 3, 10, self.rng, "Ü-")
+        for value in result:
+            self.assertTrue(value.startswith("Ü-"))
+            self.assertEqual(len(value), 5)
+
+    def test_random_string_column_is_reproducible(self):
+        first = columnar.random_string_column("ABC", 5, 10, columnar.default_rng(7))
+        second = columnar.random_string_column("ABC", 5, 10, columnar.default_rng(7))
+        self.assertEqual(first, second)
+
+    def test_plan_columns_match_rows(self):
+        plan = SchemaPlan(["code[TX,4,str]", "status[on,off]", "name"])
+        columns = plan.generate_columns(50, rng=self.rng)
+        self.assertEqual(list(columns), ["code", "status", "name"])
+        self.assertTrue(all(len(values) == 50 for values in columns.values()))
+        self.assertTrue(all(value[2:].isalpha() for value in columns["code"]))
+
+    def test_generate_columns(self):
+        columns = generate_columns(["user_id[ID,3,int]", "status[active,inactive]"], 20)
+        self.assertEqual(len(columns["user_id"]), 20)
+        self.assertTrue(all(value in ("active", "inactive") for value in columns["status"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import gzip
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import compression
+from lambda_function.generator.compression import compress_chunks, compress_bytes, negotiate, validate_codec
+
+
+class TestCompression(unittest.TestCase):
+
+    DATA = b'{"name":"John Smith","status":"active"},' * 2000
+
+    def test_gzip_stream_round_trip(self):
+        chunks = [self.DATA[i:i + 4096] for i in range(0, len(self.DATA), 4096)]
+        compressed = b"".join(compress_chunks(chunks, "gzip"))
+        self.assertEqual(gzip.decompress(compressed), self.DATA)
+        self.assertLess(len(compressed), len(self.DATA) // 5)
+
+    @unittest.skipUnless(compression.zstandard, "zstandard not installed")
+    def test_zstd_round_trip(self):
+        compressed = compress_bytes(self.DATA, "zstd")
+        decompressed = compression.zstandard.ZstdDecompressor().decompressobj().decompress(compressed)
+        self.assertEqual(decompressed, self.DATA)
+
+    def test_validate_codec(self):
+        self.assertEqual(validate_codec("GZIP"), "gzip")
+        self.assertIsNone(validate_codec(None))
+        self.assertIsNone(validate_codec("none"))
+        with self.assertRaises(ValueError):
+            validate_codec("brotli")
+        # Non-string values are an invalid codec too, not a crash
+        for value in (True, 1, ["gzip"]):
+            with self.assertRaises(ValueError):
+                validate_codec(value)
+
+    def test_negotiate(self):
+        self.assertEqual(negotiate("gzip, deflate"), "gzip")
+        self.assertIsNone(negotiate("gzip;q=0, deflate"))
+        self.assertIsNone(negotiate(None))
+        self.assertIsNone(negotiate("br"))
+        if compression.zstandard:
+            self.assertEqual(negotiate("gzip, zstd"), "zstd")
+            self.assertEqual(negotiate("*"), "zstd")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,11 +5,15 @@ import io
 import time
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from lambda_function.generator.faker_generator import generate_row, generate_chunk, generate_data, parse_field
+from lambda_function.generator.faker_generator import (
+    generate_row, generate_chunk, generate_data, parse_field, parse_args, compile_fields, SchemaPlan,
+    generate_range, generate_block, BLOCK_SIZE, FAKER_SUB_BLOCK
+)
 
 
 class TestFakerGenerator(unittest.TestCase):
@@ -181,5 +185,57 @@ class TestFakerGenerator(unittest.TestCase):
         self.assertGreaterEqual(result["random_int"], 1)
         self.assertLessEqual(result["random_int"], 100)
 
+    def test_parse_args(self):
+        positional, kwargs = parse_args(["-30d", "5", "end_date=today", "max=10"])
+        self.assertEqual(positional, ["-30d", 5])
+        self.assertEqual(kwargs, {"end_date": "today", "max": 10})
+
+    def test_compile_fields_is_cached(self):
+        fields = ["name", "status[active,inactive]"]
+        plan = compile_fields(fields)
+        self.assertIs(plan, compile_fields(list(fields)))
+        self.assertEqual(plan.names, ["name", "status"])
+
+    def test_schema_plan_generate_rows(self):
+        plan = SchemaPlan(["user_id[ID,3,int]", "status[on,off]", "nonexistent_field"])
+        rows = plan.generate_rows(20)
+        self.assertEqual(len(rows), 20)
+        for row in rows:
+            self.assertEqual(list(row), ["user_id", "status", "nonexistent_field"])
+            self.assertTrue(row["user_id"][2:].isdigit())
+            self.assertIn(row["status"], ["on", "off"])
+            self.assertIsInstance(row["nonexistent_field"], str)
+
+    def test_generate_range_is_reproducible(self):
+        fields = ["name", "status[a,b,c]", "code[X,5,mixed]"]
+        self.assertEqual(generate_range(fields, 12, 0, 20), generate_range(fields, 12, 0, 20))
+        self.assertNotEqual(generate_range(fields, 12, 0, 20), generate_range(fields, 13, 0, 20))
+
+    def test_generate_range_random_access(self):
+        fields = ["code[X,5,mixed]", "random_int(min=1,max=1000)", "word"]
+        full = generate_range(fields, 5, 0, BLOCK_SIZE * 2 + 50)
+        self.assertEqual(generate_range(fields, 5, BLOCK_SIZE - 3, BLOCK_SIZE + 4), full[BLOCK_SIZE - 3:BLOCK_SIZE + 4])
+        self.assertEqual(generate_range(fields, 5, BLOCK_SIZE * 2 + 10, BLOCK_SIZE * 2 + 11), full[BLOCK_SIZE * 2 + 10:BLOCK_SIZE * 2 + 11])
+
+    def test_short_block_is_prefix_of_full_block(self):
+        fields = ["name", "status[a,b]", "code[X,4,int]"]
+        self.assertEqual(generate_block(fields, 9, 0, 10), generate_block(fields, 9, 0, 40)[:10])
+
+    def test_mid_block_pages_skip_the_block_prefix(self):
+        from faker.providers.job import Provider as JobProvider
+        fields = ["job", "status[x,y]", "serial[S,4,int]"]
+        full = generate_range(fields, 21, 0, BLOCK_SIZE)
+        with patch.object(JobProvider, "job", autospec=True, side_effect=JobProvider.job) as job:
+            # A fresh field list, so its plan binds the patched provider
+            page = generate_range(fields + ["marker[m]"], 21, 1000, 1020)
+        self.assertLessEqual(job.call_count, 20 + 2 * FAKER_SUB_BLOCK)
+        self.assertEqual([{key: row[key] for key in full[0]} for row in page], full[1000:1020])
+
+    def test_generate_range_invalid(self):
+        with self.assertRaises(ValueError):
+            generate_range(["name"], 1, 5, 2)
+        self.assertEqual(generate_range(["name"], 1, 5, 5), [])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import fanout
+from lambda_function.generator.faker_generator import BLOCK_SIZE
+
+
+class TestFanout(unittest.TestCase):
+
+    PARAMS = {
+        'size': BLOCK_SIZE * 5 + 7, 'dataset_id': 'big', 'seed': 3,
+        'output_format': 'csv', 'compression': None, 'workers': 1,
+    }
+
+    def test_shard_ranges_cover_size_on_block_boundaries(self):
+        ranges = fanout.shard_ranges(BLOCK_SIZE * 5 + 7, 3)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], BLOCK_SIZE * 5 + 7)
+        for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(stop, start)
+            self.assertEqual(start % BLOCK_SIZE, 0)
+        self.assertLessEqual(len(ranges), 3)
+
+    def test_shard_ranges_small_size(self):
+        self.assertEqual(fanout.shard_ranges(10, 8), [(0, 10)])
+        self.assertEqual(fanout.shard_ranges(0, 4), [])
+
+    def test_shard_ranges_rejects_invalid_count(self):
+        with self.assertRaises(ValueError):
+            fanout.shard_ranges(100, 0)
+        with self.assertRaises(ValueError):
+            fanout.shard_ranges(100, fanout.MAX_SHARDS + 1)
+
+    def test_shard_payloads(self):
+        payloads = fanout.shard_payloads(["name"], self.PARAMS, "big/2024-01-01", 3)
+        self.assertEqual([p['shard']['index'] for p in payloads], list(range(len(payloads))))
+        self.assertEqual(payloads[1]['shard']['key'], "big/2024-01-01/part-00001")
+        self.assertEqual(payloads[0]['shard']['params'], self.PARAMS)
+
+    def test_local_dispatcher_preserves_order(self):
+        dispatcher = fanout.LocalDispatcher(lambda payload: payload['shard']['index'] * 10, max_workers=4)
+        payloads = [{'shard': {'index': i}} for i in range(6)]
+        self.assertEqual(dispatcher(payloads), [0, 10, 20, 30, 40, 50])
+
+    def test_build_manifest_orders_parts(self):
+        results = [
+            {'index': 1, 'key': 'p/part-00001.csv', 'start': 10, 'stop': 20, 'rows': 10, 'bytes': 5},
+            {'index': 0, 'key': 'p/part-00000.csv', 'start': 0, 'stop': 10, 'rows': 10, 'bytes': 7},
+        ]
+        manifest = fanout.build_manifest(self.PARAMS, "p", results)
+        self.assertEqual([part['index'] for part in manifest['parts']], [0, 1])
+        self.assertEqual(manifest['bytes'], 12)
+        self.assertEqual(manifest['seed'], 3)
+
+
+class TestLambdaDispatcher(unittest.TestCase):
+
+    @patch('boto3.client')
+    def test_invokes_each_shard(self, mock_boto3_client):
+        mock_lambda = MagicMock()
+        mock_lambda.invoke.side_effect = lambda **kwargs: {
+            'Payload': io.BytesIO(json.dumps({'index': json.loads(kwargs['Payload'])['shard']['index']}).encode())
+        }
+        mock_boto3_client.return_value = mock_lambda
+        results = fanout.LambdaDispatcher("mock-fn")([{'shard': {'index': i}} for i in range(3)])
+        self.assertEqual(results, [{'index': 0}, {'index': 1}, {'index': 2}])
+        self.assertEqual(mock_lambda.invoke.call_args[1]['InvocationType'], 'RequestResponse')
+
+    @patch('boto3.client')
+    def test_function_error_raises(self, mock_boto3_client):
+        mock_lambda = MagicMock()
+        mock_lambda.invoke.return_value = {
+            'FunctionError': 'Unhandled',
+            'Payload': io.BytesIO(b'{"errorMessage": "boom"}')
+        }
+        mock_boto3_client.return_value = mock_lambda
+        with self.assertRaises(RuntimeError):
+            fanout.LambdaDispatcher("mock-fn")([{'shard': {'index': 0}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
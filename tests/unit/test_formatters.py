@@ -3,12 +3,19 @@ import json
 import csv
 import io
 import sys
+from datetime import date, datetime
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from lambda_function.generator.formatters import format_as_json, format_as_compact_json, format_as_csv, format_as_sql
+from lambda_function.generator.formatters import (
+    format_as_json, format_as_compact_json, format_as_csv, format_as_sql, iter_json,
+    iter_compact_json, iter_csv, iter_sql, iter_format, iter_json_batches, iter_compact_json_batches,
+    iter_csv_batches, iter_format_batches
+)
+from lambda_function.generator import serializer
+from lambda_function.generator.rows import RowBatch
 
 
 class TestFormatters(unittest.TestCase):
@@ -100,6 +107,93 @@ class TestFormatters(unittest.TestCase):
         result = format_as_json(data, indent=4)
         self.assertIn('    "test"', result)  # 4-space indent
 
+    def test_iter_json_matches_json_dumps(self):
+        data = [{"name": "Eve", "tags": ["a", "b"]}, {"name": "Line\nbreak", "age": 41}]
+        result = b"".join(iter_json(iter(data), chunk_size=10))
+        self.assertEqual(result.decode("utf-8"), json.dumps(data, indent=2))
+
+    def test_iter_json_chunk_size(self):
+        data = ({"id": i} for i in range(500))
+        chunks = list(iter_json(data, chunk_size=100))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in chunks))
+        self.assertEqual(len(json.loads(b"".join(chunks))), 500)
+
+    def test_iter_json_empty(self):
+        self.assertEqual(b"".join(iter_json(iter([]))), b"[]")
+
+    def test_iter_compact_json_matches_format_as_compact_json(self):
+        data = [{"name": "Jane", "status": "inactive"}, {"name": "Joe", "status": "active"}]
+        result = b"".join(iter_compact_json(iter(data), chunk_size=5))
+        self.assertEqual(result.decode("utf-8"), format_as_compact_json(data))
+
+    def test_format_as_json_dates_match_across_backends(self):
+        data = [{"day": date(2024, 1, 2), "at": datetime(2024, 1, 2, 3, 4, 5)}]
+        results = []
+        for backend in serializer.BACKENDS if serializer.HAS_ORJSON else ("json",):
+            previous = serializer.set_backend(backend)
+            try:
+                results.append((format_as_compact_json(data), json.loads(format_as_json(data))))
+            finally:
+                serializer.set_backend(previous)
+        self.assertEqual(results[0][0], b"".join(iter_compact_json(iter(data))).decode("utf-8"))
+        self.assertEqual(results[0][1], [{"day": "2024-01-02", "at": "2024-01-02 03:04:05"}])
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_iter_csv_matches_format_as_csv(self):
+        data = [{"name": "Bob", "age": 30}, {"name": "Alice, Jr", "age": 25}]
+        chunks = list(iter_csv(iter(data), chunk_size=5))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks).decode("utf-8"), format_as_csv(data))
+
+    def test_iter_csv_empty(self):
+        self.assertEqual(list(iter_csv(iter([]))), [])
+
+    def test_iter_sql_single_statement_matches_format_as_sql(self):
+        data = [{"name": "O'Connor", "age": 30}, {"name": "Diana", "age": 25}]
+        result = b"".join(iter_sql(iter(data), "users"))
+        self.assertEqual(result.decode("utf-8"), format_as_sql(data, "users"))
+
+    def test_sql_quotes_dates_and_renders_types(self):
+        data = [{"id": 3, "at": datetime(2020, 1, 6, 19, 0, 56), "day": date(2020, 1, 6), "ok": True, "note": None}]
+        expected = "(3, '2020-01-06 19:00:56', '2020-01-06', TRUE, NULL);"
+        self.assertTrue(format_as_sql(data, "t").endswith(expected))
+        self.assertTrue(b"".join(iter_sql(iter(data), "t")).decode("utf-8").endswith(expected))
+
+    def test_iter_sql_batches_statements(self):
+        data = ({"id": i} for i in range(5))
+        result = b"".join(iter_sql(data, "ids", rows_per_statement=2)).decode("utf-8")
+        self.assertEqual(result.count("INSERT INTO ids (id) VALUES"), 3)
+        self.assertEqual(result.count(";"), 3)
+        self.assertTrue(result.endswith("(4);"))
+
+    def test_iter_format(self):
+        extension, chunks = iter_format(iter([{"a": 1}]), "CSV")
+        self.assertEqual(extension, "csv")
+        self.assertEqual(b"".join(chunks), b"a\r\n1\r\n")
+
+        extension, chunks = iter_format(iter([{"a": 1}]), "unknown_format")
+        self.assertEqual(extension, "json")
+        self.assertEqual(b"".join(chunks), b'[{"a":1}]')
+
+    def test_batch_formatters_match_row_formatters(self):
+        data = [{"name": "Bob", "age": 30}, {"name": "Alice, Jr", "age": None}, {"name": "Eve", "age": 41}]
+        batches = [RowBatch.from_dicts(data[:2]), RowBatch(("name", "age")), RowBatch.from_dicts(data[2:])]
+        self.assertEqual(b"".join(iter_json_batches(batches)), b"".join(iter_json(data)))
+        self.assertEqual(b"".join(iter_compact_json_batches(batches)), b"".join(iter_compact_json(data)))
+        self.assertEqual(b"".join(iter_csv_batches(batches, chunk_size=5)), b"".join(iter_csv(data)))
+        self.assertEqual(b"".join(iter_json_batches([])), b"[]")
+        self.assertEqual(list(iter_csv_batches([RowBatch(("a",))])), [])
+
+    def test_iter_format_batches(self):
+        extension, chunks = iter_format_batches([RowBatch(("a",), [[1]])], "CSV")
+        self.assertEqual(extension, "csv")
+        self.assertEqual(b"".join(chunks), b"a\r\n1\r\n")
+
+        extension, chunks = iter_format_batches([RowBatch(("a",), [[1]])], "unknown_format")
+        self.assertEqual(extension, "json")
+        self.assertEqual(b"".join(chunks), b'[{"a":1}]')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
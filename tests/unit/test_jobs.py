@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import json
+import os
+import sys
+from pathlib import Path
+
+import boto3
+from moto import mock_aws
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import jobs
+from lambda_function.generator.s3_uploader import reset_s3_client
+
+
+@mock_aws
+class TestJobs(unittest.TestCase):
+    """Test cases for job manifests and dispatch"""
+
+    def setUp(self):
+        os.environ.setdefault('AWS_DEFAULT_REGION', 'eu-central-1')
+        patcher = patch.dict(os.environ, {'BUCKET_NAME': 'jobs-test'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(jobs.set_invoker, None)
+        reset_s3_client()
+        boto3.client("s3", region_name="eu-central-1").create_bucket(
+            Bucket="jobs-test", CreateBucketConfiguration={'LocationConstraint': 'eu-central-1'}
+        )
+
+    def test_submit_job_saves_manifest_and_invokes(self):
+        payloads = []
+        jobs.set_invoker(payloads.append)
+        manifest = jobs.submit_job(["name"], {"size": 10})
+        self.assertEqual(payloads, [{"job_id": manifest["job_id"]}])
+
+        loaded = jobs.load_manifest(manifest["job_id"])
+        self.assertEqual(loaded["status"], "queued")
+        self.assertEqual(loaded["fields"], ["name"])
+        self.assertEqual(loaded["params"], {"size": 10})
+
+    def test_load_missing_or_invalid_job(self):
+        self.assertIsNone(jobs.load_manifest("0" * 32))
+        self.assertIsNone(jobs.load_manifest("../secrets"))
+
+    def test_progress_is_throttled(self):
+        manifest = {"job_id": "a" * 32, "rows_written": 0}
+        progress = jobs.JobProgress(manifest, interval=3600)
+        progress({"rows_written": 500, "parts_uploaded": 1, "bytes_uploaded": 100})
+        self.assertEqual(manifest["parts_uploaded"], 1)
+        self.assertIn("rows_per_second", manifest)
+        self.assertIsNone(jobs.load_manifest("a" * 32))
+
+        progress.interval = 0
+        progress({"rows_written": 1000, "parts_uploaded": 2, "bytes_uploaded": 200})
+        self.assertEqual(jobs.load_manifest("a" * 32)["rows_written"], 1000)
+
+
+class TestLambdaInvoker(unittest.TestCase):
+    """Test cases for the default asynchronous invoker"""
+
+    @patch('boto3.client')
+    def test_invokes_function_asynchronously(self, mock_boto3_client):
+        mock_lambda = MagicMock()
+        mock_boto3_client.return_value = mock_lambda
+        jobs.LambdaInvoker("mock-fn")({"job_id": "abc"})
+
+        call_args = mock_lambda.invoke.call_args[1]
+        self.assertEqual(call_args["FunctionName"], "mock-fn")
+        self.assertEqual(call_args["InvocationType"], "Event")
+        self.assertEqual(json.loads(call_args["Payload"]), {"job_id": "abc"})
+
+    def test_requires_function_name(self):
+        with patch.dict(os.environ):
+            os.environ.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+            with self.assertRaises(RuntimeError):
+                jobs.LambdaInvoker()({"job_id": "abc"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.metrics import Metrics, field_costs
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for request instrumentation"""
+
+    def test_nested_stages_are_exclusive(self):
+        metrics = Metrics('/bulk')
+        with metrics.stage('outer'):
+            time.sleep(0.02)
+            with metrics.stage('inner'):
+                time.sleep(0.05)
+        self.assertGreaterEqual(metrics.stages['inner'], 0.05)
+        self.assertLess(metrics.stages['outer'], 0.045)
+
+    def test_timed_iter_excludes_upstream_iterators(self):
+        metrics = Metrics('/bulk')
+
+        def slow_source():
+            for chunk in (b'ab', b'cde'):
+                time.sleep(0.02)
+                yield chunk
+
+        source = metrics.timed_iter('generate', slow_source())
+        chunks = list(metrics.timed_iter('serialize', (chunk.upper() for chunk in source), 'bytes_serialized'))
+        self.assertEqual(chunks, [b'AB', b'CDE'])
+        self.assertEqual(metrics.counters['bytes_serialized'], 5)
+        self.assertGreaterEqual(metrics.stages['generate'], 0.04)
+        self.assertLess(metrics.stages['serialize'], 0.02)
+
+    def test_emf_record(self):
+        metrics = Metrics('/bulk')
+        metrics.set(dataset_id='orders')
+        with metrics.stage('upload'):
+            pass
+        metrics.count('rows', 10)
+        metrics.count('bytes_uploaded', 100)
+        stream = io.StringIO()
+        metrics.emit(stream)
+        record = json.loads(stream.getvalue())
+        definition = record['_aws']['CloudWatchMetrics'][0]
+        self.assertEqual(definition['Dimensions'], [['Endpoint']])
+        units = {metric['Name']: metric['Unit'] for metric in definition['Metrics']}
+        self.assertEqual(units['upload_ms'], 'Milliseconds')
+        self.assertEqual(units['rows'], 'Count')
+        self.assertEqual(units['bytes_uploaded'], 'Bytes')
+        self.assertEqual(record['Endpoint'], '/bulk')
+        self.assertEqual(record['dataset_id'], 'orders')
+        self.assertEqual(record['rows'], 10)
+
+    def test_tracing_reports_peak_and_stops(self):
+        if tracemalloc.is_tracing():
+            self.skipTest('tracemalloc already running')
+        metrics = Metrics('/bulk')
+        metrics.start_tracing()
+        data = [str(i) for i in range(10000)]
+        figures = metrics.finish()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(figures['tracemalloc_peak_mb'], 0)
+        del data
+
+    def test_field_costs(self):
+        costs = field_costs(['name', 'status[a,b]'], size=64)
+        self.assertEqual(set(costs), {'name', 'status[a,b]'})
+        self.assertAlmostEqual(sum(cost['share'] for cost in costs.values()), 1.0, places=2)
+        self.assertGreater(costs['name']['us_per_row'], costs['status[a,b]']['us_per_row'])
+
+
+if __name__ == '__main__':
+    unittest.main()
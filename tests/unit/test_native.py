@@ -0,0 +1,110 @@
+import unittest
+import random
+import re
+import sys
+import uuid
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from faker import Faker
+from lambda_function.generator import native, columnar
+from lambda_function.generator.faker_generator import compile_field, compile_fields, generate_block
+
+FAKE = Faker()
+
+
+def column(name, size=2000, seed=1, *args, **kwargs):
+    return native.native_builder(FAKE, name, args, kwargs)(size, columnar.default_rng(seed))
+
+
+class TestNativeGenerators(unittest.TestCase):
+    """Test cases for the table-driven Faker field builders"""
+
+    def test_registry_fields_compile_as_native(self):
+        for name in ("name", "first_name", "last_name", "email", "uuid4", "random_int", "date", "phone_number", "ean13"):
+            field = compile_field(name)
+            self.assertEqual(field.kind, "native", name)
+            self.assertIsInstance(field.generate(random.Random(1)), (str, int))
+        self.assertEqual(compile_field("address").kind, "faker")
+        self.assertEqual(compile_field("ean13(prefixes=45)").kind, "faker")
+        self.assertEqual(compile_field("date(%d/%m/%Y)").kind, "faker")
+
+    def test_single_values_never_create_a_generator(self):
+        with patch.object(columnar, "default_rng", side_effect=AssertionError("new Generator per value")):
+            for name in native.registered():
+                compile_fields([name, "single_value_marker[x]"]).compiled[0].generate(random.Random(1))
+        # Builders slower than Faker for one value leave single values to Faker
+        self.assertFalse(native.builds_scalars("uuid4"))
+        self.assertTrue(native.builds_scalars("name"))
+        self.assertRegex(compile_field("uuid4").generate(random.Random(1)), r"^[0-9a-f-]{36}$")
+
+    def test_columns_do_not_depend_on_size(self):
+        for name in native.registered():
+            self.assertEqual(column(name, 1000, 3)[:37], column(name, 37, 3), name)
+
+    def test_names_come_from_faker_tables(self):
+        person = native._tables(FAKE)
+        first_names, last_names = set(person["first"].values), set(person["last"].values)
+        for full_name in column("name", 500):
+            first, last = full_name.split(" ")
+            self.assertIn(first, first_names)
+            self.assertIn(last, last_names)
+        self.assertTrue(set(column("first_name", 500)) <= first_names)
+        # Weighted tables favour common names
+        counts = column("last_name", 20000)
+        self.assertGreater(counts.count("Smith"), counts.count("Zimmerman"))
+
+    def test_email(self):
+        pattern = re.compile(r"^[a-z0-9.]+@example\.(com|org|net)$")
+        self.assertTrue(all(pattern.match(email) for email in column("email", 1000)))
+
+    def test_uuid4(self):
+        for value in column("uuid4", 200):
+            parsed = uuid.UUID(value)
+            self.assertEqual(str(parsed), value)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+        self.assertEqual(len(set(column("uuid4", 2000))), 2000)
+
+    def test_random_int_bounds_and_step(self):
+        values = column("random_int", 2000, 1, min=5, max=20, step=5)
+        self.assertEqual(set(values), {5, 10, 15, 20})
+        self.assertTrue(all(0 <= value <= 9999 for value in column("random_int")))
+        self.assertIsNone(native.native_builder(FAKE, "random_int", [], {"max": -1}))
+
+    def test_date_range(self):
+        values = column("date", 2000)
+        self.assertTrue(all(date(1970, 1, 1) <= date.fromisoformat(value) <= date.today() for value in values))
+
+    def test_phone_numbers_match_faker_formats(self):
+        provider = native._provider(FAKE, "formats", "faker.providers.phone_number")
+        placeholders = {"#": "[0-9]", "%": "[1-9]", "$": "[2-9]"}
+        regexes = [re.compile("".join(placeholders.get(char, re.escape(char)) for char in pattern) + "$")
+                   for pattern in provider.formats]
+        for value in column("phone_number", 500):
+            self.assertTrue(any(regex.match(value) for regex in regexes), value)
+
+    def test_ean13_checksum(self):
+        for code in column("ean13", 500):
+            digits = [int(digit) for digit in code]
+            self.assertEqual(len(digits), 13)
+            self.assertEqual(sum(digit * (3 if i % 2 else 1) for i, digit in enumerate(digits)) % 10, 0)
+
+    def test_disabled_falls_back_to_faker(self):
+        with patch.object(native, "ENABLED", False):
+            self.assertIsNone(native.native_builder(FAKE, "name"))
+        self.assertIsNone(native.native_builder(FAKE, "address"))
+
+    def test_seeded_blocks_are_reproducible(self):
+        fields = ["name", "email", "uuid4", "ean13"]
+        self.assertEqual(generate_block(fields, 11, 2, 50), generate_block(fields, 11, 2, 50))
+        self.assertNotEqual(generate_block(fields, 11, 2, 50), generate_block(fields, 12, 2, 50))
+        self.assertEqual(len(compile_fields(fields).generate_rows(10)), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import pagination
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for page cursors and ETags"""
+
+    fields = ['name', 'status[active,inactive]']
+
+    def test_cursor_round_trip(self):
+        cursor = pagination.encode_cursor(self.fields, 7, 40, 20)
+        self.assertNotIn('=', cursor)
+        self.assertEqual(pagination.decode_cursor(cursor, self.fields), (7, 40, 20))
+
+    def test_cursor_for_other_fields_rejected(self):
+        cursor = pagination.encode_cursor(self.fields, 7, 40, 20)
+        with self.assertRaises(ValueError):
+            pagination.decode_cursor(cursor, ['email'])
+
+    def test_malformed_cursor_rejected(self):
+        for cursor in ('not-a-cursor', 'e30', ''):
+            with self.assertRaises(ValueError):
+                pagination.decode_cursor(cursor, self.fields)
+
+    def test_relative_dates_expire_daily(self):
+        now = datetime(2024, 5, 1, 23, 0, 0)
+        tomorrow = now + timedelta(days=1)
+        self.assertEqual(pagination.cache_control(self.fields, now), 'public, max-age=86400')
+        self.assertIsNone(pagination.today_key(self.fields, now))
+        self.assertEqual(pagination.today_key(['date'], now), '2024-05-01')
+        self.assertEqual(pagination.page_etag(self.fields, 7, 0, 20, now), pagination.page_etag(self.fields, 7, 0, 20, tomorrow))
+        for fields in (['date_of_birth(minimum_age=30)'], ['date'], ['{"name":"seen","provider":"past_date","type":"faker"}']):
+            self.assertTrue(pagination.depends_on_today(fields))
+            self.assertEqual(pagination.cache_control(fields, now), 'public, max-age=3600')
+            self.assertNotEqual(pagination.page_etag(fields, 7, 0, 20, now), pagination.page_etag(fields, 7, 0, 20, tomorrow))
+        self.assertFalse(pagination.depends_on_today(['{"end":"2024-12-31","name":"d","start":"2024-01-01","type":"date"}']))
+
+    def test_etag_depends_on_generation_settings(self):
+        etag = pagination.page_etag(self.fields, 7, 0, 20)
+        with patch.object(pagination.native, 'ENABLED', not pagination.native.ENABLED):
+            self.assertNotEqual(pagination.page_etag(self.fields, 7, 0, 20), etag)
+        with patch.object(pagination.serializer, 'backend', 'other'):
+            self.assertNotEqual(pagination.page_etag(self.fields, 7, 0, 20), etag)
+
+    def test_etag_depends_on_page(self):
+        etag = pagination.page_etag(self.fields, 7, 0, 20)
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(etag, pagination.page_etag(self.fields, 7, 0, 20))
+        self.assertNotEqual(etag, pagination.page_etag(self.fields, 7, 20, 20))
+        self.assertNotEqual(etag, pagination.page_etag(self.fields, 8, 0, 20))
+        self.assertNotEqual(etag, pagination.page_etag(['email'], 7, 0, 20))
+
+    def test_etag_matches(self):
+        etag = pagination.page_etag(self.fields, 7, 0, 20)
+        self.assertTrue(pagination.etag_matches(etag, etag))
+        self.assertTrue(pagination.etag_matches(etag[2:], etag))
+        self.assertTrue(pagination.etag_matches(f'"other", {etag}', etag))
+        self.assertTrue(pagination.etag_matches('*', etag))
+        self.assertFalse(pagination.etag_matches('"other"', etag))
+        self.assertFalse(pagination.etag_matches(None, etag))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.faker_generator import BLOCK_SIZE, derive_seed, generate_block
+from lambda_function.generator.parallel import generate_parallel, iter_parallel_chunks, default_workers
+
+
+class TestParallel(unittest.TestCase):
+
+    FIELDS = ["customer_id[ID,6,int]", "status[active,inactive]", "random_int(min=1,max=100)"]
+
+    def test_derive_seed_is_stable(self):
+        self.assertEqual(derive_seed(42, 3), derive_seed(42, 3))
+        self.assertNotEqual(derive_seed(42, 3), derive_seed(42, 4))
+        self.assertLess(derive_seed(42, 3), 2 ** 63)
+
+    def test_generate_block_is_reproducible(self):
+        fields = ["name"] + self.FIELDS
+        first = generate_block(fields, 7, 2, 50)
+        second = generate_block(fields, 7, 2, 50)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, generate_block(fields, 7, 3, 50))
+
+    def test_generate_parallel_size(self):
+        rows = generate_parallel(self.FIELDS, BLOCK_SIZE + 10, seed=1, workers=1)
+        self.assertEqual(len(rows), BLOCK_SIZE + 10)
+        self.assertEqual(list(rows[0]), ["customer_id", "status", "random_int"])
+
+    def test_output_independent_of_worker_count(self):
+        size = BLOCK_SIZE * 20 + 5
+        serial = generate_parallel(self.FIELDS, size, seed=99, workers=1)
+        parallel = generate_parallel(self.FIELDS, size, seed=99, workers=3)
+        self.assertEqual(serial, parallel)
+
+    def test_chunks_merge_in_order(self):
+        chunks = list(iter_parallel_chunks(self.FIELDS, BLOCK_SIZE * 40, seed=5, workers=2))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(chunks[0][:3], generate_block(self.FIELDS, 5, 0)[:3])
+
+    def test_generate_block_is_thread_safe(self):
+        from concurrent.futures import ThreadPoolExecutor
+        fields = ["name"] + self.FIELDS
+        expected = [generate_block(fields, 8, index, 30) for index in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda index: generate_block(fields, 8, index, 30), range(8)))
+        self.assertEqual(results, expected)
+
+    def test_start_offset(self):
+        size = BLOCK_SIZE * 3 + 5
+        full = generate_parallel(self.FIELDS, size, seed=4, workers=1)
+        tail = [row for chunk in iter_parallel_chunks(self.FIELDS, size, 4, 1, start=BLOCK_SIZE) for row in chunk]
+        self.assertEqual(tail, full[BLOCK_SIZE:])
+        with self.assertRaises(ValueError):
+            list(iter_parallel_chunks(self.FIELDS, size, 4, 1, start=3))
+
+    def test_empty_size(self):
+        self.assertEqual(generate_parallel(self.FIELDS, 0, seed=1), [])
+
+    def test_default_workers(self):
+        self.assertGreaterEqual(default_workers(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import pools
+from lambda_function.generator.faker_generator import BLOCK_SIZE, compile_fields, generate_block_columns
+from lambda_function.generator.parallel import iter_parallel_chunks
+
+
+def pooled_rows(fields, size, seed, config, workers=1):
+    rows = []
+    for chunk in iter_parallel_chunks(fields, size, seed, workers, pools=config):
+        rows.extend(chunk)
+    return rows
+
+
+class TestPools(unittest.TestCase):
+    """Test cases for precomputed value pools"""
+
+    fields = ['name', 'status[active,inactive]']
+
+    def setUp(self):
+        pools.clear()
+
+    def test_pool_config(self):
+        self.assertIsNone(pools.pool_config(0))
+        self.assertEqual(pools.pool_config('50', '2048', ['name']), pools.PoolConfig(50, 2048, ('name',)))
+        for size in (-1, pools.MAX_POOL_SIZE + 1):
+            with self.assertRaises(ValueError):
+                pools.pool_config(size)
+        with self.assertRaises(ValueError):
+            pools.pool_config(0, unique=['name'])
+
+    def test_cache_is_bounded_by_values(self):
+        cache = pools._ValueCache(10)
+        cache.put('a', [0] * 6)
+        cache.put('b', [0] * 4)
+        self.assertEqual(cache.size, 10)
+        cache.put('c', [0] * 3)
+        # The least recently used pool makes room
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.size, 7)
+        cache.put('d', [0] * 11)
+        self.assertIsNone(cache.get('d'))
+
+    def test_values_come_from_pool(self):
+        config = pools.PoolConfig(20)
+        rows = pooled_rows(self.fields, 500, 3, config)
+        self.assertEqual(len(rows), 500)
+        self.assertLessEqual(len({row['name'] for row in rows}), 20)
+        # Custom fields are not pooled
+        self.assertEqual({row['status'] for row in rows}, {'active', 'inactive'})
+
+    def test_reproducible_across_blocks_and_caches(self):
+        config = pools.PoolConfig(20)
+        first = pooled_rows(self.fields, BLOCK_SIZE + 10, 3, config)
+        pools.clear()
+        block = generate_block_columns(self.fields, 3, 1, 10, config)
+        self.assertEqual([row['name'] for row in first[BLOCK_SIZE:]], block[0])
+        self.assertEqual(first, pooled_rows(self.fields, BLOCK_SIZE + 10, 3, config))
+
+    def test_unique_fields_never_repeat(self):
+        config = pools.PoolConfig(BLOCK_SIZE + 100, unique=('name',))
+        rows = pooled_rows(['name'], BLOCK_SIZE + 100, 5, config)
+        self.assertEqual(len({row['name'] for row in rows}), BLOCK_SIZE + 100)
+
+    def test_refresh_draws_new_pools(self):
+        config = pools.PoolConfig(10, refresh=BLOCK_SIZE)
+        first = generate_block_columns(['name'], 7, 0, BLOCK_SIZE, config)[0]
+        second = generate_block_columns(['name'], 7, 1, BLOCK_SIZE, config)[0]
+        self.assertNotEqual(set(first), set(second))
+        never = pools.PoolConfig(10)
+        self.assertEqual(set(generate_block_columns(['name'], 7, 0, BLOCK_SIZE, never)[0]),
+                         set(generate_block_columns(['name'], 7, 1, BLOCK_SIZE, never)[0]))
+
+    def test_validate(self):
+        plan = compile_fields(self.fields)
+        pools.validate(pools.PoolConfig(10, unique=('name',)), plan, 10)
+        with self.assertRaises(ValueError):
+            pools.validate(pools.PoolConfig(10, unique=('status',)), plan, 10)
+        with self.assertRaises(ValueError):
+            pools.validate(pools.PoolConfig(10, unique=('name',)), plan, 11)
+
+    def test_columnar_fields_build_pools_a_column_at_a_time(self):
+        plan = compile_fields(['name'])
+        field = plan.compiled[0]
+        if field.build_column is None:
+            self.skipTest("name has no column builder without NumPy")
+
+        def generate(rnd):
+            raise AssertionError("pool drawn one value at a time")
+
+        field.generate = generate
+        pool = pools._build_pool(plan, 0, 500, 1)
+        self.assertEqual(len(set(pool)), 500)
+        self.assertEqual(list(pool), list(pools._build_pool(plan, 0, 500, 1)))
+
+    def test_pool_too_large_for_provider(self):
+        config = pools.PoolConfig(5)
+        with self.assertRaises(ValueError):
+            generate_block_columns(['boolean'], 1, 0, 5, config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import relational
+from lambda_function.generator.faker_generator import BLOCK_SIZE, generate_range
+from lambda_function.generator.parallel import iter_parallel_batches
+from lambda_function.generator.rows import RowBatch
+from lambda_function.generator.schema import SchemaError, validate_schema
+
+
+def shop_schema(per_parent=None):
+    return {"tables": [
+        {"name": "customers", "size": 2500, "columns": [
+            {"name": "id", "type": "prefix", "prefix": "C", "length": 6, "unique": True},
+            {"name": "name", "type": "faker", "provider": "first_name"}]},
+        {"name": "orders", "columns": [
+            {"name": "id", "type": "int", "min": 1, "max": 10 ** 9, "unique": True},
+            {"name": "customer_id", "type": "reference", "table": "customers", "column": "id",
+             "per_parent": per_parent or {"min": 0, "max": 6}},
+            {"name": "total", "type": "float", "min": 1, "max": 500, "decimals": 2}]},
+        {"name": "reviews", "size": 3000, "columns": [
+            {"name": "customer_id", "type": "reference", "table": "customers", "column": "id", "null_rate": 0.2}]}
+    ]}
+
+
+def read_table(table, workers=1):
+    batches = list(iter_parallel_batches(table["fields"], table["size"], table["seed"], workers))
+    return RowBatch.concat(batches[0].names, batches).columns
+
+
+class TestRelational(unittest.TestCase):
+    """Test cases for multi-table schemas with derived foreign keys"""
+
+    def setUp(self):
+        self.tables = relational.bind_tables(relational.validate_tables(shop_schema()), 7)
+        self.customers, self.orders, self.reviews = self.tables
+
+    def test_child_size_is_the_total_of_the_per_parent_counts(self):
+        self.assertEqual([table["size"] for table in self.tables][::2], [2500, 3000])
+        self.assertTrue(0 <= self.orders["size"] <= 6 * 2500)
+        # The same seed binds the same sizes; table seeds differ
+        self.assertEqual(relational.bind_tables(relational.validate_tables(shop_schema()), 7), self.tables)
+        self.assertNotEqual(self.customers["seed"], self.orders["seed"])
+
+    def test_foreign_keys_match_parent_keys(self):
+        customer_ids = read_table(self.customers)[0]
+        order_ids, order_customers, _ = read_table(self.orders, workers=2)
+        self.assertEqual(len(set(order_ids)), self.orders["size"])
+        positions = {value: row for row, value in enumerate(customer_ids)}
+        parents = [positions[value] for value in order_customers]
+        # Children are grouped by parent in parent order, within the cardinality bounds
+        self.assertEqual(parents, sorted(parents))
+        self.assertTrue(all(parents.count(row) <= 6 for row in set(parents)))
+        review_customers = read_table(self.reviews)[0]
+        self.assertTrue({value for value in review_customers if value is not None} <= set(customer_ids))
+        self.assertAlmostEqual(review_customers.count(None) / 3000, 0.2, delta=0.05)
+
+    def test_parent_rows_of_any_range_match_the_full_expansion(self):
+        cardinality = relational.Cardinality(1, 5, "uniform", None, None)
+        total = relational.child_offsets(cardinality, 3, 3000)[-1]
+        full = relational.parent_rows(cardinality, 3, 3000, 0, total).tolist()
+        for start, size in ((0, 1), (BLOCK_SIZE - 3, 10), (total - 7, 7), (2000, 4000)):
+            self.assertEqual(relational.parent_rows(cardinality, 3, 3000, start, size).tolist(), full[start:start + size])
+        with self.assertRaises(ValueError):
+            relational.parent_rows(cardinality, 3, 3000, total - 1, 2)
+
+    def test_pure_python_parent_rows(self):
+        cardinality = relational.Cardinality(0, 3, "normal", 1.5, 1.0)
+        with patch.object(relational, "np", None):
+            total = relational.child_offsets(cardinality, 4, 1500)[-1]
+            full = relational.parent_rows(cardinality, 4, 1500, 0, total)
+            self.assertEqual(relational.parent_rows(cardinality, 4, 1500, 1000, 50), full[1000:1050])
+        self.assertEqual(full, sorted(full))
+        self.assertTrue(all(full.count(row) <= 3 for row in set(full)))
+
+    def test_rows_of_a_child_range_do_not_depend_on_the_rest(self):
+        rows = generate_range(self.orders["fields"], self.orders["seed"], 0, self.orders["size"])
+        self.assertEqual(generate_range(self.orders["fields"], self.orders["seed"], 1500, 1600), rows[1500:1600])
+
+    def test_validation_errors(self):
+        def invalid(change):
+            schema = shop_schema()
+            change(schema["tables"])
+            with self.assertRaises(SchemaError):
+                relational.validate_tables(schema)
+
+        invalid(lambda tables: tables.reverse())  # parent defined after the child
+        invalid(lambda tables: tables[1]["columns"][1].update(column="name"))  # not a unique column
+        invalid(lambda tables: tables[1]["columns"][1].update(column="missing"))
+        invalid(lambda tables: tables[1]["columns"][1].update(per_parent={"min": 5, "max": 1}))
+        invalid(lambda tables: tables[1]["columns"][1].update(per_parent={"min": -1, "max": 1}))
+        invalid(lambda tables: tables[1]["columns"][1].update(null_rate=0.1))
+        invalid(lambda tables: tables[1].update(size=10))  # size comes from per_parent
+        invalid(lambda tables: tables[2].pop("size"))
+        invalid(lambda tables: tables[2].update(name="customers"))
+        # References only exist in multi-table schemas
+        with self.assertRaises(SchemaError):
+            validate_schema({"columns": shop_schema()["tables"][2]["columns"]})
+
+    def test_bind_rejects_children_beyond_their_unique_columns(self):
+        schema = shop_schema({"min": 5, "max": 6})
+        schema["tables"][1]["columns"][0].update(max=100)
+        with self.assertRaises(ValueError):
+            relational.bind_tables(relational.validate_tables(schema), 1)
+
+    def test_is_relational(self):
+        self.assertTrue(relational.is_relational(shop_schema()))
+        self.assertFalse(relational.is_relational('{"columns": []}'))
+
+
+if __name__ == '__main__':
+    unittest.main()
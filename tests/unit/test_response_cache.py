@@ -0,0 +1,80 @@
+import unittest
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.response_cache import ResponseCache, RowPool, PoolRegistry
+
+
+def counting_chunk(fields, size):
+    """Deterministic stand-in for generate_chunk: row i holds i in every field"""
+    return [{field: i for field in fields} for i in range(size)]
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the serialized response LRU"""
+
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache(1024)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', '[1]')
+        self.assertEqual(cache.get('a'), '[1]')
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evicts_least_recently_used_by_size(self):
+        cache = ResponseCache(10)
+        cache.put('a', 'x' * 4)
+        cache.put('b', 'x' * 4)
+        cache.get('a')
+        cache.put('c', 'x' * 4)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertLessEqual(cache.size, 10)
+
+    def test_replacing_entry_updates_size(self):
+        cache = ResponseCache(100)
+        cache.put('a', 'x' * 10)
+        cache.put('a', 'x' * 4)
+        self.assertEqual(cache.size, 4)
+
+    def test_oversized_body_not_cached(self):
+        cache = ResponseCache(10)
+        cache.put('a', 'x' * 4)
+        cache.put('big', 'x' * 11)
+        self.assertIsNone(cache.get('big'))
+        self.assertEqual(cache.get('a'), 'x' * 4)
+
+
+class TestRowPool(unittest.TestCase):
+    """Test cases for ring buffers of pre-serialized rows"""
+
+    def test_take_wraps_around(self):
+        pool = RowPool(counting_chunk, ['n'], 3)
+        self.assertEqual([json.loads(row)['n'] for row in pool.take(2)], [0, 1])
+        self.assertEqual([json.loads(row)['n'] for row in pool.take(2)], [2, 0])
+        self.assertEqual([json.loads(row)['n'] for row in pool.take(3)], [1, 2, 0])
+        # One response never repeats a row of the pool
+        with self.assertRaises(ValueError):
+            pool.take(4)
+
+    def test_body_is_json(self):
+        pool = RowPool(counting_chunk, ['a', 'b'], 4)
+        self.assertEqual(json.loads(pool.body(3)), counting_chunk(['a', 'b'], 3))
+        self.assertEqual(json.loads(pool.body(1, as_object=True)), {'a': 3, 'b': 3})
+
+    def test_registry_bounds_pools(self):
+        registry = PoolRegistry(counting_chunk, 2, max_pools=2)
+        first = registry.get(['a'])
+        self.assertIs(registry.get(['a']), first)
+        registry.get(['b'])
+        registry.get(['c'])
+        self.assertIsNot(registry.get(['a']), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
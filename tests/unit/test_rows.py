@@ -0,0 +1,48 @@
+import unittest
+import pickle
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.rows import RowBatch
+from lambda_function.generator.faker_generator import compile_fields, generate_block, generate_block_batch
+
+
+class TestRowBatch(unittest.TestCase):
+    """Test cases for the compact row container"""
+
+    def test_columns_and_rows_views(self):
+        batch = RowBatch(("id", "status"), [[1, 2], ["a", "b"]])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.rows, [(1, "a"), (2, "b")])
+        self.assertEqual(list(batch), [(1, "a"), (2, "b")])
+        self.assertEqual(batch.to_dicts(), [{"id": 1, "status": "a"}, {"id": 2, "status": "b"}])
+
+        tuples = RowBatch(("id", "status"), rows=[(1, "a"), (2, "b")])
+        self.assertEqual(tuples.columns, [[1, 2], ["a", "b"]])
+        self.assertEqual(RowBatch(("id",), rows=[]).columns, [[]])
+
+    def test_from_dicts_and_concat(self):
+        batch = RowBatch.from_dicts([{"a": 1, "b": 2}, {"b": 4, "a": 3}])
+        self.assertEqual(batch.names, ("a", "b"))
+        self.assertEqual(batch.rows, [(1, 2), (3, 4)])
+        merged = RowBatch.concat(batch.names, [batch, RowBatch(batch.names, [[5], [6]])])
+        self.assertEqual(merged.columns, [[1, 3, 5], [2, 4, 6]])
+        self.assertEqual(len(RowBatch.from_dicts([])), 0)
+
+    def test_pickle_round_trip(self):
+        for batch in (RowBatch(("a",), [[1, 2]]), RowBatch(("a",), rows=[(1,), (2,)])):
+            restored = pickle.loads(pickle.dumps(batch))
+            self.assertEqual(restored.names, ("a",))
+            self.assertEqual(restored.rows, [(1,), (2,)])
+
+    def test_block_batch_matches_block(self):
+        fields = ["random_int", "status[on,off]", "name"]
+        self.assertEqual(generate_block_batch(fields, 3, 1, 40).to_dicts(), generate_block(fields, 3, 1, 40))
+        self.assertEqual(compile_fields(fields).generate_batch(5).names, ("random_int", "status", "name"))
+
+
+if __name__ == '__main__':
+    unittest.main()
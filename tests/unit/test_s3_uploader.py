@@ -1,18 +1,32 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import gzip
+import json
+import os
 import sys
 from pathlib import Path
 
+import boto3
+from moto import mock_aws
+
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from lambda_function.generator.s3_uploader import create_unique_bucket_and_upload
+from datetime import datetime
+from lambda_function.generator.s3_uploader import (
+    create_unique_bucket_and_upload, upload_dataset, upload_stream, dataset_key,
+    get_s3_client, reset_s3_client, validate_upload_settings, MIN_PART_SIZE
+)
+from lambda_function.generator.formatters import iter_json
 
 
 class TestS3Uploader(unittest.TestCase):
     """Test cases for S3 uploader functionality"""
 
-    @patch('lambda_function.generator.s3_uploader.boto3.client')
+    def setUp(self):
+        reset_s3_client()
+
+    @patch('boto3.client')
     @patch('lambda_function.generator.s3_uploader.uuid.uuid4')
     def test_create_unique_bucket_and_upload(self, mock_uuid, mock_boto3_client):
         # Setup mocks
@@ -46,7 +60,7 @@ class TestS3Uploader(unittest.TestCase):
         self.assertTrue(bucket_name.startswith('mock-data-'))
         self.assertEqual(s3_key, f"{dataset_id}.json")
     
-    @patch('lambda_function.generator.s3_uploader.boto3.client')
+    @patch('boto3.client')
     def test_create_unique_bucket_and_upload_error(self, mock_boto3_client):
         # Setup mock to raise exception
         mock_s3 = MagicMock()
@@ -59,5 +73,170 @@ class TestS3Uploader(unittest.TestCase):
             create_unique_bucket_and_upload(chunk_data, "test", "bulk")
 
 
+@mock_aws
+class TestStreamUpload(unittest.TestCase):
+    """Test cases for streaming multipart uploads against moto"""
+
+    def setUp(self):
+        os.environ.setdefault('AWS_DEFAULT_REGION', 'eu-central-1')
+        reset_s3_client()
+        self.s3 = boto3.client("s3", region_name="eu-central-1")
+        self.s3.create_bucket(Bucket="stream-test", CreateBucketConfiguration={'LocationConstraint': 'eu-central-1'})
+
+    def _body(self, key):
+        return self.s3.get_object(Bucket="stream-test", Key=key)['Body'].read()
+
+    def test_small_body_uses_single_put(self):
+        stats = upload_stream(self.s3, "stream-test", "small.json", [b"[", b"1", b"]"])
+        self.assertEqual(stats, {'bytes': 3, 'parts': 1})
+        self.assertEqual(self._body("small.json"), b"[1]")
+
+    def test_large_body_uses_multipart(self):
+        chunk = b"x" * (1024 * 1024)
+        stats = upload_stream(self.s3, "stream-test", "large.bin", (chunk for _ in range(12)), part_size=MIN_PART_SIZE)
+        self.assertEqual(stats['parts'], 3)
+        self.assertEqual(stats['bytes'], 12 * len(chunk))
+        self.assertEqual(self._body("large.bin"), chunk * 12)
+
+    def test_failed_stream_aborts_upload(self):
+        def chunks():
+            yield b"x" * MIN_PART_SIZE
+            raise RuntimeError("generation failed")
+
+        with self.assertRaises(RuntimeError):
+            upload_stream(self.s3, "stream-test", "broken.bin", chunks())
+        self.assertNotIn('Uploads', self.s3.list_multipart_uploads(Bucket="stream-test"))
+
+    def test_concurrent_parts_keep_order(self):
+        chunks = [bytes([65 + i]) * (1024 * 1024) for i in range(16)]
+        stats = upload_stream(self.s3, "stream-test", "ordered.bin", iter(chunks), part_size=MIN_PART_SIZE, concurrency=3)
+        self.assertEqual(stats['parts'], 4)
+        self.assertEqual(self._body("ordered.bin"), b"".join(chunks))
+
+    def test_progress_is_reported_from_the_calling_thread(self):
+        import threading
+        calls = []
+        def progress(counts):
+            calls.append((threading.current_thread(), counts))
+
+        chunk = b"x" * (1024 * 1024)
+        upload_stream(self.s3, "stream-test", "progress.bin", (chunk for _ in range(16)), part_size=MIN_PART_SIZE,
+                      progress=progress, concurrency=3)
+        self.assertTrue(all(thread is threading.current_thread() for thread, _ in calls))
+        uploaded = [counts['parts_uploaded'] for _, counts in calls]
+        self.assertEqual(uploaded, sorted(set(uploaded)))
+        self.assertEqual(calls[-1][1], {'parts_uploaded': 4, 'bytes_uploaded': 16 * len(chunk)})
+
+    @patch('lambda_function.generator.s3_uploader.RETRY_DELAY', 0)
+    def test_failed_part_is_retried_without_regenerating(self):
+        pulled = []
+        def chunks():
+            for i in range(11):
+                pulled.append(i)
+                yield b"y" * (1024 * 1024)
+
+        real_upload_part = self.s3.upload_part
+        failures = []
+        def flaky_upload_part(**kwargs):
+            if kwargs['PartNumber'] == 2 and not failures:
+                failures.append(kwargs['PartNumber'])
+                raise ConnectionError("connection reset")
+            return real_upload_part(**kwargs)
+
+        with patch.object(self.s3, 'upload_part', side_effect=flaky_upload_part):
+            stats = upload_stream(self.s3, "stream-test", "retried.bin", chunks(), part_size=MIN_PART_SIZE)
+        self.assertEqual(failures, [2])
+        self.assertEqual(pulled, list(range(11)))
+        self.assertEqual(stats['parts'], 3)
+        self.assertEqual(self._body("retried.bin"), b"y" * (11 * 1024 * 1024))
+
+    @patch('lambda_function.generator.s3_uploader.RETRY_DELAY', 0)
+    def test_part_failing_every_attempt_aborts_upload(self):
+        with patch.object(self.s3, 'upload_part', side_effect=ConnectionError("down")):
+            with self.assertRaises(ConnectionError):
+                upload_stream(self.s3, "stream-test", "failed.bin", [b"z" * (2 * MIN_PART_SIZE)], part_size=MIN_PART_SIZE)
+        self.assertNotIn('Uploads', self.s3.list_multipart_uploads(Bucket="stream-test"))
+
+    def test_upload_dataset_to_configured_bucket(self):
+        rows = ({"id": i, "name": f"row{i}"} for i in range(1000))
+        with patch.dict(os.environ, {'BUCKET_NAME': 'stream-test'}):
+            bucket_name, key, stats = upload_dataset(iter_json(rows), "streamed")
+        self.assertEqual(bucket_name, "stream-test")
+        self.assertTrue(key.startswith("streamed/") and key.endswith("/streamed.json"))
+        body = self._body(key)
+        self.assertEqual(len(json.loads(body)), 1000)
+        self.assertEqual(stats['bytes'], len(body))
+
+    def test_upload_dataset_gzip(self):
+        rows = ({"id": i} for i in range(1000))
+        with patch.dict(os.environ, {'BUCKET_NAME': 'stream-test'}):
+            _, key, stats = upload_dataset(iter_json(rows), "packed", compression="gzip")
+        self.assertTrue(key.endswith("/packed.json.gz"))
+        response = self.s3.get_object(Bucket="stream-test", Key=key)
+        self.assertEqual(response['ContentEncoding'], "gzip")
+        body = response['Body'].read()
+        self.assertEqual(stats['bytes'], len(body))
+        self.assertEqual(len(json.loads(gzip.decompress(body))), 1000)
+
+    def test_upload_dataset_without_bucket_name_creates_bucket_once(self):
+        with patch.dict(os.environ):
+            os.environ.pop('BUCKET_NAME', None)
+            first, _, _ = upload_dataset([b"[]"], "one")
+            second, _, _ = upload_dataset([b"[]"], "two")
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith("mock-data-"))
+
+
+class TestS3Client(unittest.TestCase):
+    """Test cases for the shared S3 client and key layout"""
+
+    def setUp(self):
+        reset_s3_client()
+
+    @patch('boto3.client')
+    def test_client_is_created_once(self, mock_boto3_client):
+        self.assertIs(get_s3_client(), get_s3_client())
+        mock_boto3_client.assert_called_once()
+        config = mock_boto3_client.call_args[1]['config']
+        self.assertEqual(config.max_pool_connections, 10)
+        self.assertEqual(config.retries['max_attempts'], 5)
+
+    def test_producer_waits_for_free_upload_slot(self):
+        import threading
+        release = threading.Event()
+        s3 = MagicMock()
+        s3.create_multipart_upload.return_value = {'UploadId': 'u'}
+        s3.upload_part.side_effect = lambda **kwargs: release.wait(5) and {'ETag': str(kwargs['PartNumber'])}
+        pulled = []
+        def chunks():
+            for i in range(40):
+                pulled.append(i)
+                yield b"p" * MIN_PART_SIZE
+
+        uploader = threading.Thread(
+            target=upload_stream, args=(s3, "b", "k", chunks()), kwargs={'part_size': MIN_PART_SIZE, 'concurrency': 2}
+        )
+        uploader.start()
+        uploader.join(0.5)
+        # Two parts uploading, one queued and one held while waiting for a slot
+        self.assertEqual(len(pulled), 4)
+        release.set()
+        uploader.join(5)
+        self.assertEqual(len(pulled), 40)
+        parts = s3.complete_multipart_upload.call_args[1]['MultipartUpload']['Parts']
+        self.assertEqual([part['PartNumber'] for part in parts], list(range(1, 41)))
+
+    def test_validate_upload_settings(self):
+        self.assertEqual(validate_upload_settings(), (None, None))
+        self.assertEqual(validate_upload_settings("16", "8"), (16 * 1024 * 1024, 8))
+        with self.assertRaises(ValueError):
+            validate_upload_settings(part_size_mb=4)
+        with self.assertRaises(ValueError):
+            validate_upload_settings(concurrency=0)
+
+    def test_dataset_key(self):
+        key = dataset_key("orders", "csv", datetime(2024, 3, 9))
+        self.assertEqual(key, "orders/2024-03-09/orders.csv")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+import unittest
+import json
+import random
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.schema import SchemaError, validate_schema, compile_column
+from lambda_function.generator.faker_generator import compile_field, compile_fields, generate_range, get_fake
+from lambda_function.generator import columnar
+
+
+SCHEMA = {"columns": [
+    {"name": "id", "type": "prefix", "prefix": "ID", "length": 6},
+    {"name": "status", "type": "choice", "options": ["active", "inactive"], "weights": [3, 1]},
+    {"name": "age", "type": "int", "min": 18, "max": 90, "distribution": "normal", "mean": 40, "stddev": 12},
+    {"name": "score", "type": "float", "min": 0, "max": 1, "decimals": 2},
+    {"name": "verified", "type": "bool", "probability": 0.3},
+    {"name": "signup", "type": "date", "start": "2020-01-01", "end": "2020-12-31"},
+    {"name": "seen", "type": "datetime", "start": "2020-01-01T00:00:00", "end": "2020-01-01T12:00:00"},
+    {"name": "full_name", "type": "faker", "provider": "name", "null_rate": 0.5},
+    {"name": "rank", "type": "faker", "provider": "random_int", "args": {"min": 1, "max": 3}},
+]}
+
+
+class TestSchema(unittest.TestCase):
+    """Test cases for typed JSON schemas"""
+
+    def test_columns_become_canonical_descriptors(self):
+        fields = validate_schema(SCHEMA)
+        self.assertEqual(len(fields), len(SCHEMA["columns"]))
+        self.assertEqual(fields, validate_schema(json.dumps(SCHEMA)))
+        self.assertEqual(json.loads(fields[0]), SCHEMA["columns"][0])
+
+    def test_value_types(self):
+        plan = compile_fields(validate_schema(SCHEMA))
+        self.assertEqual(
+            [field.value_type for field in plan.compiled],
+            ["str", "category", "int", "float", "bool", "date", "datetime", "str", "int"]
+        )
+
+    def test_generated_values_respect_types(self):
+        fields = validate_schema(SCHEMA)
+        rows = generate_range(fields, 3, 0, 500)
+        for row in rows:
+            self.assertRegex(row["id"], r"^ID\d{6}$")
+            self.assertIn(row["status"], ["active", "inactive"])
+            self.assertTrue(18 <= row["age"] <= 90)
+            self.assertTrue(0 <= row["score"] <= 1)
+            self.assertIsInstance(row["verified"], bool)
+            self.assertTrue(date(2020, 1, 1) <= row["signup"] <= date(2020, 12, 31))
+            self.assertTrue(datetime(2020, 1, 1) <= row["seen"] <= datetime(2020, 1, 1, 12))
+            self.assertIn(row["rank"], [1, 2, 3])
+        nulls = sum(row["full_name"] is None for row in rows)
+        self.assertTrue(150 < nulls < 350)
+        self.assertGreater(sum(row["status"] == "active" for row in rows), 300)
+        self.assertEqual(rows, generate_range(fields, 3, 0, 500))
+
+    def test_nullable_column_prefix_does_not_depend_on_size(self):
+        fields = validate_schema({"columns": [
+            {"name": "n", "type": "int", "min": 1, "max": 100, "null_rate": 0.3},
+            {"name": "full_name", "type": "faker", "provider": "name", "null_rate": 0.5},
+        ]})
+        rows = generate_range(fields, 7, 0, 1024)
+        self.assertEqual(generate_range(fields, 7, 0, 10), rows[:10])
+        self.assertEqual(generate_range(fields, 7, 0, 500), rows[:500])
+
+    def test_row_and_column_paths_agree_on_ranges(self):
+        field = compile_column(json.dumps({"name": "n", "type": "int", "min": 1, "max": 3}))
+        self.assertTrue(all(1 <= field.generate(random.Random(i)) <= 3 for i in range(50)))
+        if columnar.HAS_NUMPY:
+            self.assertTrue(set(field.build_column(200, columnar.default_rng(0))) <= {1, 2, 3})
+
+    def test_invalid_schemas(self):
+        invalid = [
+            "not json",
+            {},
+            {"columns": []},
+            {"columns": ["name"]},
+            {"columns": [{"name": "bad name", "type": "int"}]},
+            {"columns": [{"name": "x", "type": "uuid"}]},
+            {"columns": [{"name": "x", "type": "int", "min": 5, "max": 1}]},
+            {"columns": [{"name": "x", "type": "int", "min": 1.5}]},
+            {"columns": [{"name": "x", "type": "int", "distribution": "zipf"}]},
+            {"columns": [{"name": "x", "type": "int", "colour": "red"}]},
+            {"columns": [{"name": "x", "type": "choice", "options": ["a"], "weights": [1, 2]}]},
+            {"columns": [{"name": "x", "type": "choice", "options": ["a", 1]}]},
+            {"columns": [{"name": "x", "type": "choice", "options": [1, None]}]},
+            {"columns": [{"name": "x", "type": "bool", "probability": 2}]},
+            {"columns": [{"name": "x", "type": "date", "start": "2020-13-01", "end": "2021-01-01"}]},
+            {"columns": [{"name": "x", "type": "datetime", "start": "2020-01-01T00:00:00+00:00", "end": "2020-02-01T00:00:00"}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "no_such_provider"}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "set_formatter", "args": ["job", "pwned"]}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "seed_instance", "args": [1]}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "add_provider", "args": ["x"]}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "random_int", "args": {"low": 1}}]},
+            {"columns": [{"name": "x", "type": "faker", "provider": "name", "null_rate": 1}]},
+            {"columns": [{"name": "x", "type": "int"}, {"name": "x", "type": "bool"}]},
+        ]
+        for schema in invalid:
+            with self.assertRaises(SchemaError, msg=schema):
+                validate_schema(schema)
+
+    def test_validation_leaves_the_shared_faker_alone(self):
+        with self.assertRaises(SchemaError):
+            validate_schema({"columns": [{"name": "x", "type": "faker", "provider": "set_formatter", "args": ["job", "pwned"]}]})
+        self.assertEqual(compile_field("set_formatter(job,pwned)").kind, "fallback")
+        self.assertIsInstance(get_fake().job(), str)
+
+    def test_error_names_column(self):
+        with self.assertRaisesRegex(SchemaError, "'age'"):
+            validate_schema({"columns": [{"name": "age", "type": "int", "min": 9, "max": 1}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import json
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import serializer
+
+
+SAMPLE = {
+    'day': date(2024, 5, 1),
+    'at': datetime(2024, 5, 1, 12, 30, 5, 123),
+    'price': Decimal('9.99'),
+    'name': 'Zoë',
+    'values': [1, 2.5, None, True],
+}
+
+
+class TestSerializer(unittest.TestCase):
+    """Test cases for the pluggable JSON serializer"""
+
+    def setUp(self):
+        self.addCleanup(serializer.set_backend, serializer.backend)
+
+    def backends(self):
+        return [name for name in serializer.BACKENDS if name == 'json' or serializer.HAS_ORJSON]
+
+    def test_backends_agree(self):
+        expected = {
+            'day': '2024-05-01',
+            'at': '2024-05-01T12:30:05.000123',
+            'price': '9.99',
+            'name': 'Zoë',
+            'values': [1, 2.5, None, True],
+        }
+        for name in self.backends():
+            serializer.set_backend(name)
+            self.assertEqual(json.loads(serializer.dumps(SAMPLE)), expected, name)
+            self.assertEqual(json.loads(serializer.dumpb(SAMPLE)), expected, name)
+            self.assertEqual(serializer.loads(serializer.dumpb(SAMPLE)), expected, name)
+
+    def test_custom_default_sees_datetimes(self):
+        for name in self.backends():
+            serializer.set_backend(name)
+            result = json.loads(serializer.dumps(SAMPLE, default=str))
+            self.assertEqual(result['at'], '2024-05-01 12:30:05.000123', name)
+
+    def test_indent_matches_stdlib(self):
+        data = [{'a': 1, 'b': [1, 2]}]
+        for name in self.backends():
+            serializer.set_backend(name)
+            self.assertEqual(serializer.dumps(data, indent=2), json.dumps(data, indent=2), name)
+
+    def test_no_default_rejects_unknown_types(self):
+        for name in self.backends():
+            serializer.set_backend(name)
+            with self.assertRaises(TypeError):
+                serializer.dumps({'price': Decimal('1')}, default=None)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            serializer.set_backend('simplejson')
+
+    def test_stringify_columns(self):
+        columns = [[date(2024, 1, 2)], ['x'], [3]]
+        result = serializer.stringify_columns(columns, ['date', 'str', 'int'])
+        self.assertEqual(result, [['2024-01-02'], ['x'], [3]])
+        self.assertIs(result[1], columns[1])
+        # Nulls stay null and datetimes match the ISO 8601 of json_default
+        moments = [datetime(2024, 1, 2, 3, 4, 5), None]
+        self.assertEqual(serializer.stringify_columns([moments], ['datetime']), [['2024-01-02T03:04:05', None]])
+        self.assertEqual(serializer.stringify_columns([moments], ['datetime'])[0][0], serializer.json_default(moments[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sqlite3
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator.sql_export import (
+    iter_sql_export, iter_sql_format, literal_renderer, copy_renderer, quote_identifier, validate_options
+)
+from lambda_function.generator.faker_generator import compile_fields
+
+
+FIELDS = ["random_int(min=1,max=9)", "status[a,b]", "date_of_birth", "pybool"]
+
+
+def export(column_chunks, plan, **kwargs):
+    return b"".join(iter_sql_export(column_chunks, plan, **kwargs)).decode()
+
+
+class TestSqlExport(unittest.TestCase):
+
+    def setUp(self):
+        self.plan = compile_fields(FIELDS)
+        self.chunks = [
+            [[1, 2], ["a", None], [date(2000, 1, 2), date(1990, 5, 6)], [True, False]],
+            [[3], ["it's"], [None], [True]],
+        ]
+
+    def test_literals_per_dialect(self):
+        self.assertEqual(literal_renderer("str", "postgres")("a\\'b"), "'a\\''b'")
+        self.assertEqual(literal_renderer("str", "mysql")("a\\'b"), "'a\\\\''b'")
+        self.assertEqual(literal_renderer("bool", "postgres")(True), "TRUE")
+        self.assertEqual(literal_renderer("bool", "sqlite")(False), "0")
+        self.assertEqual(literal_renderer("datetime", "mysql")(datetime(2020, 1, 2, 3, 4, 5)), "'2020-01-02 03:04:05'")
+        self.assertEqual(literal_renderer("float", "postgres")(float("nan")), "NULL")
+        self.assertEqual(literal_renderer("int", "sqlite")(None), "NULL")
+        self.assertEqual(literal_renderer("unknown", "postgres")(1.5), "1.5")
+        self.assertEqual(quote_identifier("or`der", "mysql"), "`or``der`")
+        self.assertEqual(quote_identifier('a"b', "postgres"), '"a""b"')
+
+    def test_insert_batches_across_chunks(self):
+        sql = export(self.chunks, self.plan, batch_size=2)
+        statements = [s for s in sql.split(";\n") if s]
+        self.assertEqual(len(statements), 2)
+        self.assertEqual(statements[0],
+                         'INSERT INTO "mock_data" ("random_int", "status", "date_of_birth", "pybool") VALUES\n'
+                         "  (1, 'a', '2000-01-02', TRUE),\n  (2, NULL, '1990-05-06', FALSE)")
+        self.assertTrue(statements[1].endswith("(3, 'it''s', NULL, TRUE)"))
+
+    def test_sqlite_script_loads(self):
+        sql = export(self.chunks, self.plan, table_name="t", dialect="sqlite", batch_size=2)
+        connection = sqlite3.connect(":memory:")
+        connection.execute('CREATE TABLE t (random_int INTEGER, status TEXT, date_of_birth TEXT, pybool INTEGER)')
+        connection.executescript(sql)
+        rows = connection.execute("SELECT * FROM t ORDER BY random_int").fetchall()
+        self.assertEqual(rows, [(1, "a", "2000-01-02", 1), (2, None, "1990-05-06", 0), (3, "it's", None, 1)])
+
+    def test_copy_text(self):
+        self.assertEqual(copy_renderer("str", "copy_text")("a\tb\\c\nd"), "a\\tb\\\\c\\nd")
+        sql = export(self.chunks, self.plan, mode="copy_text")
+        self.assertEqual(sql,
+                         'COPY "mock_data" ("random_int", "status", "date_of_birth", "pybool") FROM STDIN;\n'
+                         "1\ta\t2000-01-02\tt\n2\t\\N\t1990-05-06\tf\n3\tit's\t\\N\tt\n\\.\n")
+
+    def test_copy_csv_distinguishes_empty_and_null(self):
+        chunks = [[[1, 2], ["", None], [None, None], [None, None]]]
+        sql = export(chunks, self.plan, mode="copy_csv")
+        lines = sql.splitlines()
+        self.assertTrue(lines[0].endswith("FROM STDIN WITH (FORMAT csv);"))
+        self.assertEqual(lines[1:], ['1,"",,', "2,,,", "\\."])
+
+    def test_iter_sql_format(self):
+        extension, chunks = iter_sql_format(iter(self.chunks), self.plan, "copy", "t")
+        self.assertEqual(extension, "sql")
+        self.assertTrue(b"".join(chunks).startswith(b'COPY "t"'))
+
+    def test_validate_options(self):
+        self.assertEqual(validate_options(None, None), ("postgres", 1000))
+        self.assertEqual(validate_options("SQLite", "50"), ("sqlite", 50))
+        with self.assertRaises(ValueError):
+            validate_options("oracle", None)
+        with self.assertRaises(ValueError):
+            validate_options("postgres", 0)
+        with self.assertRaises(ValueError):
+            validate_options("mysql", None, "copy")
+
+
+if __name__ == '__main__':
+    unittest.main()
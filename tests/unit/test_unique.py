@@ -0,0 +1,101 @@
+import unittest
+import string
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import columnar, faker_generator, unique
+from lambda_function.generator.faker_generator import BLOCK_SIZE, compile_field, compile_fields, generate_range
+from lambda_function.generator.parallel import generate_parallel, iter_parallel_chunks
+from lambda_function.generator.schema import SchemaError, validate_schema
+
+
+class TestUnique(unittest.TestCase):
+    """Test cases for permutation-based unique columns"""
+
+    def test_permutation_is_a_bijection(self):
+        for size in (1, 2, 7, 1000, 4097):
+            permutation = unique.Permutation(size, 42)
+            self.assertEqual(sorted(permutation(range(size)).tolist()), list(range(size)))
+        # Different keys give different orders
+        self.assertNotEqual(unique.Permutation(1000, 1)(range(10)).tolist(), unique.Permutation(1000, 2)(range(10)).tolist())
+
+    def test_pure_python_permutation_matches_numpy(self):
+        expected = unique.Permutation(5000, 7)(range(5000)).tolist()
+        with patch.object(unique, "np", None):
+            self.assertEqual(unique.Permutation(5000, 7)(range(5000)), expected)
+
+    def test_rows_outside_the_id_space_raise(self):
+        with self.assertRaises(ValueError):
+            unique.Permutation(10, 1)([10])
+
+    def test_id_spaces(self):
+        space = unique.string_space("ID", string.digits, 3)
+        self.assertEqual(space.size, 1000)
+        self.assertEqual(space.values([0, 7, 999]), ["ID000", "ID007", "ID999"])
+        with patch.object(unique, "np", None):
+            self.assertEqual(space.values([42]), ["ID042"])
+        self.assertEqual(unique.integer_space(10, 20, 5).values([0, 1, 2]), [10, 15, 20])
+        self.assertEqual(unique.string_space("", string.ascii_letters, 20).size, unique.MAX_ID_SPACE)
+
+    def test_unique_across_workers_and_ranges(self):
+        fields = ["order_id[ORD,4,int,unique]", "random_int(min=1,max=5000,unique=true)", "status[a,b]"]
+        size = BLOCK_SIZE * 3 + 100
+        rows = generate_parallel(fields, size, seed=5, workers=2)
+        self.assertEqual(len({row["order_id"] for row in rows}), size)
+        self.assertEqual(len({row["random_int"] for row in rows}), size)
+        # A shard starting at a later block and a page in the middle see the same rows
+        tail = [row for chunk in iter_parallel_chunks(fields, size, 5, 1, start=BLOCK_SIZE * 2) for row in chunk]
+        self.assertEqual(tail, rows[BLOCK_SIZE * 2:])
+        self.assertEqual(generate_range(fields, 5, 1500, 1510), rows[1500:1510])
+
+    def test_unseeded_unique_columns_without_numpy(self):
+        plan = compile_fields(["code[C,3,int,unique]", "random_int(min=1,max=1000,unique=true)", "status[a,b]"])
+        with patch.object(columnar, "HAS_NUMPY", False), patch.object(faker_generator, "_numpy_rng", None), \
+                patch.object(unique, "np", None):
+            rows = plan.generate_rows(1000)
+            columns = plan.generate_columns(1000)
+            with self.assertRaises(ValueError):
+                plan.generate_rows(1001)
+        self.assertEqual(sorted(row["code"] for row in rows), [f"C{i:03d}" for i in range(1000)])
+        self.assertEqual(len(set(row["random_int"] for row in rows)), 1000)
+        self.assertEqual(sorted(columns["random_int"]), list(range(1, 1001)))
+
+    def test_whole_id_space_is_used(self):
+        rows = generate_parallel(["code[C,2,int,unique]"], 100, seed=1, workers=1)
+        self.assertEqual(sorted(row["code"] for row in rows), [f"C{i:02d}" for i in range(100)])
+
+    def test_validate_rejects_oversized_requests(self):
+        plan = compile_fields(["code[C,2,int,unique]", "name"])
+        self.assertEqual(unique.capacity(plan), 100)
+        unique.validate(plan, 100)
+        with self.assertRaises(ValueError):
+            unique.validate(plan, 101)
+        with self.assertRaises(ValueError):
+            compile_field("name(unique=true)")
+
+    def test_unseeded_columns_are_distinct(self):
+        plan = compile_fields(["id[X,3,int,unique]"])
+        rows = plan.generate_rows(1000)
+        self.assertEqual(len({row["id"] for row in rows}), 1000)
+        self.assertFalse(compile_field("random_int(min=1,max=3,unique=false)").id_space)
+
+    def test_schema_unique_columns(self):
+        fields = validate_schema({"columns": [
+            {"name": "id", "type": "prefix", "prefix": "U", "length": 3, "unique": True},
+            {"name": "n", "type": "int", "min": 1, "max": 2000, "unique": True},
+        ]})
+        rows = generate_range(fields, 3, 0, 1000)
+        self.assertEqual(len({row["id"] for row in rows}), 1000)
+        self.assertEqual(len({row["n"] for row in rows}), 1000)
+        with self.assertRaises(SchemaError):
+            validate_schema({"columns": [{"name": "n", "type": "int", "unique": True, "null_rate": 0.1}]})
+        with self.assertRaises(SchemaError):
+            validate_schema({"columns": [{"name": "n", "type": "int", "unique": "yes"}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
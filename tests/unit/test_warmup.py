@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lambda_function.generator import warmup, faker_generator
+
+
+class TestWarmup(unittest.TestCase):
+    """Test cases for the init phase and SnapStart hooks"""
+
+    def test_warm_fields(self):
+        with patch.dict(os.environ, {'WARM_FIELDS': ' name, email ,,'}):
+            self.assertEqual(warmup.warm_fields(), ['name', 'email'])
+        with patch.dict(os.environ, {'WARM_FIELDS': ''}):
+            self.assertEqual(warmup.warm_fields(), [])
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIn('name', warmup.warm_fields())
+
+    def test_warm_up_tolerates_bad_fields(self):
+        warmup.warm_up(['name', 'random_int(min=5,max=1)'])
+        self.assertIsNotNone(faker_generator.fake)
+
+    def test_after_restore_reseeds(self):
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        warmup.after_restore()
+        self.assertNotEqual(random.random(), expected)
+
+    def test_init_registers_snapstart_hooks(self):
+        registered = []
+        with patch.object(warmup, 'register_before_snapshot', registered.append), \
+                patch.object(warmup, 'register_after_restore', registered.append):
+            warmup.init([])
+        self.assertEqual(registered, [warmup.before_snapshot, warmup.after_restore])
+
+    def test_handler_import_defers_boto3_and_pyarrow(self):
+        code = "import sys, lambda_function; print('boto3' in sys.modules, 'pyarrow' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, '-c', code], check=True, capture_output=True, text=True,
+            cwd=Path(__file__).parent.parent.parent / 'lambda_function'
+        )
+        self.assertEqual(result.stdout.split(), ['False', 'False'])
+
+
+if __name__ == '__main__':
+    unittest.main()